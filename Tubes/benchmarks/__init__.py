@@ -0,0 +1 @@
+# KOSONG
\ No newline at end of file
@@ -0,0 +1,69 @@
+# benchmarks/bench_indexed_list.py
+#
+# Bandingkan DoubleLinkedList vs IndexedSkipList untuk akses per index.
+# Jalankan dari folder Tubes:
+#   python -m benchmarks.bench_indexed_list
+#   python -m benchmarks.bench_indexed_list --sizes 10000 100000 1000000 --ops 200
+
+import argparse
+import random
+import time
+
+from structures.double_linked_list import DoubleLinkedList
+from structures.indexed_skip_list import IndexedSkipList
+
+BACKINGS = {
+    "DoubleLinkedList": DoubleLinkedList,
+    "IndexedSkipList": IndexedSkipList,
+}
+
+
+def _time_ops(fn, args):
+    start = time.perf_counter()
+    for a in args:
+        fn(a)
+    elapsed = time.perf_counter() - start
+    return elapsed / len(args) * 1e6  # mikrodetik per operasi
+
+
+def bench_backing(cls, size, ops, seed=0):
+    rng = random.Random(seed)
+    lst = cls()
+
+    start = time.perf_counter()
+    for i in range(size):
+        lst.add_last(i)
+    build = time.perf_counter() - start
+
+    get_idx = [rng.randrange(size) for _ in range(ops)]
+    ins_idx = [rng.randrange(size) for _ in range(ops)]
+
+    result = {
+        "build_s": build,
+        "get_node_us": _time_ops(lst.get_node, get_idx),
+        "insert_at_us": _time_ops(lambda i: lst.insert_at(i, -1), ins_idx),
+        # index hapus dibatasi supaya selalu valid walau list menyusut
+        "delete_at_us": _time_ops(lambda i: lst.delete_at(i % lst.size), ins_idx),
+    }
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark backing list lagu")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=200, help="jumlah operasi per pengukuran")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    header = f"{'backing':<18}{'n':>10}{'build (s)':>12}{'get_node':>12}{'insert_at':>12}{'delete_at':>12}"
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        for name, cls in BACKINGS.items():
+            r = bench_backing(cls, size, args.ops, args.seed)
+            print(f"{name:<18}{size:>10}{r['build_s']:>12.2f}"
+                  f"{r['get_node_us']:>10.1f}us{r['insert_at_us']:>10.1f}us{r['delete_at_us']:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
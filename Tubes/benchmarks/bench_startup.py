@@ -0,0 +1,101 @@
+# benchmarks/bench_startup.py
+#
+# Ukur waktu startup aplikasi. Setiap pengukuran jalan di proses Python
+# baru supaya cache import tidak ikut terhitung.
+#   - import       : waktu import modul (login window, controller bersama)
+#   - controller   : waktu membangun controller katalog bersama
+#   - first paint  : dari awal proses sampai LoginWindow selesai dilukis
+#                    pertama kali (dilewati kalau PyQt6 tidak terpasang)
+# Jalankan dari folder Tubes:
+#   python -m benchmarks.bench_startup
+#   python -m benchmarks.bench_startup --repeat 10
+
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+
+_IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+_CONTROLLER_SNIPPET = """
+import time
+from controllers.shared import get_song_controller
+start = time.perf_counter()
+get_song_controller()
+print(time.perf_counter() - start)
+"""
+
+_FIRST_PAINT_SNIPPET = """
+import time
+start = time.perf_counter()
+import sys
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent, QTimer
+from gui.login_window import LoginWindow
+
+class _FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if obj is login and event.type() == QEvent.Type.Paint:
+            # tunggu paint ini selesai, baru catat waktunya
+            QTimer.singleShot(0, self.done)
+            obj.removeEventFilter(self)
+        return False
+
+    def done(self):
+        print(time.perf_counter() - start)
+        app.quit()
+
+app = QApplication(sys.argv)
+login = LoginWindow()
+watcher = _FirstPaint()
+login.installEventFilter(watcher)
+login.show()
+app.exec()
+"""
+
+
+def _run(snippet, repeat):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", snippet], cwd=root, env=env,
+                             capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def _row(name, samples):
+    ms = [s * 1000 for s in samples]
+    print(f"{name:<28}{statistics.median(ms):>10.1f}ms{min(ms):>10.1f}ms{max(ms):>10.1f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark waktu startup aplikasi")
+    parser.add_argument("--repeat", type=int, default=5, help="jumlah proses per pengukuran")
+    args = parser.parse_args(argv)
+
+    has_qt = importlib.util.find_spec("PyQt6") is not None
+
+    header = f"{'pengukuran':<28}{'median':>12}{'min':>12}{'max':>12}"
+    print(header)
+    print("-" * len(header))
+    _row("import controllers.shared", _run(_IMPORT_SNIPPET.format(module="controllers.shared"), args.repeat))
+    _row("get_song_controller()", _run(_CONTROLLER_SNIPPET, args.repeat))
+    if has_qt:
+        _row("import gui.login_window", _run(_IMPORT_SNIPPET.format(module="gui.login_window"), args.repeat))
+        _row("first paint LoginWindow", _run(_FIRST_PAINT_SNIPPET, args.repeat))
+    else:
+        print("PyQt6 tidak terpasang: pengukuran GUI dilewati")
+
+
+if __name__ == "__main__":
+    main()
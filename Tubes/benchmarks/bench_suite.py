@@ -0,0 +1,211 @@
+# benchmarks/bench_suite.py
+#
+# Benchmark struktur data + controller di berbagai ukuran katalog, dengan
+# katalog sintetis deterministik (benchmarks/catalog.py). Hasil disimpan ke
+# JSON (mikrodetik per operasi) dan bisa dibandingkan dengan baseline:
+# kalau ada operasi yang lebih lambat dari baseline melebihi --threshold,
+# program keluar dengan kode 1.
+#
+# Jalankan dari folder Tubes:
+#   python -m benchmarks.bench_suite --sizes 1000 10000 --save-baseline
+#   python -m benchmarks.bench_suite --sizes 1000 10000 --threshold 0.25
+#   python -m benchmarks.bench_suite --only dll. queue. --out hasil.json
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from benchmarks.catalog import synthetic_catalog
+from controllers.lagu_controller import SongController
+from structures.double_linked_list import DoubleLinkedList
+from structures.indexed_skip_list import IndexedSkipList
+from structures.queue import Queue
+from structures.song import Song
+from structures.stack import HistoryStack
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def _per_op(fn, args):
+    start = time.perf_counter()
+    for a in args:
+        fn(a)
+    return (time.perf_counter() - start) / len(args) * 1e6
+
+
+def _per_item(fn, count):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+# =====================================================
+# BENCHMARK PER STRUKTUR
+# =====================================================
+# setiap fungsi menerima (songs, ops, rng) dan mengembalikan dict nama -> us/op
+
+def bench_list(cls, prefix):
+    def run(songs, ops, rng):
+        lst = cls()
+        n = len(songs)
+        out = {f"{prefix}.add_last": _per_item(lambda: [lst.add_last(s) for s in songs], n)}
+        out[f"{prefix}.get_node"] = _per_op(lst.get_node, [rng.randrange(n) for _ in range(ops)])
+
+        lst.enable_shuffle(True, seed=rng.random())
+        lst.current = lst.head
+        out[f"{prefix}.shuffle_next"] = _per_op(lambda _: lst.next_song_smart(), range(ops))
+        lst.enable_shuffle(False)
+
+        victims = rng.sample(songs, min(ops, n // 2))
+        out[f"{prefix}.remove"] = _per_op(lst.remove, victims)
+        out[f"{prefix}.delete_at"] = _per_op(lambda i: lst.delete_at(i % lst.size), [rng.randrange(n) for _ in range(min(ops, n // 4))])
+        return out
+    run.__name__ = f"bench_{prefix}"
+    return run
+
+
+def bench_queue(songs, ops, rng):
+    q = Queue()
+    n = len(songs)
+    return {
+        "queue.enqueue": _per_item(lambda: [q.enqueue(s) for s in songs], n),
+        "queue.dequeue": _per_item(lambda: [q.dequeue() for _ in range(n)], n),
+    }
+
+
+def bench_history(songs, ops, rng):
+    h = HistoryStack(200)
+    return {"history.push": _per_item(lambda: [h.push(s) for s in songs], len(songs))}
+
+
+def bench_controller(songs, ops, rng):
+    c = SongController(list_cls=IndexedSkipList)
+    n = len(songs)
+    copies = [Song(s.judul, s.artis, s.genre, s.vibes) for s in songs]
+    out = {"controller.add_many": _per_item(lambda: c.add_many(copies, batch_size=10_000), n)}
+
+    # query = potongan judul lagu acak (selalu ada hasilnya)
+    queries = []
+    for s in rng.sample(copies, min(ops, n)):
+        word = max(s.judul.split(), key=len)
+        start = rng.randrange(max(1, len(word) - 4))
+        queries.append(word[start:start + 5])
+    out["controller.search"] = _per_op(c.search, queries)
+    out["controller.get_song_at"] = _per_op(c.get_song_at, [rng.randrange(n) for _ in range(ops)])
+    out["controller.delete_song"] = _per_op(lambda i: c.delete_song(i % c.count()), [rng.randrange(n) for _ in range(min(ops, n // 4))])
+    return out
+
+
+BENCHES = [
+    bench_list(DoubleLinkedList, "dll"),
+    bench_list(IndexedSkipList, "skiplist"),
+    bench_queue,
+    bench_history,
+    bench_controller,
+]
+
+# membangun semua index controller untuk 10^6 lagu butuh beberapa menit,
+# jadi default-nya dibatasi (ubah dengan --controller-max)
+CONTROLLER_MAX = 100_000
+
+
+def run_suite(sizes, ops, seed, repeat, only=None, controller_max=CONTROLLER_MAX):
+    """dict "nama@n" -> us/op (terbaik dari `repeat` kali jalan)."""
+    results = {}
+    for n in sizes:
+        songs = [Song(d["judul"], d["artis"], d["genre"], d["vibes"]) for d in synthetic_catalog(n, seed)]
+        for bench in BENCHES:
+            if bench is bench_controller and n > controller_max:
+                continue
+            for r in range(repeat):
+                rng = random.Random(seed + r)
+                for name, us in bench(songs, ops, rng).items():
+                    if only and not name.startswith(tuple(only)):
+                        continue
+                    key = f"{name}@{n}"
+                    results[key] = min(us, results.get(key, us))
+            print(f"  n={n:<9} {getattr(bench, '__name__', 'bench')} selesai", file=sys.stderr)
+    return results
+
+
+# =====================================================
+# BASELINE
+# =====================================================
+def compare(results, baseline, threshold):
+    """List (key, baseline_us, sekarang_us, rasio) yang lebih lambat dari batas."""
+    regressions = []
+    for key, us in sorted(results.items()):
+        base = baseline.get(key)
+        if base and us / base > 1 + threshold:
+            regressions.append((key, base, us, us / base))
+    return regressions
+
+
+def _write_json(path, results, args):
+    payload = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "sizes": args.sizes,
+            "ops": args.ops,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "controller_max": args.controller_max,
+        },
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite struktur data & controller")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=200, help="jumlah operasi acak per pengukuran")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="ambil waktu terbaik dari N kali jalan")
+    parser.add_argument("--only", nargs="+", help="hanya benchmark berawalan ini, mis. dll. queue.")
+    parser.add_argument("--controller-max", type=int, default=CONTROLLER_MAX,
+                        help="ukuran katalog terbesar untuk benchmark controller")
+    parser.add_argument("--out", default="bench_results.json", help="file JSON hasil")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="file JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="batas regresi relatif, 0.25 = 25%% lebih lambat")
+    parser.add_argument("--save-baseline", action="store_true", help="simpan hasil sebagai baseline baru")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.ops, args.seed, args.repeat, args.only, args.controller_max)
+    _write_json(args.out, results, args)
+
+    print(f"{'benchmark':<32}{'us/op':>12}")
+    print("-" * 44)
+    for key, us in sorted(results.items()):
+        print(f"{key:<32}{us:>12.2f}")
+
+    if args.save_baseline:
+        _write_json(args.baseline, results, args)
+        print(f"\nbaseline disimpan ke {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nbaseline {args.baseline} belum ada (pakai --save-baseline)")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.threshold)
+    if not regressions:
+        print(f"\ntidak ada regresi > {args.threshold:.0%} dibanding baseline")
+        return 0
+    print(f"\nREGRESI (> {args.threshold:.0%} lebih lambat dari baseline):")
+    for key, base, us, ratio in regressions:
+        print(f"  {key:<32}{base:>10.2f} -> {us:>10.2f} us  (x{ratio:.2f})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
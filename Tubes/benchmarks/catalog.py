@@ -0,0 +1,35 @@
+# benchmarks/catalog.py
+#
+# Generator katalog sintetis yang deterministik: seed dan n yang sama selalu
+# menghasilkan lagu yang sama persis, jadi hasil benchmark bisa dibandingkan
+# antar commit / mesin.
+
+import random
+
+GENRES = ["Pop", "Rock", "Indie", "Jazz", "R&B", "Hip Hop", "EDM", "Dangdut", "Klasik", "Folk"]
+VIBES = ["Happy", "Sad", "Chill", "Energetic", "Romantic", "Dark"]
+
+_SYLLABLES = ["la", "ra", "ma", "ka", "sa", "ti", "lu", "ne", "ro", "bi",
+              "an", "en", "di", "yo", "ha", "ze", "ku", "mi", "po", "ve"]
+
+
+def _word(rng):
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+
+
+def synthetic_catalog(n, seed=0, n_artists=None):
+    """
+    Generator n dict lagu (judul, artis, genre, vibes). Jumlah artis default
+    ~ n/20 (minimal 10) supaya satu artis punya beberapa lagu seperti katalog asli.
+    """
+    rng = random.Random(seed)
+    n_artists = n_artists or max(10, n // 20)
+    artists = [f"{_word(rng)} {_word(rng)}" for _ in range(n_artists)]
+    for i in range(n):
+        title = " ".join(_word(rng) for _ in range(rng.randint(1, 4)))
+        yield {
+            "judul": f"{title} {i}",
+            "artis": rng.choice(artists),
+            "genre": rng.choice(GENRES),
+            "vibes": rng.choice(VIBES),
+        }
@@ -0,0 +1,30 @@
+# controllers/cancel.py
+#
+# Pembatalan kooperatif untuk pencarian yang jalan di thread lain: pemanggil
+# memberi CancelToken, lalu loop scan di SongController / SearchSession
+# mengecek token itu secara berkala dan berhenti dengan SearchCancelled.
+
+
+class SearchCancelled(Exception):
+    """Pencarian dihentikan karena token-nya dibatalkan (mis. ada query yang lebih baru)."""
+
+
+class CancelToken:
+    __slots__ = ("_cancelled",)
+
+    # cek token setiap sekian item supaya biaya pengecekan tidak terasa
+    CHECK_EVERY = 2048
+
+    def __init__(self):
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def check(self):
+        if self._cancelled:
+            raise SearchCancelled()
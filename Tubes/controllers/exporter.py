@@ -0,0 +1,70 @@
+# controllers/exporter.py
+#
+# Export katalog / playlist / antrian ke JSONL atau CSV secara streaming.
+# Lagu diambil satu per satu dari generator (node linked list, Queue, atau
+# SongController.iter_songs) dan ditulis per chunk, jadi memori yang
+# dipakai tetap walau katalognya jutaan lagu. Hasilnya bisa dibaca lagi
+# dengan SongController.import_stream.
+
+import csv
+import io
+import json
+from itertools import islice
+
+from controllers.importer import detect_format
+
+FIELDS = ("id", "judul", "artis", "genre", "vibes")
+CHUNK_SIZE = 1000
+
+
+def _jsonl_chunk(songs):
+    return "".join(json.dumps(s.to_dict(), ensure_ascii=False) + "\n" for s in songs)
+
+
+def _csv_chunk(songs):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerows([getattr(s, f) for f in FIELDS] for s in songs)
+    return buf.getvalue()
+
+
+def export_songs(songs, path, format=None, chunk_size=CHUNK_SIZE):
+    """
+    Tulis iterable Song ke path (format "jsonl" atau "csv", default
+    ditebak dari ekstensi). Mengembalikan jumlah lagu yang ditulis.
+    """
+    format = format or detect_format(path)
+    if format == "jsonl":
+        encode = _jsonl_chunk
+    elif format == "csv":
+        encode = _csv_chunk
+    else:
+        raise ValueError(f"format {format!r} tidak didukung, pilih csv atau jsonl")
+
+    it = iter(songs)
+    total = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if format == "csv":
+            csv.writer(f).writerow(FIELDS)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                break
+            f.write(encode(chunk))
+            total += len(chunk)
+    return total
+
+
+def export_catalog(controller, path, format=None, chunk_size=CHUNK_SIZE):
+    """Seluruh katalog SongController (termasuk yang belum dimuat dari store)."""
+    return export_songs(controller.iter_songs(), path, format, chunk_size)
+
+
+def export_playlist(playlist, path, format=None, chunk_size=CHUNK_SIZE):
+    """Isi DoubleLinkedList / IndexedSkipList (mis. playlist user), urut dari head."""
+    return export_songs(iter(playlist), path, format, chunk_size)
+
+
+def export_queue(queue, path, format=None, chunk_size=CHUNK_SIZE):
+    """Isi Queue dari depan ke belakang, tanpa mengubah antrian."""
+    return export_songs(iter(queue), path, format, chunk_size)
@@ -0,0 +1,48 @@
+# controllers/importer.py
+#
+# Pembaca file katalog untuk SongController.import_stream. Semua pembaca
+# berupa generator dict (judul, artis, genre, vibes, id opsional), jadi
+# file sebesar apa pun dibaca baris per baris tanpa dimuat ke memori.
+
+import csv
+import json
+import os
+
+FORMATS = ("csv", "jsonl")
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"format file {path} tidak dikenali (pakai .csv atau .jsonl)")
+
+
+def iter_csv(path):
+    """CSV dengan baris header; kolom minimal judul, artis, genre, vibes."""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def iter_jsonl(path):
+    """Satu objek JSON per baris; baris kosong dilewati."""
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{lineno}: JSON tidak valid ({e.msg})") from None
+
+
+def iter_records(path, format=None):
+    format = format or detect_format(path)
+    if format == "csv":
+        return iter_csv(path)
+    if format == "jsonl":
+        return iter_jsonl(path)
+    raise ValueError(f"format {format!r} tidak didukung, pilih salah satu dari {FORMATS}")
@@ -1,77 +1,675 @@
 # controllers/lagu_controller.py
 
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+
+from controllers.cancel import CancelToken
+from controllers.importer import iter_records
+from controllers.rwlock import RWLock
+from controllers.storage import OverlayStore
 from structures.double_linked_list import DoubleLinkedList
+from structures.facet_index import FacetIndex
+from structures.fuzzy_index import FuzzyIndex
+from structures.inverted_index import InvertedIndex
+from structures.trie import PrefixTrie
 from structures.song import Song
 
+# field dict yang wajib terisi saat membuat Song (genre/vibes boleh kosong)
+REQUIRED_FIELDS = ("judul", "artis")
+
 class SongController:
     """
     Controller sederhana untuk mengelola koleksi Song menggunakan DoubleLinkedList.
     API yang disediakan mudah dipakai GUI:
       - get_all_songs() -> list[Song]
+      - iter_songs() -> generator Song (tanpa membuat list katalog)
       - get_song_at(index) -> Song or None
-      - search(keyword) -> list[Song]
-      - add_song(judul, artis, genre, vibes) -> Song
+      - search(keyword, cancel) -> list[Song]      (substring, lewat index trigram)
+      - search_scan(keyword, cancel) -> list[Song] (substring, scan linear)
+      - search_tokens(query) -> list[Song]     (kata utuh)
+      - fuzzy_search(keyword, cancel) -> list[Song]  (toleran typo, untuk fallback)
+      - autocomplete(prefix, k) -> list[str]   (judul/artis berawalan prefix)
+      - filter(genre, vibes, artis) -> list[Song] (nilai persis, lewat bitmap)
+      - facet_values(field) -> dict[str, int]
+      - songs_by_vibe(vibe) / songs_by_genre(genre) -> list[Song]
+      - vibes() / genres() -> list[str]
+      - get_song_by_id(song_id) -> Song or None
+      - add_song(song) -> Song
+      - add_many(items, batch_size, progress, on_skip) -> int
+      - import_stream(path, format, batch_size, progress, on_skip) -> int   (CSV/JSONL)
       - update_song(index, judul, artis, genre, vibes) -> bool
       - delete_song(index) -> bool
+      - add_listener(callback) / remove_listener(callback)
+      - count() -> int, is_fully_loaded(), batch(), load_more(), load_all()
+
+    list_cls menentukan backing list. Default DoubleLinkedList; pakai
+    IndexedSkipList supaya akses per index (get_song_at, update_song,
+    delete_song) jadi O(log n) untuk katalog besar.
+
+    Setiap lagu yang masuk katalog mendapat id integer unik (Song.id).
+    `version` naik setiap ada perubahan katalog (tambah/edit/hapus), jadi
+    cache hasil pencarian bisa tahu kapan harus dibuang.
+
+    Listener dipanggil callback(event, index, song) setiap kali katalog
+    berubah, dengan event "insert", "update" atau "remove" dan index baris
+    yang terkena, supaya view cukup memperbarui satu baris itu saja.
+    add_many mengirim satu event "insert_range" per batch: index = baris
+    pertama batch, song = list lagu batch itu (baris index .. index+len-1).
+
+    store (opsional: SQLiteSongStore, atau MmapCatalogStore yang read-only)
+    menjadi sumber katalog.
+    Katalog TIDAK dimuat penuh saat start: lagu masuk ke self.songs per
+    halaman (page_size) saat diakses per index. Selama belum termuat penuh,
+    get_all_songs/search/search_scan/autocomplete dijalankan langsung di
+    store, sedangkan search_tokens dan fuzzy_search hanya mencakup lagu yang
+    sudah dimuat (is_fully_loaded() False; panggil load_all() kalau perlu
+    semuanya). initial_data hanya dipakai untuk mengisi store yang masih
+    kosong. Store read-only dibungkus OverlayStore: perubahan disimpan di
+    memori per id di atas baris store, tanpa memuat katalog penuh.
+
+    Aman dipakai dari beberapa thread: method baca (get_*, search*,
+    filter, count, ...) memegang read lock sehingga bisa jalan bersamaan,
+    sedangkan method tulis (add/update/delete, batch(), load_more) memegang
+    write lock. Di dalam `with controller.batch():` seluruh perubahan
+    terlihat oleh pembaca sekaligus. Event listener diantrekan selama
+    write lock dipegang lalu dikirim SETELAH write lock terluar dilepas,
+    urut sesuai perubahannya, dari thread yang melakukan perubahan (view
+    Qt harus meneruskannya sendiri ke thread GUI, lihat gui/song_table.py).
+    iter_songs tidak memegang lock di antara yield.
     """
 
-    def __init__(self, initial_data=None):
-        # gunakan DoubleLinkedList untuk menyimpan Song objects
-        self.songs = DoubleLinkedList()
+    def __init__(self, initial_data=None, list_cls=DoubleLinkedList, store=None, page_size=500):
+        # gunakan DoubleLinkedList (atau subclass-nya) untuk menyimpan Song objects
+        self._lock = RWLock()
+        # event (callback, args) yang menunggu dikirim setelah write lock lepas
+        self._outbox = deque()
+        self._dispatch_lock = threading.RLock()
+        # pembaca boleh jalan bersamaan, jadi cache _detached punya mutex sendiri
+        self._detached_lock = threading.Lock()
+        self.songs = list_cls()
+        if store is not None and store.readonly:
+            store = OverlayStore(store)
+        self.store = store
+        self.page_size = page_size
+        self._by_id = {}     # song id -> node
+        self._next_id = 1
+        self.version = 0
+        self._listeners = []
+        self._search_index = InvertedIndex()
+        self._completion = PrefixTrie()
+        self._fuzzy_index = FuzzyIndex()
+        self._facets = FacetIndex()
+
+        # status lazy loading dari store
+        self._count = store.count() if store else 0
+        self._loaded_upto = 0            # id terbesar yang sudah dimuat
+        self._fully_loaded = self._count == 0
+        # Song dari store yang belum masuk linked list (dipakai ulang saat dimuat)
+        self._detached = weakref.WeakValueDictionary()
+        if store and self._count:
+            initial_data = None
+
         if initial_data:
             # initial_data bisa berupa list of dict atau list of Song
             for item in initial_data:
-                if isinstance(item, Song):
-                    self.songs.add_last(item)
-                elif isinstance(item, dict):
-                    s = Song(item.get("judul"), item.get("artis"), item.get("genre"), item.get("vibes"))
-                    self.songs.add_last(s)
+                self.add_song(self._song_from_item(item))
 
     # ---------- helper ----------
-    def _to_list(self):
-        out = []
-        node = self.songs.head
-        while node:
-            out.append(node.data)
-            node = node.next
-        return out
+    @staticmethod
+    def _song_from_item(item):
+        """
+        Song dipakai apa adanya; dict (mis. baris CSV/JSONL) dibuat jadi
+        Song. judul dan artis wajib terisi, genre/vibes yang tidak ada jadi
+        "". Data yang tidak valid -> ValueError berisi alasannya.
+        """
+        if isinstance(item, Song):
+            return item
+        if not isinstance(item, dict):
+            raise ValueError(f"bukan Song atau dict: {type(item).__name__}")
+
+        values = {}
+        for field in ("judul", "artis", "genre", "vibes"):
+            value = item.get(field)
+            value = "" if value is None else str(value).strip()
+            if not value and field in REQUIRED_FIELDS:
+                raise ValueError(f"field '{field}' kosong")
+            values[field] = value
+
+        song_id = item.get("id")
+        if song_id in (None, ""):
+            song_id = None
+        else:
+            try:
+                song_id = int(song_id)
+            except (TypeError, ValueError):
+                raise ValueError(f"id bukan bilangan bulat: {song_id!r}") from None
+            if song_id < 1:
+                raise ValueError(f"id harus positif: {song_id}")
+        return Song(values["judul"], values["artis"], values["genre"], values["vibes"], song_id=song_id)
+
+    def _assign_id(self, song):
+        if song.id is None:
+            song.assign_id(self._next_id)
+        elif song.id in self._by_id:
+            raise ValueError(f"Lagu dengan id {song.id} sudah ada di katalog")
+        self._next_id = max(self._next_id, song.id + 1)
+
+    def _song_from_row(self, row):
+        song_id = row[0]
+        node = self._by_id.get(song_id)
+        if node is not None:
+            return node.data
+        # dipanggil di bawah read lock oleh banyak pembaca sekaligus; mutex
+        # menjamin cek-lalu-isi atomik, jadi semua dapat objek Song yang sama
+        with self._detached_lock:
+            song = self._detached.get(song_id)
+            if song is None:
+                song = Song(row[1], row[2], row[3], row[4], song_id=song_id)
+                self._detached[song_id] = song
+            return song
+
+    def _attach(self, song):
+        # masukkan ke linked list + semua index in-memory
+        self._next_id = max(self._next_id, song.id + 1)
+        self._by_id[song.id] = self.songs.add_last(song)
+        self._index_song(song)
+        self._detached.pop(song.id, None)
+
+    def load_more(self):
+        """Muat satu halaman lagu berikutnya dari store. False kalau sudah habis."""
+        with self._writing():
+            if self._fully_loaded:
+                return False
+            rows = self.store.fetch_page(self._loaded_upto, self.page_size)
+            for row in rows:
+                self._attach(self._song_from_row(row))
+            if rows:
+                self._loaded_upto = rows[-1][0]
+            if len(rows) < self.page_size:
+                self._fully_loaded = True
+            return bool(rows)
+
+    # load_all / _ensure_loaded mengambil write lock, jadi harus dipanggil
+    # SEBELUM masuk blok read lock (upgrade read -> write tidak diizinkan)
+    def load_all(self):
+        if self._fully_loaded:
+            return
+        with self._writing():
+            while self.load_more():
+                pass
+
+    def _ensure_loaded(self, index):
+        if self._fully_loaded or self.songs.size > index:
+            return
+        with self._writing():
+            while not self._fully_loaded and self.songs.size <= index:
+                if not self.load_more():
+                    break
+
+    def _size(self):
+        # seperti count() tapi tanpa lock (pemanggil sudah memegangnya)
+        return self.songs.size if self._fully_loaded else self._count
+
+    @contextmanager
+    def _writing(self):
+        """
+        Write lock + pengiriman event: event dari _notify baru dikirim ke
+        listener setelah write lock terluar thread ini dilepas.
+        """
+        try:
+            with self._lock.write():
+                yield
+        finally:
+            if not self._lock.holds_write():
+                self._dispatch()
+
+    def _notify(self, event, index, song):
+        # dipanggil di bawah write lock: cukup antrekan, urutannya urutan commit
+        self.version += 1
+        for callback in self._listeners:
+            self._outbox.append((callback, (event, index, song)))
+
+    def _dispatch(self):
+        # RLock: listener yang mengubah katalog lagi ikut menguras antrean
+        with self._dispatch_lock:
+            while self._outbox:
+                callback, args = self._outbox.popleft()
+                callback(*args)
+
+    def _nodes_in_order(self, ids):
+        # urut posisi di list (id tidak selalu naik: id dari store/import
+        # boleh acak), lewat label urutan node O(1) per perbandingan
+        return self.songs.sort_nodes([self._by_id[i] for i in ids])
+
+    def _songs_from_ids(self, ids):
+        return [node.data for node in self._nodes_in_order(ids)]
+
+    def _index_song(self, song):
+        self._search_index.add(song)
+        self._completion.insert(song.judul)
+        self._completion.insert(song.artis)
+        self._fuzzy_index.add(song)
+        self._facets.add(song)
+
+    def _index_many(self, songs):
+        self._search_index.add_many(songs)
+        self._completion.insert_many(t for s in songs for t in (s.judul, s.artis))
+        self._fuzzy_index.add_many(songs)
+        self._facets.add_many(songs)
+
+    def _unindex_song(self, song):
+        self._search_index.remove(song)
+        self._completion.remove(song.judul)
+        self._completion.remove(song.artis)
+        self._fuzzy_index.remove(song)
+        self._facets.remove(song)
+
+    @staticmethod
+    def matches(song, kw):
+        """Aturan cocok search(): kw (lower-case) substring salah satu field."""
+        return (kw in song.judul.lower() or
+                kw in song.artis.lower() or
+                kw in song.genre.lower() or
+                kw in song.vibes.lower())
 
     # ---------- public API ----------
+    def count(self):
+        with self._lock.read():
+            return self._size()
+
+    def is_fully_loaded(self):
+        """True kalau seluruh katalog sudah ada di memori (semua index lengkap)."""
+        with self._lock.read():
+            return self._fully_loaded
+
+    @contextmanager
+    def batch(self):
+        """
+        Kumpulkan beberapa perubahan jadi satu: write lock dipegang sampai
+        blok selesai (pembaca melihat semua perubahan sekaligus) dan semua
+        tulis ke store masuk satu transaksi.
+        """
+        with self._writing():
+            if self.store:
+                with self.store.batch():
+                    yield self
+            else:
+                yield self
+
+    def iter_songs(self):
+        """
+        Semua lagu katalog sesuai urutan, satu per satu (memori sebatas
+        page_size). Tiap halaman diambil di bawah read lock, tapi lock
+        dilepas sebelum yield: perubahan di antara halaman boleh ikut
+        terlihat atau tidak. Pakai get_all_songs() untuk snapshot utuh.
+        """
+        cursor = None       # node terakhir yang sudah diambil dari list
+        pos = 0
+        after_id = None     # diisi begitu pindah ke sisa katalog di store
+        while True:
+            with self._lock.read():
+                if after_id is None:
+                    if cursor is None:
+                        node = self.songs.head
+                    elif self.songs.contains_node(cursor):
+                        node = cursor.next
+                    else:
+                        # cursor dihapus di sela halaman: lanjut dari posisinya
+                        node = self.songs.get_node(pos)
+                    page = []
+                    while node is not None and len(page) < self.page_size:
+                        page.append(node.data)
+                        cursor = node
+                        node = node.next
+                    done = node is None and self._fully_loaded
+                    if node is None and not self._fully_loaded:
+                        # sisa katalog dibaca langsung dari store, tanpa masuk linked list
+                        after_id = self._loaded_upto
+                else:
+                    rows = self.store.fetch_page(after_id, self.page_size)
+                    page = [self._song_from_row(r) for r in rows]
+                    if rows:
+                        after_id = rows[-1][0]
+                    done = len(rows) < self.page_size
+            pos += len(page)
+            yield from page
+            if done:
+                return
+
     def get_all_songs(self):
-        return self._to_list()
+        """Snapshot seluruh katalog (satu read lock)."""
+        with self._lock.read():
+            songs = list(self.songs)
+            if not self._fully_loaded:
+                songs.extend(self._song_from_row(r) for r in self.store.iter_rows(self._loaded_upto))
+            return songs
 
     def get_song_at(self, index):
-        node = self.songs.get_node(index)
-        return node.data if node else None
+        self._ensure_loaded(index)
+        with self._lock.read():
+            node = self.songs.get_node(index)
+            return node.data if node else None
+
+    def get_song_by_id(self, song_id):
+        with self._lock.read():
+            node = self._by_id.get(song_id)
+            if node is not None:
+                return node.data
+            if self.store:
+                row = self.store.get(song_id)
+                return self._song_from_row(row) if row else None
+            return None
+
+    # cancel (opsional): CancelToken; kalau dibatalkan di tengah jalan,
+    # search/search_scan berhenti dengan SearchCancelled
+    def search(self, keyword, cancel=None):
+        if not keyword:
+            return self.get_all_songs()
+        kw = keyword.lower().strip()
+        with self._lock.read():
+            if not self._fully_loaded:
+                return self._search_store(kw, cancel)
+            candidates = self._search_index.substring_candidates(kw)
+            if candidates is None:
+                # query < 3 huruf: hasilnya memang hampir seluruh katalog
+                return self.search_scan(keyword, cancel)
+            if cancel is None:
+                return [s for s in self._songs_from_ids(candidates) if self.matches(s, kw)]
+            found = []
+            for i, node in enumerate(self._nodes_in_order(candidates)):
+                if not i % CancelToken.CHECK_EVERY:
+                    cancel.check()
+                s = node.data
+                if self.matches(s, kw):
+                    found.append(s)
+            return found
 
-    def search(self, keyword):
+    def search_scan(self, keyword, cancel=None):
         if not keyword:
             return self.get_all_songs()
         kw = keyword.lower().strip()
-        found = []
-        node = self.songs.head
-        while node:
-            s = node.data
-            if (kw in s.judul.lower() or
-                kw in s.artis.lower() or
-                kw in s.genre.lower() or
-                kw in s.vibes.lower()):
-                found.append(s)
-            node = node.next
-        return found
+        with self._lock.read():
+            if not self._fully_loaded:
+                return self._search_store(kw, cancel)
+            found = []
+            node = self.songs.head
+            i = 0
+            while node:
+                if cancel is not None and not i % CancelToken.CHECK_EVERY:
+                    cancel.check()
+                s = node.data
+                if self.matches(s, kw):
+                    found.append(s)
+                node = node.next
+                i += 1
+            return found
+
+    def _search_store(self, kw, cancel):
+        # query ke store tidak bisa disela; cek token sebelum & sesudahnya
+        if cancel is not None:
+            cancel.check()
+        rows = self.store.search(kw)
+        if cancel is not None:
+            cancel.check()
+        return [self._song_from_row(r) for r in rows]
+
+    def search_tokens(self, query):
+        if not query or not query.strip():
+            return self.get_all_songs()
+        with self._lock.read():
+            return self._songs_from_ids(self._search_index.token_matches(query))
+
+    def fuzzy_search(self, keyword, max_distance=None, limit=20, cancel=None):
+        """
+        Lagu yang judul/artisnya mirip keyword (edit distance <= max_distance),
+        terurut dari yang paling mirip. Dipakai GUI kalau search() kosong.
+        cancel seperti di search().
+        """
+        if not keyword or not keyword.strip():
+            return []
+        with self._lock.read():
+            ranked = self._fuzzy_index.search(keyword, max_distance, limit, cancel)
+            return [self._by_id[song_id].data for _, song_id in ranked]
+
+    def autocomplete(self, prefix, k=8):
+        if not prefix or not prefix.strip():
+            return []
+        with self._lock.read():
+            if not self._fully_loaded:
+                return [text for text, _ in self.store.complete(prefix, k)]
+            return self._completion.complete(prefix, k)
+
+    def filter(self, genre=None, vibes=None, artis=None):
+        """
+        Lagu yang field-nya sama persis (tanpa beda huruf) dengan nilai
+        yang diminta. Tiap argumen boleh string atau list string: dalam satu
+        field digabung OR, antar field AND. Contoh lagu sad pop:
+        filter(genre="pop", vibes="sad"). Tanpa argumen -> semua lagu.
+        Selama katalog belum termuat penuh, query dijalankan di store.
+        """
+        with self._lock.read():
+            if not self._fully_loaded:
+                return [self._song_from_row(r) for r in self.store.filter(genre, vibes, artis)]
+            ids = self._facets.query(genre=genre, vibes=vibes, artis=artis)
+            if ids is None:
+                return self.get_all_songs()
+            return self._songs_from_ids(ids)
+
+    def facet_values(self, field):
+        """Nilai genre/vibes/artis yang ada beserta jumlah lagunya."""
+        with self._lock.read():
+            if not self._fully_loaded:
+                return self.store.facet_values(field)
+            return self._facets.values(field)
+
+    def _songs_in_group(self, field, value):
+        with self._lock.read():
+            if not self._fully_loaded:
+                return [self._song_from_row(r) for r in self.store.filter(**{field: value})]
+            return list(self.songs.iter_group(field, value))
+
+    def songs_by_vibe(self, vibe):
+        """Lagu dengan vibe tsb (tanpa beda huruf), lewat rantai vibe di list: O(k)."""
+        return self._songs_in_group("vibes", vibe)
+
+    def songs_by_genre(self, genre):
+        return self._songs_in_group("genre", genre)
+
+    def _group_names(self, field):
+        with self._lock.read():
+            if not self._fully_loaded:
+                return list(self.store.facet_values(field))
+            return self.songs.group_values(field)
+
+    def vibes(self):
+        return self._group_names("vibes")
+
+    def genres(self):
+        return self._group_names("genre")
 
     def add_song(self, song):  # <--- terima objek Song
-        self.songs.add_last(song)
+        with self._writing():
+            if self.store:
+                if song.id is not None and song.id in self._by_id:
+                    raise ValueError(f"Lagu dengan id {song.id} sudah ada di katalog")
+                song.assign_id(self.store.insert(song))
+                self._count += 1
+                if self._fully_loaded:
+                    self._attach(song)
+                    self._loaded_upto = song.id
+                else:
+                    # nanti ikut termuat di halaman terakhir
+                    self._detached[song.id] = song
+                self._notify("insert", self._count - 1, song)
+                return song
+
+            self._assign_id(song)
+            self._attach(song)
+            self._notify("insert", self.songs.size - 1, song)
+            return song
+
+    def add_many(self, items, batch_size=1000, progress=None, on_skip=None):
+        """
+        Tambah banyak lagu (Song atau dict) dari iterable/generator apa pun,
+        diproses per batch_size supaya memori tetap terbatas. Per batch:
+        satu transaksi store, satu splice ke linked list, satu update index
+        dan satu notifikasi "insert_range". Setiap batch diterapkan di bawah
+        write lock (atomik bagi pembaca); di antara batch pembaca boleh jalan.
+        progress(done, lagu_per_detik) dipanggil setelah tiap batch.
+
+        Data yang tidak valid (lihat _song_from_item) atau yang id-nya sudah
+        dipakai (di katalog, atau dobel dalam items) dilewati dan dilaporkan
+        ke on_skip(nomor, item, alasan), nomor = urutan data di items mulai
+        1. Tanpa on_skip, data tidak valid -> ValueError dan batch-nya tidak
+        ditambahkan (batch sebelumnya sudah masuk). Mengembalikan jumlah
+        lagu yang ditambahkan.
+        """
+        it = iter(items)
+        done = 0
+        seen = 0
+        start = time.perf_counter()
+        while True:
+            chunk = list(islice(it, batch_size))
+            if not chunk:
+                break
+            entries = []     # (nomor, item, song)
+            skipped = []     # (nomor, item, alasan)
+            for item in chunk:
+                seen += 1
+                try:
+                    entries.append((seen, item, self._song_from_item(item)))
+                except ValueError as e:
+                    if on_skip is None:
+                        raise ValueError(f"data ke-{seen}: {e}") from None
+                    skipped.append((seen, item, str(e)))
+            batch = []
+            if entries:
+                with self._writing():
+                    batch, rejected = self._claim_ids(entries)
+                    if rejected and on_skip is None:
+                        n, _, reason = rejected[0]
+                        raise ValueError(f"data ke-{n}: {reason}")
+                    if batch:
+                        first_row = self._size()
+                        self._add_batch(batch)
+                        self._notify("insert_range", first_row, batch)
+                skipped.extend(rejected)
+            # on_skip dipanggil di luar lock (seperti listener), urut nomor data
+            for n, item, reason in sorted(skipped, key=lambda s: s[0]):
+                on_skip(n, item, reason)
+            if not batch:
+                continue
+            done += len(batch)
+            if progress:
+                elapsed = time.perf_counter() - start
+                progress(done, done / elapsed if elapsed > 0 else 0.0)
+        return done
+
+    def _id_taken(self, song_id):
+        if song_id in self._by_id:
+            return True
+        # lagu store yang belum dimuat tidak ada di _by_id
+        return bool(self.store) and not self._fully_loaded and self.store.get(song_id) is not None
+
+    def _claim_ids(self, entries):
+        """
+        Pisahkan entri (nomor, item, song) yang id-nya bentrok: sudah ada di
+        katalog atau muncul dua kali dalam batch. Mengembalikan
+        (lagu, ditolak) dengan ditolak = [(nomor, item, alasan)].
+        """
+        songs, rejected, ids, objs = [], [], set(), set()
+        for n, item, song in entries:
+            if id(song) in objs:
+                rejected.append((n, item, "objek Song yang sama muncul dua kali"))
+                continue
+            objs.add(id(song))
+            if song.id is None:
+                songs.append(song)
+            elif song.id in ids:
+                rejected.append((n, item, f"id {song.id} muncul dua kali"))
+            elif self._id_taken(song.id):
+                rejected.append((n, item, f"lagu dengan id {song.id} sudah ada di katalog"))
+            else:
+                ids.add(song.id)
+                songs.append(song)
+        return songs, rejected
+
+    def _add_batch(self, batch):
+        if self.store:
+            with self.store.batch():
+                # id eksplisit dulu, supaya id otomatis store tidak mengambilnya
+                for song in sorted(batch, key=lambda s: s.id is None):
+                    song.assign_id(self.store.insert(song))
+            self._count += len(batch)
+            if not self._fully_loaded:
+                # nanti ikut termuat lewat load_more
+                for song in batch:
+                    self._detached[song.id] = song
+                return
+            self._loaded_upto = max(self._loaded_upto, max(s.id for s in batch))
+        else:
+            # id otomatis dilewatkan dari id eksplisit di batch yang sama
+            explicit = {s.id for s in batch if s.id is not None}
+            for song in batch:
+                if song.id is None:
+                    while self._next_id in explicit:
+                        self._next_id += 1
+                    song.assign_id(self._next_id)
+                self._next_id = max(self._next_id, song.id + 1)
+
+        for song, node in zip(batch, self.songs.extend(batch)):
+            self._by_id[song.id] = node
+        self._next_id = max(self._next_id, max(s.id for s in batch) + 1)
+        self._index_many(batch)
+
+    def import_stream(self, path, format=None, batch_size=1000, progress=None, on_skip=None):
+        """
+        Import katalog dari file CSV (dengan header) atau JSONL. Format
+        ditebak dari ekstensi kalau tidak diberikan. File dibaca baris per
+        baris; lihat add_many untuk batch_size, progress dan on_skip.
+        """
+        return self.add_many(iter_records(path, format), batch_size, progress, on_skip)
 
     def update_song(self, index, judul, artis, genre, vibes):
-        node = self.songs.get_node(index)
-        if not node:
-            return False
-        node.data.judul = judul
-        node.data.artis = artis
-        node.data.genre = genre
-        node.data.vibes = vibes
-        return True
+        with self._writing():
+            self._ensure_loaded(index)
+            node = self.songs.get_node(index)
+            if not node:
+                return False
+            self._unindex_song(node.data)
+            node.data.set_fields(judul, artis, genre, vibes)
+            self.songs.reindex(node.data)
+            self._index_song(node.data)
+            if self.store:
+                self.store.update(node.data)
+            self._notify("update", index, node.data)
+            return True
 
     def delete_song(self, index):
-        return self.songs.delete_at(index)
\ No newline at end of file
+        with self._writing():
+            self._ensure_loaded(index)
+            node = self.songs.get_node(index)
+            if not node:
+                return False
+            self._by_id.pop(node.data.id, None)
+            self._unindex_song(node.data)
+            self.songs.remove_node(node)
+            if self.store:
+                self.store.delete(node.data.id)
+                self._count -= 1
+            self._notify("remove", index, node.data)
+            return True
+
+    def add_listener(self, callback):
+        with self._writing():
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self._writing():
+            if callback in self._listeners:
+                self._listeners.remove(callback)
\ No newline at end of file
@@ -0,0 +1,174 @@
+# controllers/metrics.py
+#
+# Instrumentasi opsional untuk mencari sumber lag di UI.
+# Aktif hanya kalau environment variable TUBES_METRICS di-set:
+#   TUBES_METRICS=1                  -> ringkasan ditulis ke tubes_metrics.json saat keluar
+#   TUBES_METRICS=path/ke/file.json  -> ditulis ke file itu
+#
+# Yang dicatat per nama fungsi: jumlah panggilan, total & maksimum waktu,
+# histogram latensi (bucket pangkat dua dalam mikrodetik) dan jumlah item
+# yang dikembalikan (untuk hasil berupa list/tuple/set/dict).
+#
+# Kalau tidak aktif, install() tidak melakukan apa-apa dan @timed
+# mengembalikan fungsi aslinya, jadi tidak ada overhead sama sekali.
+
+import atexit
+import inspect
+import json
+import os
+import threading
+import time
+from functools import wraps
+from types import FunctionType
+
+_ENV = os.environ.get("TUBES_METRICS", "")
+ENABLED = _ENV not in ("", "0")
+METRICS_PATH = _ENV if _ENV.endswith(".json") else "tubes_metrics.json"
+
+N_BUCKETS = 32      # bucket b: latensi < 2**b mikrodetik (bucket terakhir = sisanya)
+
+_stats = {}
+_lock = threading.Lock()
+_installed = False
+
+
+class _Stat:
+    __slots__ = ("calls", "total", "max", "items", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.items = 0
+        self.buckets = [0] * N_BUCKETS
+
+
+def record(name, elapsed, items=None):
+    """Catat satu panggilan `name` yang makan `elapsed` detik."""
+    us = elapsed * 1e6
+    bucket = min(int(us).bit_length(), N_BUCKETS - 1)
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = _Stat()
+        stat.calls += 1
+        stat.total += elapsed
+        if elapsed > stat.max:
+            stat.max = elapsed
+        if items is not None:
+            stat.items += items
+        stat.buckets[bucket] += 1
+
+
+def _wrap(fn, name):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+        items = len(result) if isinstance(result, (list, tuple, set, dict)) else None
+        record(name, elapsed, items)
+        return result
+    wrapper.__metrics_wrapped__ = True
+    return wrapper
+
+
+def timed(name=None):
+    """
+    Decorator untuk fungsi render GUI dll. Nama default = __qualname__.
+    Saat metrics tidak aktif fungsi dikembalikan apa adanya.
+    """
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+        return _wrap(fn, name or fn.__qualname__)
+    return decorate
+
+
+def instrument_class(cls):
+    """
+    Bungkus semua method publik yang didefinisikan langsung di cls
+    (bukan turunan). Generator dilewati karena waktunya baru terpakai
+    saat diiterasi; begitu juga factory @contextmanager (mis. batch),
+    yang hanya membuat objek context manager.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not isinstance(value, FunctionType):
+            continue
+        if inspect.isgeneratorfunction(inspect.unwrap(value)) or getattr(value, "__metrics_wrapped__", False):
+            continue
+        setattr(cls, attr, _wrap(value, f"{cls.__name__}.{attr}"))
+
+
+def install():
+    """Pasang instrumentasi ke controller & struktur data (sekali saja)."""
+    global _installed
+    if not ENABLED or _installed:
+        return False
+    from controllers.lagu_controller import SongController
+    from structures.double_linked_list import DoubleLinkedList
+    from structures.indexed_skip_list import IndexedSkipList
+
+    for cls in (SongController, DoubleLinkedList, IndexedSkipList):
+        instrument_class(cls)
+    atexit.register(dump)
+    _installed = True
+    return True
+
+
+# ============================
+# LAPORAN
+# ============================
+def _percentile(buckets, calls, p):
+    # batas atas bucket tempat persentil p jatuh (mikrodetik)
+    target = calls * p
+    seen = 0
+    for b, count in enumerate(buckets):
+        seen += count
+        if seen >= target:
+            return float(1 << b)
+    return float(1 << (N_BUCKETS - 1))
+
+
+def snapshot():
+    """dict nama -> ringkasan statistik, urut dari total waktu terbesar."""
+    with _lock:
+        items = [(name, s.calls, s.total, s.max, s.items, list(s.buckets)) for name, s in _stats.items()]
+    out = {}
+    for name, calls, total, mx, n_items, buckets in sorted(items, key=lambda x: -x[2]):
+        out[name] = {
+            "calls": calls,
+            "total_ms": total * 1e3,
+            "mean_us": total / calls * 1e6,
+            "max_us": mx * 1e6,
+            "p50_us_le": _percentile(buckets, calls, 0.50),
+            "p95_us_le": _percentile(buckets, calls, 0.95),
+            "items": n_items,
+            # hanya bucket yang terisi: "<2^b us" -> jumlah
+            "histogram": {f"<{1 << b}us": c for b, c in enumerate(buckets) if c},
+        }
+    return out
+
+
+def report(limit=40):
+    """Tabel teks ringkas (dipakai panel metrics di GUI)."""
+    lines = [f"{'fungsi':<44}{'calls':>8}{'total ms':>11}{'mean us':>10}{'p95 us':>9}{'max us':>10}{'items':>9}"]
+    lines.append("-" * len(lines[0]))
+    for name, s in list(snapshot().items())[:limit]:
+        lines.append(f"{name[:43]:<44}{s['calls']:>8}{s['total_ms']:>11.2f}{s['mean_us']:>10.1f}"
+                     f"{s['p95_us_le']:>9.0f}{s['max_us']:>10.1f}{s['items']:>9}")
+    return "\n".join(lines)
+
+
+def dump(path=None):
+    path = path or METRICS_PATH
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, indent=2)
+    return path
+
+
+def reset():
+    with _lock:
+        _stats.clear()
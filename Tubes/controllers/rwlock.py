@@ -0,0 +1,106 @@
+# controllers/rwlock.py
+#
+# Reader/writer lock untuk SongController: banyak pembaca (search, get_*)
+# boleh jalan bersamaan, penulis (add/update/delete/batch) eksklusif.
+
+import threading
+from contextlib import contextmanager
+
+
+class RWLock:
+    """
+    Reader/writer lock yang mengutamakan penulis dan re-entrant:
+
+    - selama ada penulis yang menunggu, pembaca BARU ikut menunggu supaya
+      penulis tidak kelaparan oleh aliran search yang terus-menerus;
+    - thread yang sudah memegang read lock boleh read lagi (tidak ikut
+      antre di belakang penulis, supaya tidak deadlock);
+    - thread yang memegang write lock boleh write atau read lagi;
+    - upgrade read -> write ditolak (RuntimeError), karena dua thread yang
+      sama-sama upgrade pasti saling menunggu.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = {}          # thread id -> kedalaman read
+        self._writer = None         # thread id pemegang write lock
+        self._write_depth = 0
+        self._writers_waiting = 0
+
+    # ============================
+    # READ
+    # ============================
+    def acquire_read(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me or me in self._readers:
+                self._readers[me] = self._readers.get(me, 0) + 1
+                return
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers[me] = 1
+
+    def release_read(self):
+        me = threading.get_ident()
+        with self._cond:
+            depth = self._readers.get(me)
+            if not depth:
+                raise RuntimeError("release_read tanpa acquire_read")
+            if depth > 1:
+                self._readers[me] = depth - 1
+                return
+            del self._readers[me]
+            if not self._readers:
+                self._cond.notify_all()
+
+    # ============================
+    # WRITE
+    # ============================
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("tidak bisa upgrade read lock ke write lock")
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        with self._cond:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("release_write oleh thread yang bukan pemegang lock")
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    def holds_write(self):
+        """True kalau thread ini sedang memegang write lock."""
+        return self._writer == threading.get_ident()
+
+    # ============================
+    # CONTEXT MANAGER
+    # ============================
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield self
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield self
+        finally:
+            self.release_write()
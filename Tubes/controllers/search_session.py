@@ -0,0 +1,60 @@
+# controllers/search_session.py
+
+import threading
+
+from controllers.cancel import CancelToken
+
+
+class SearchSession:
+    """
+    Sesi pencarian untuk satu kotak search.
+
+    Hasil query terakhir disimpan. Kalau query baru hanya mempersempit
+    query lama (query lama adalah substring query baru), semua hasil baru
+    pasti ada di hasil lama, jadi cukup difilter ulang tanpa scan katalog.
+    Query yang melebar (hapus huruf, ganti kata) atau katalog yang berubah
+    (SongController.version) memicu pencarian penuh.
+
+    query() boleh dipanggil dari thread worker. Cache dijaga lock, tapi
+    pencariannya sendiri jalan di luar lock; hasil query yang dibatalkan
+    (cancel, lihat controllers/cancel.py) tidak disimpan ke cache.
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._keyword = None
+            self._results = None
+            self._version = None
+
+    def query(self, keyword, cancel=None):
+        kw = (keyword or "").lower().strip()
+        if not kw:
+            self.reset()
+            return self.controller.get_all_songs()
+
+        version = self.controller.version
+        with self._lock:
+            cached = self._results if (self._results is not None and self._version == version
+                                       and self._keyword in kw) else None
+
+        if cached is not None:
+            matches = self.controller.matches
+            results = []
+            for i, s in enumerate(cached):
+                if cancel is not None and not i % CancelToken.CHECK_EVERY:
+                    cancel.check()
+                if matches(s, kw):
+                    results.append(s)
+        else:
+            results = self.controller.search(kw, cancel=cancel)
+
+        with self._lock:
+            self._keyword = kw
+            self._results = results
+            self._version = version
+        return results
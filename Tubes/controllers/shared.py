@@ -1,7 +1,49 @@
 # controllers/shared.py
+#
+# Controller katalog bersama. Dibuat saat pertama kali diminta lewat
+# get_song_controller() (bukan saat modul di-import), supaya jendela login
+# bisa tampil sebelum katalog dibangun.
 
-from controllers.lagu_controller import SongController
-from gui.initial_data import INITIAL_SONGS
+import os
 
-# hanya dibuat sekali
-shared_song_controller = SongController(initial_data=INITIAL_SONGS)
\ No newline at end of file
+# set TUBES_DB=path/ke/katalog.db supaya katalog disimpan di SQLite, atau
+# TUBES_CATALOG=path/ke/katalog.bin untuk katalog biner read-only (mmap).
+# Tanpa keduanya katalog hanya ada di memori seperti sebelumnya.
+DB_PATH = os.environ.get("TUBES_DB")
+CATALOG_PATH = os.environ.get("TUBES_CATALOG")
+
+_controller = None
+
+
+def _open_store():
+    if DB_PATH:
+        from controllers.storage import SQLiteSongStore
+        return SQLiteSongStore(DB_PATH)
+    if CATALOG_PATH:
+        from controllers.storage import MmapCatalogStore
+        return MmapCatalogStore(CATALOG_PATH)
+    return None
+
+
+def get_song_controller():
+    """SongController bersama; dibuat sekali, saat pertama kali dipanggil."""
+    global _controller
+    if _controller is None:
+        from controllers.lagu_controller import SongController
+        from gui.initial_data import INITIAL_SONGS
+        from structures.indexed_skip_list import IndexedSkipList
+
+        # IndexedSkipList: AdminWindow mengakses lagu per baris, jadi index harus O(log n)
+        _controller = SongController(
+            initial_data=INITIAL_SONGS,
+            list_cls=IndexedSkipList,
+            store=_open_store(),
+        )
+    return _controller
+
+
+def __getattr__(name):
+    # kompatibilitas: `from controllers.shared import shared_song_controller`
+    if name == "shared_song_controller":
+        return get_song_controller()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
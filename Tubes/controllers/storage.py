@@ -0,0 +1,751 @@
+# controllers/storage.py
+#
+# Backend penyimpanan katalog untuk SongController.
+# Store dipakai sebagai sumber data "lazy": controller hanya memuat halaman
+# (page) lagu ke linked list saat dibutuhkan, dan untuk katalog yang belum
+# termuat penuh, pencarian diteruskan langsung ke store.
+#
+# Setiap baris yang dikembalikan store berbentuk (id, judul, artis, genre, vibes).
+
+import heapq
+import mmap
+import sqlite3
+import struct
+import sys
+import threading
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from operator import itemgetter
+
+from structures.facet_index import FacetIndex
+
+def _like_escape(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like_pattern(keyword):
+    return f"%{_like_escape(keyword)}%"
+
+
+def _row_matches(row, kw):
+    # aturan yang sama dengan SongController.matches, untuk baris (id, judul, ...)
+    return any(kw in field.lower() for field in row[1:])
+
+
+# kolom baris store untuk field facet
+FACET_COLUMNS = {"artis": 2, "genre": 3, "vibes": 4}
+
+
+def _facet_criteria(genre, vibes, artis):
+    """{field: set nilai lower-case} dari argumen filter (string atau list)."""
+    criteria = {}
+    for field, wanted in (("genre", genre), ("vibes", vibes), ("artis", artis)):
+        if wanted is None:
+            continue
+        if isinstance(wanted, str):
+            wanted = [wanted]
+        criteria[field] = {w.strip().lower() for w in wanted if isinstance(w, str)}
+    return criteria
+
+
+def _row_in_facets(row, criteria):
+    return all(row[FACET_COLUMNS[f]].strip().lower() in values for f, values in criteria.items())
+
+
+class SongStore(ABC):
+    """
+    Antarmuka store yang dipakai SongController:
+      count(), get(id), fetch_page(after_id, limit), iter_rows(after_id),
+      search(keyword), complete(prefix, k), filter(genre, vibes, artis),
+      facet_values(field), batch(), insert(song), update(song), delete(id),
+      close()
+    Store dengan readonly = True tidak pernah ditulis oleh controller
+    (insert/update/delete boleh langsung raise); controller membungkusnya
+    dengan OverlayStore.
+    """
+
+    readonly = False
+
+    @abstractmethod
+    def count(self):
+        """Jumlah lagu di store."""
+
+    @abstractmethod
+    def get(self, song_id):
+        """Baris lagu dengan id tsb, atau None."""
+
+    @abstractmethod
+    def fetch_page(self, after_id, limit):
+        """Maksimal `limit` baris dengan id > after_id, urut id."""
+
+    @abstractmethod
+    def search(self, keyword):
+        """Baris yang field-nya mengandung keyword (case-insensitive), urut id."""
+
+    @abstractmethod
+    def complete(self, prefix, k):
+        """
+        Maksimal k judul/artis berawalan prefix (tanpa beda huruf) sebagai
+        (teks, jumlah lagu), terbanyak dulu lalu alfabet.
+        """
+
+    @abstractmethod
+    def filter(self, genre=None, vibes=None, artis=None):
+        """
+        Baris yang field-nya sama persis (tanpa beda huruf) dengan nilai
+        yang diminta, urut id; aturannya sama dengan FacetIndex.query.
+        """
+
+    @abstractmethod
+    def facet_values(self, field):
+        """Nilai field (lower-case) yang ada beserta jumlah lagunya."""
+
+    @abstractmethod
+    def batch(self):
+        """Context manager: semua tulis di dalamnya masuk satu transaksi."""
+
+    @abstractmethod
+    def insert(self, song):
+        """Simpan lagu; mengembalikan id-nya."""
+
+    @abstractmethod
+    def update(self, song):
+        """Tulis ulang field lagu dengan id song.id."""
+
+    @abstractmethod
+    def delete(self, song_id):
+        """Hapus lagu dengan id tsb."""
+
+    @abstractmethod
+    def close(self):
+        """Tutup koneksi / file."""
+
+    def iter_rows(self, after_id=0, chunk=1000):
+        while True:
+            rows = self.fetch_page(after_id, chunk)
+            if not rows:
+                return
+            yield from rows
+            after_id = rows[-1][0]
+
+    def max_id(self):
+        """Id terbesar di store (0 kalau kosong). Store sebaiknya menimpa ini."""
+        last = 0
+        for row in self.iter_rows():
+            last = row[0]
+        return last
+
+
+class SQLiteSongStore(SongStore):
+    """
+    Store katalog berbasis SQLite (mode WAL).
+
+    - id lagu = INTEGER PRIMARY KEY AUTOINCREMENT (tidak dipakai ulang),
+      jadi urutan id = urutan katalog.
+    - judul/artis/genre/vibes diberi index (COLLATE NOCASE).
+    - Di dalam `with store.batch():` semua tulis masuk satu transaksi;
+      di luar batch setiap tulis langsung di-commit.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # check_same_thread=False: boleh dipakai thread lain (akses tetap diatur controller)
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._batch_depth = 0
+        self._create_schema()
+
+    def _create_schema(self):
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS songs (
+                id    INTEGER PRIMARY KEY AUTOINCREMENT,
+                judul TEXT NOT NULL,
+                artis TEXT NOT NULL,
+                genre TEXT NOT NULL,
+                vibes TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_songs_judul ON songs(judul COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_songs_artis ON songs(artis COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_songs_genre ON songs(genre COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_songs_vibes ON songs(vibes COLLATE NOCASE);
+        """)
+
+    # ============================
+    # TRANSAKSI
+    # ============================
+    @contextmanager
+    def batch(self):
+        if self._batch_depth == 0:
+            self.conn.execute("BEGIN")
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.execute("ROLLBACK")
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.execute("COMMIT")
+
+    def close(self):
+        self.conn.close()
+
+    # ============================
+    # BACA
+    # ============================
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM songs").fetchone()[0]
+
+    def get(self, song_id):
+        return self.conn.execute(
+            "SELECT id, judul, artis, genre, vibes FROM songs WHERE id = ?", (song_id,)
+        ).fetchone()
+
+    def fetch_page(self, after_id, limit):
+        """Maksimal `limit` baris dengan id > after_id, urut id."""
+        return self.conn.execute(
+            "SELECT id, judul, artis, genre, vibes FROM songs WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, limit),
+        ).fetchall()
+
+    def search(self, keyword):
+        """Baris yang field-nya mengandung keyword (case-insensitive), urut id."""
+        pattern = _like_pattern(keyword)
+        return self.conn.execute(
+            "SELECT id, judul, artis, genre, vibes FROM songs "
+            "WHERE judul LIKE ?1 ESCAPE '\\' OR artis LIKE ?1 ESCAPE '\\' "
+            "OR genre LIKE ?1 ESCAPE '\\' OR vibes LIKE ?1 ESCAPE '\\' "
+            "ORDER BY id",
+            (pattern,),
+        ).fetchall()
+
+    def complete(self, prefix, k):
+        pattern = _like_escape(prefix.strip()) + "%"
+        return self.conn.execute(
+            "SELECT t, COUNT(*) AS c FROM ("
+            "  SELECT judul AS t FROM songs WHERE judul LIKE ?1 ESCAPE '\\'"
+            "  UNION ALL SELECT artis FROM songs WHERE artis LIKE ?1 ESCAPE '\\'"
+            ") GROUP BY t COLLATE NOCASE ORDER BY c DESC, lower(t) LIMIT ?2",
+            (pattern, k),
+        ).fetchall()
+
+    def filter(self, genre=None, vibes=None, artis=None):
+        # kolom genre/vibes/artis punya index COLLATE NOCASE; hasilnya dicek
+        # ulang dengan lower() Python supaya huruf non-ASCII ikut aturan FacetIndex
+        criteria = _facet_criteria(genre, vibes, artis)
+        where, params = [], []
+        for field, values in criteria.items():
+            if not values:
+                return []
+            where.append(f"{field} COLLATE NOCASE IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        sql = "SELECT id, judul, artis, genre, vibes FROM songs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        rows = self.conn.execute(sql + " ORDER BY id", params)
+        return [r for r in rows if _row_in_facets(r, criteria)]
+
+    def facet_values(self, field):
+        if field not in FACET_COLUMNS:
+            raise ValueError(f"field facet tidak dikenal: {field}")
+        values = {}
+        for value, n in self.conn.execute(
+                f"SELECT {field}, COUNT(*) FROM songs GROUP BY {field} COLLATE NOCASE"):
+            key = value.strip().lower()
+            values[key] = values.get(key, 0) + n
+        return values
+
+    def max_id(self):
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM songs").fetchone()[0]
+
+    # ============================
+    # TULIS
+    # ============================
+    def insert(self, song):
+        """Simpan lagu; mengembalikan id (id lagu dipakai kalau sudah ada)."""
+        cur = self.conn.execute(
+            "INSERT INTO songs (id, judul, artis, genre, vibes) VALUES (?, ?, ?, ?, ?)",
+            (song.id, song.judul, song.artis, song.genre, song.vibes),
+        )
+        return cur.lastrowid
+
+    def update(self, song):
+        self.conn.execute(
+            "UPDATE songs SET judul = ?, artis = ?, genre = ?, vibes = ? WHERE id = ?",
+            (song.judul, song.artis, song.genre, song.vibes, song.id),
+        )
+
+    def delete(self, song_id):
+        self.conn.execute("DELETE FROM songs WHERE id = ?", (song_id,))
+
+
+# =====================================================
+# KATALOG BINER (MMAP)
+# =====================================================
+#
+# Format file (little-endian):
+#   header   : magic(8) n_songs(u32) n_strings(u32) ids_off cols_off stroff_off blob_off (u64)
+#   ids      : n_songs x u32, id lagu urut naik
+#   cols     : 4 kolom (judul, artis, genre, vibes) x n_songs x u32 = index string
+#   stroff   : (n_strings + 1) x u32 = offset tiap string di blob
+#   blob     : semua string unik (UTF-8) disambung
+#
+# String disimpan sekali saja (dictionary encoding), jadi artis/genre/vibes
+# yang berulang hampir tidak memakan tempat.
+
+CATALOG_MAGIC = b"TBCAT\x00\x01\x00"
+_HEADER = struct.Struct("<8sIIQQQQ")
+_U32 = struct.Struct("<I")
+_COLUMNS = 4
+
+
+def write_binary_catalog(path, songs):
+    """
+    Tulis katalog biner dari iterable Song (atau dict berkunci judul/artis/
+    genre/vibes, opsional id). Lagu tanpa id diberi id berurutan; id harus
+    naik. Mengembalikan jumlah lagu yang ditulis.
+    """
+    ids = []
+    cols = [[] for _ in range(_COLUMNS)]
+    strings = {}
+    next_id = 1
+
+    for s in songs:
+        if isinstance(s, dict):
+            song_id = s.get("id")
+            fields = (s.get("judul"), s.get("artis"), s.get("genre"), s.get("vibes"))
+        else:
+            song_id = s.id
+            fields = (s.judul, s.artis, s.genre, s.vibes)
+        if song_id is None:
+            song_id = next_id
+        if ids and song_id <= ids[-1]:
+            raise ValueError("id lagu di katalog biner harus urut naik")
+        next_id = song_id + 1
+        ids.append(song_id)
+        for col, value in zip(cols, fields):
+            col.append(strings.setdefault(value or "", len(strings)))
+
+    blob = bytearray()
+    offsets = []
+    for text in strings:            # dict menjaga urutan index
+        offsets.append(len(blob))
+        blob += text.encode("utf-8")
+    offsets.append(len(blob))
+
+    n = len(ids)
+    ids_off = _HEADER.size
+    cols_off = ids_off + 4 * n
+    stroff_off = cols_off + 4 * n * _COLUMNS
+    blob_off = stroff_off + 4 * len(offsets)
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(CATALOG_MAGIC, n, len(strings), ids_off, cols_off, stroff_off, blob_off))
+        f.write(struct.pack(f"<{n}I", *ids))
+        for col in cols:
+            f.write(struct.pack(f"<{n}I", *col))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(blob)
+    return n
+
+
+class MmapCatalogStore(SongStore):
+    """
+    Store read-only di atas file katalog biner yang di-mmap.
+
+    Membuka file hanya membaca header (O(1)), jadi katalog 1 juta lagu
+    siap dalam hitungan milidetik dan halaman memorinya dibagi antar proses.
+    Baris/string baru di-decode saat diakses. Karena read-only, perubahan
+    katalog oleh SongController hanya disimpan di memori.
+
+    search() memakai index yang dibangun sekali saat search pertama:
+    trigram (lower-case) -> nomor string di tabel string, dan nomor string
+    -> posisi baris yang memakainya. Query cukup mengiris daftar trigram
+    lalu mengambil baris dari string yang cocok, tanpa scan semua lagu.
+    filter()/facet_values() memakai FacetIndex atas posisi baris, juga
+    dibangun saat pertama dipakai.
+    """
+
+    readonly = True
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._n, self._n_strings, ids_off, cols_off, stroff_off, self._blob_off = \
+            _HEADER.unpack_from(self._mm, 0)
+        if magic != CATALOG_MAGIC:
+            self.close()
+            raise ValueError(f"{path} bukan katalog biner yang valid")
+
+        self._mv = memoryview(self._mm)
+        self._ids = self._u32_array(ids_off, self._n)
+        self._cols = [self._u32_array(cols_off + 4 * self._n * c, self._n) for c in range(_COLUMNS)]
+        self._stroff = self._u32_array(stroff_off, self._n_strings + 1)
+        self._strings = {}       # cache string yang sudah di-decode
+        # index pencarian (lihat _build_search_index) dan autocomplete
+        # (lihat _build_completion_index), dibangun saat pertama perlu
+        self._grams = None
+        self._completion = None
+        self._facets = None
+        self._index_lock = threading.Lock()
+
+    def _u32_array(self, offset, count):
+        view = self._mv[offset:offset + 4 * count]
+        if sys.byteorder == "little":
+            return view.cast("I")
+        return [v for (v,) in struct.iter_unpack("<I", view)]
+
+    def _string(self, i):
+        text = self._strings.get(i)
+        if text is None:
+            start = self._blob_off + self._stroff[i]
+            end = self._blob_off + self._stroff[i + 1]
+            text = self._strings[i] = sys.intern(str(self._mm[start:end], "utf-8"))
+        return text
+
+    def _raw_string(self, i):
+        # decode tanpa masuk cache (dipakai saat membangun index)
+        start = self._blob_off + self._stroff[i]
+        return str(self._mm[start:self._blob_off + self._stroff[i + 1]], "utf-8")
+
+    def _build_search_index(self):
+        n_strings = self._n_strings
+        grams = {}
+        for i in range(n_strings):
+            text = self._raw_string(i).lower()
+            for g in {text[j:j + 3] for j in range(len(text) - 2)}:
+                postings = grams.get(g)
+                if postings is None:
+                    grams[g] = array("I", (i,))
+                else:
+                    postings.append(i)
+
+        # nomor string -> posisi baris, format CSR:
+        # baris string s = row_pos[row_start[s]:row_start[s + 1]]
+        counts = [0] * (n_strings + 1)
+        for col in self._cols:
+            for v in col:
+                counts[v + 1] += 1
+        for i in range(n_strings):
+            counts[i + 1] += counts[i]
+        fill = counts[:-1]
+        row_pos = array("I", bytes(4 * counts[-1]))
+        for col in self._cols:
+            for pos, v in enumerate(col):
+                row_pos[fill[v]] = pos
+                fill[v] += 1
+        self._row_start = array("I", counts)
+        self._row_pos = row_pos
+        self._grams = grams
+
+    def _build_completion_index(self):
+        # jumlah lagu per string judul/artis, dan string itu urut alfabet
+        # (lower-case), jadi prefix = satu rentang hasil bisect
+        counts = array("I", bytes(4 * self._n_strings))
+        for col in self._cols[:2]:
+            for v in col:
+                counts[v] += 1
+        order = array("I", sorted((i for i in range(self._n_strings) if counts[i]),
+                                  key=lambda i: self._raw_string(i).strip().lower()))
+        self._completion = (order, counts)
+
+    def _build_facet_index(self):
+        # bitmap per nilai genre/vibes/artis berisi POSISI baris (bukan id)
+        facets = FacetIndex()
+        for field, col in FACET_COLUMNS.items():
+            rows_by_string = {}
+            for pos, v in enumerate(self._cols[col - 1]):
+                rows = rows_by_string.get(v)
+                if rows is None:
+                    rows_by_string[v] = [pos]
+                else:
+                    rows.append(pos)
+            for s, positions in rows_by_string.items():
+                facets.add_group(field, self._raw_string(s), positions)
+        self._facets = facets
+
+    def _facet_index(self):
+        if self._facets is None:
+            with self._index_lock:
+                if self._facets is None:
+                    self._build_facet_index()
+        return self._facets
+
+    def _matching_strings(self, kw):
+        if len(kw) < 3:
+            # query pendek cocok dengan hampir semua string: cek langsung
+            return [i for i in range(self._n_strings) if kw in self._string(i).lower()]
+        postings = []
+        for g in {kw[j:j + 3] for j in range(len(kw) - 2)}:
+            found = self._grams.get(g)
+            if found is None:
+                return []
+            postings.append(found)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for found in postings[1:]:
+            candidates.intersection_update(found)
+            if not candidates:
+                return []
+        return [i for i in candidates if kw in self._string(i).lower()]
+
+    def _row(self, pos):
+        c = self._cols
+        return (self._ids[pos], self._string(c[0][pos]), self._string(c[1][pos]),
+                self._string(c[2][pos]), self._string(c[3][pos]))
+
+    def close(self):
+        for name in ("_ids", "_cols", "_stroff", "_mv"):
+            view = self.__dict__.pop(name, None)
+            for v in (view if isinstance(view, list) else [view]):
+                if isinstance(v, memoryview):
+                    v.release()
+        self._mm.close()
+        self._file.close()
+
+    # ============================
+    # BACA
+    # ============================
+    def count(self):
+        return self._n
+
+    def get(self, song_id):
+        pos = bisect_left(self._ids, song_id)
+        if pos < self._n and self._ids[pos] == song_id:
+            return self._row(pos)
+        return None
+
+    def fetch_page(self, after_id, limit):
+        start = bisect_right(self._ids, after_id)
+        return [self._row(pos) for pos in range(start, min(start + limit, self._n))]
+
+    def search(self, keyword):
+        if self._grams is None:
+            with self._index_lock:
+                if self._grams is None:
+                    self._build_search_index()
+        positions = set()
+        start, rows = self._row_start, self._row_pos
+        for s in self._matching_strings(keyword.lower()):
+            positions.update(rows[start[s]:start[s + 1]])
+        return [self._row(pos) for pos in sorted(positions)]
+
+    def complete(self, prefix, k):
+        if self._completion is None:
+            with self._index_lock:
+                if self._completion is None:
+                    self._build_completion_index()
+        order, counts = self._completion
+        key = prefix.strip().lower()
+        lower = lambda i: self._string(i).strip().lower()
+        lo = bisect_left(order, key, key=lower)
+        hi = bisect_left(order, key + "\U0010ffff", lo, key=lower)
+        # posisi di order sudah urut alfabet, jadi cukup jadi pemecah seri
+        best = heapq.nsmallest(k, range(lo, hi), key=lambda p: (-counts[order[p]], p))
+        found = {}
+        for p in best:
+            text = self._string(order[p]).strip()
+            # beda huruf besar/kecil dianggap satu saran
+            found.setdefault(text.lower(), (text, counts[order[p]]))
+        return list(found.values())
+
+    def filter(self, genre=None, vibes=None, artis=None):
+        positions = self._facet_index().query(genre=genre, vibes=vibes, artis=artis)
+        if positions is None:
+            return list(self.iter_rows())
+        return [self._row(pos) for pos in positions]
+
+    def facet_values(self, field):
+        if field not in FACET_COLUMNS:
+            raise ValueError(f"field facet tidak dikenal: {field}")
+        return self._facet_index().values(field)
+
+    def max_id(self):
+        return self._ids[self._n - 1] if self._n else 0
+
+    # ============================
+    # TULIS (tidak didukung)
+    # ============================
+    def batch(self):
+        return nullcontext(self)
+
+    def insert(self, song):
+        raise TypeError("katalog biner bersifat read-only")
+
+    def update(self, song):
+        raise TypeError("katalog biner bersifat read-only")
+
+    def delete(self, song_id):
+        raise TypeError("katalog biner bersifat read-only")
+
+
+# =====================================================
+# LAPISAN TULIS DI MEMORI
+# =====================================================
+
+class OverlayStore(SongStore):
+    """
+    Store yang bisa ditulis di atas store read-only (mis. MmapCatalogStore).
+
+    Perubahan disimpan di memori per id: _added (lagu baru), _changed
+    (baris store yang diedit) dan _deleted (tombstone baris store yang
+    dihapus). Baca menggabungkan baris store dengan lapisan ini, jadi edit
+    pertama tidak perlu memuat seluruh katalog. Perubahan hilang saat
+    aplikasi ditutup (store di bawahnya tidak pernah diubah).
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self._added = {}         # id -> baris lagu baru
+        self._added_ids = []     # id lagu baru, urut naik
+        self._changed = {}       # id baris store -> baris hasil edit
+        self._deleted = set()    # id baris store yang dihapus
+        self._next_id = base.max_id() + 1
+
+    @staticmethod
+    def _song_row(song_id, song):
+        return (song_id, song.judul, song.artis, song.genre, song.vibes)
+
+    def _base_rows(self, after_id, chunk):
+        for row in self.base.iter_rows(after_id, chunk):
+            if row[0] in self._deleted:
+                continue
+            yield self._changed.get(row[0], row)
+
+    def _added_rows(self, after_id):
+        ids = self._added_ids
+        for k in range(bisect_right(ids, after_id), len(ids)):
+            yield self._added[ids[k]]
+
+    # ============================
+    # BACA
+    # ============================
+    def count(self):
+        return self.base.count() - len(self._deleted) + len(self._added)
+
+    def get(self, song_id):
+        row = self._added.get(song_id) or self._changed.get(song_id)
+        if row is not None:
+            return row
+        if song_id in self._deleted:
+            return None
+        return self.base.get(song_id)
+
+    def fetch_page(self, after_id, limit):
+        merged = heapq.merge(self._base_rows(after_id, limit), self._added_rows(after_id),
+                             key=itemgetter(0))
+        return list(islice(merged, limit))
+
+    def search(self, keyword):
+        kw = keyword.lower()
+        rows = [r for r in self.base.search(keyword)
+                if r[0] not in self._deleted and r[0] not in self._changed]
+        rows.extend(r for r in self._changed.values() if _row_matches(r, kw))
+        rows.extend(r for r in self._added.values() if _row_matches(r, kw))
+        rows.sort(key=itemgetter(0))
+        return rows
+
+    def complete(self, prefix, k):
+        # jumlah dari store dikoreksi dengan baris yang diedit/dihapus/baru;
+        # term yang hanya ada di lapisan ini dihitung dari lapisan ini saja
+        key = prefix.strip().lower()
+        overlay = len(self._changed) + len(self._deleted) + len(self._added)
+        counts, display = {}, {}
+        for text, c in self.base.complete(prefix, k + 2 * overlay):
+            counts[text.lower()] = c
+            display[text.lower()] = text
+
+        def bump(row, delta):
+            for text in row[1:3]:
+                term = text.strip()
+                low = term.lower()
+                if low.startswith(key):
+                    counts[low] = counts.get(low, 0) + delta
+                    display.setdefault(low, term)
+
+        for song_id in list(self._changed) + list(self._deleted):
+            original = self.base.get(song_id)
+            if original is not None:
+                bump(original, -1)
+        for row in list(self._changed.values()) + list(self._added.values()):
+            bump(row, 1)
+        ranked = sorted((-c, low) for low, c in counts.items() if c > 0)
+        return [(display[low], -c) for c, low in ranked[:k]]
+
+    def filter(self, genre=None, vibes=None, artis=None):
+        criteria = _facet_criteria(genre, vibes, artis)
+        rows = [r for r in self.base.filter(genre, vibes, artis)
+                if r[0] not in self._deleted and r[0] not in self._changed]
+        rows.extend(r for r in self._changed.values() if _row_in_facets(r, criteria))
+        rows.extend(r for r in self._added.values() if _row_in_facets(r, criteria))
+        rows.sort(key=itemgetter(0))
+        return rows
+
+    def facet_values(self, field):
+        values = self.base.facet_values(field)
+        col = FACET_COLUMNS[field]
+
+        def bump(row, delta):
+            key = row[col].strip().lower()
+            values[key] = values.get(key, 0) + delta
+            if not values[key]:
+                del values[key]
+
+        for song_id in list(self._changed) + list(self._deleted):
+            original = self.base.get(song_id)
+            if original is not None:
+                bump(original, -1)
+        for row in list(self._changed.values()) + list(self._added.values()):
+            bump(row, 1)
+        return values
+
+    def max_id(self):
+        return self._next_id - 1
+
+    # ============================
+    # TULIS
+    # ============================
+    def batch(self):
+        return nullcontext(self)
+
+    def insert(self, song):
+        song_id = song.id
+        if song_id is None:
+            song_id = self._next_id
+        elif self.get(song_id) is not None:
+            raise ValueError(f"lagu dengan id {song_id} sudah ada")
+        row = self._song_row(song_id, song)
+        if song_id in self._deleted:
+            # id baris store yang sudah dihapus dipakai lagi: jadi edit baris itu
+            self._deleted.discard(song_id)
+            self._changed[song_id] = row
+        else:
+            self._added[song_id] = row
+            insort(self._added_ids, song_id)
+        self._next_id = max(self._next_id, song_id + 1)
+        return song_id
+
+    def update(self, song):
+        row = self._song_row(song.id, song)
+        if song.id in self._added:
+            self._added[song.id] = row
+        else:
+            self._changed[song.id] = row
+
+    def delete(self, song_id):
+        if self._added.pop(song_id, None) is not None:
+            del self._added_ids[bisect_left(self._added_ids, song_id)]
+            return
+        self._changed.pop(song_id, None)
+        self._deleted.add(song_id)
+
+    def close(self):
+        self.base.close()
@@ -6,7 +6,8 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
 from structures.song import Song
-from controllers.shared import shared_song_controller
+from controllers.shared import get_song_controller
+from gui.song_table import SongTableModel
 
 STYLE_SHEET = """
 QWidget {
@@ -33,7 +34,7 @@ QPushButton:hover {
 """
 
 class AdminWindow(QMainWindow):
-    """GUI Admin — CRUD lagu menggunakan shared_song_controller."""
+    """GUI Admin — CRUD lagu menggunakan controller bersama (get_song_controller)."""
 
     def __init__(self):
         super().__init__()
@@ -42,10 +43,9 @@ class AdminWindow(QMainWindow):
         self.setStyleSheet(STYLE_SHEET)
 
         # Shared controller (data tetap tersimpan setelah logout)
-        self.song_controller = shared_song_controller
+        self.song_controller = get_song_controller()
 
         self._setup_ui()
-        self._load_table()
 
     # -------------------------------------------------------------
     # SETUP UI
@@ -68,10 +68,12 @@ class AdminWindow(QMainWindow):
         header.addWidget(btn_logout)
         layout.addLayout(header)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Judul", "Artis", "Genre", "Vibes"])
+        # Table (model mengikuti perubahan controller per baris)
+        self.table_model = SongTableModel(self.song_controller, self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
         layout.addWidget(self.table)
@@ -97,17 +99,11 @@ class AdminWindow(QMainWindow):
         self.setCentralWidget(widget)
 
     # -------------------------------------------------------------
-    # TABLE LOAD
+    # TABLE
     # -------------------------------------------------------------
-    def _load_table(self):
-        songs = self.song_controller.get_all_songs()
-        self.table.setRowCount(len(songs))
-
-        for idx, s in enumerate(songs):
-            self.table.setItem(idx, 0, QTableWidgetItem(s.judul))
-            self.table.setItem(idx, 1, QTableWidgetItem(s.artis))
-            self.table.setItem(idx, 2, QTableWidgetItem(s.genre))
-            self.table.setItem(idx, 3, QTableWidgetItem(s.vibes))
+    def _current_row(self):
+        index = self.table.currentIndex()
+        return index.row() if index.isValid() else -1
 
     # -------------------------------------------------------------
     # ADD SONG
@@ -119,7 +115,7 @@ class AdminWindow(QMainWindow):
     # EDIT SONG
     # -------------------------------------------------------------
     def _edit_song(self):
-        row = self.table.currentRow()
+        row = self._current_row()
         if row < 0:
             QMessageBox.warning(self, "Error", "Pilih lagu yang ingin diedit.")
             return
@@ -142,7 +138,7 @@ class AdminWindow(QMainWindow):
 
         # Isi data lama saat edit
         if mode == "edit":
-            old = self.song_controller.get_song_at(index)
+            old = self.table_model.song_at(index)
             inp_judul.setText(old.judul)
             inp_artis.setText(old.artis)
             inp_genre.setText(old.genre)
@@ -176,19 +172,17 @@ class AdminWindow(QMainWindow):
             self.song_controller.update_song(index, judul.text(), artis.text(), genre.text(), vibes.text())
 
         dialog.close()
-        self._load_table()
 
     # -------------------------------------------------------------
     # DELETE SONG
     # -------------------------------------------------------------
     def _delete_song(self):
-        row = self.table.currentRow()
+        row = self._current_row()
         if row < 0:
             QMessageBox.warning(self, "Error", "Pilih lagu yang ingin dihapus.")
             return
 
         self.song_controller.delete_song(row)
-        self._load_table()
 
     # -------------------------------------------------------------
     # LOGOUT
@@ -199,6 +193,10 @@ class AdminWindow(QMainWindow):
         self.login = LoginWindow()
         self.login.show()
 
+    def closeEvent(self, event):
+        self.table_model.detach()
+        super().closeEvent(event)
+
 
 # ---- TEST ----
 if __name__ == "__main__":
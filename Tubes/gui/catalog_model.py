@@ -0,0 +1,106 @@
+# gui/catalog_model.py
+#
+# Baris katalog yang dimuat bertahap untuk model Qt (tabel admin, grid lagu).
+# Model tidak menyalin seluruh katalog: rowCount hanya sebanyak baris yang
+# sudah di-fetch (canFetchMore/fetchMore dipanggil view saat di-scroll ke
+# bawah), dan isi baris diambil lewat controller.get_song_at(row) dengan
+# cache kecil. Jumlah baris total dari controller.count().
+#
+# Controller mengirim event dari thread yang mengubah katalog (mis. import
+# di worker), jadi event diteruskan lewat signal: dari thread lain Qt
+# mengantrekannya ke thread GUI, dari thread GUI langsung dijalankan.
+
+from PyQt6.QtCore import QModelIndex, QObject, pyqtSignal
+
+from controllers.metrics import timed
+
+FETCH_SIZE = 200     # baris per fetchMore
+CACHE_ROWS = 1024    # Song yang di-cache sebelum cache dikosongkan
+
+
+class _CatalogBridge(QObject):
+    # (event, index, song) dari listener SongController
+    changed = pyqtSignal(str, object, object)
+
+
+class CatalogRowsMixin:
+    """
+    Bagian bersama model katalog lazy. Dipakai di depan class model Qt,
+    mis. class SongTableModel(CatalogRowsMixin, QAbstractTableModel).
+    Panggil _attach_catalog(controller) di __init__ dan detach() saat
+    view ditutup. LAST_COLUMN = kolom terakhir untuk dataChanged.
+    """
+
+    LAST_COLUMN = 0
+
+    def _attach_catalog(self, controller):
+        self.controller = controller
+        self._total = controller.count()
+        self._loaded = min(FETCH_SIZE, self._total)
+        self._cache = {}
+        self._bridge = _CatalogBridge(self)
+        self._bridge.changed.connect(self._on_catalog_changed)
+        # simpan callback-nya: remove_listener butuh objek yang sama
+        self._listener = self._bridge.changed.emit
+        controller.add_listener(self._listener)
+
+    def detach(self):
+        """Berhenti mendengarkan controller (panggil saat jendela ditutup)."""
+        self.controller.remove_listener(self._listener)
+
+    # ---------- Qt model API ----------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        n = min(FETCH_SIZE, self._total - self._loaded)
+        if parent.isValid() or n <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + n - 1)
+        self._loaded += n
+        self.endInsertRows()
+
+    def song_at(self, row):
+        if not 0 <= row < self._loaded:
+            return None
+        song = self._cache.get(row)
+        if song is None:
+            song = self.controller.get_song_at(row)
+            if song is not None:
+                if len(self._cache) >= CACHE_ROWS:
+                    self._cache.clear()
+                self._cache[row] = song
+        return song
+
+    # ---------- notifikasi controller ----------
+    @timed()
+    def _on_catalog_changed(self, event, index, song):
+        # posisi baris bergeser, jadi cache baris tidak bisa dipakai lagi
+        self._cache.clear()
+        if event in ("insert", "insert_range"):
+            n = 1 if event == "insert" else len(song)
+            old_total = self._total
+            self._total += n
+            # baris di luar bagian yang sudah di-fetch cukup menambah total
+            if index < self._loaded or self._loaded == old_total:
+                index = min(index, self._loaded)
+                self.beginInsertRows(QModelIndex(), index, index + n - 1)
+                self._loaded += n
+                self.endInsertRows()
+        elif event == "update":
+            if index < self._loaded:
+                self.dataChanged.emit(self.index(index, 0), self.index(index, self.LAST_COLUMN))
+        elif event == "remove":
+            self._total -= 1
+            if index < self._loaded:
+                self.beginRemoveRows(QModelIndex(), index, index)
+                self._loaded -= 1
+                self.endRemoveRows()
+        else:
+            self.beginResetModel()
+            self._total = self.controller.count()
+            self._loaded = min(max(self._loaded, FETCH_SIZE), self._total)
+            self.endResetModel()
@@ -9,7 +9,6 @@ from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QFont
 
 from controllers.auth import check_login
-from controllers.shared import shared_song_controller
 
 
 class LoginPopup(QFrame):
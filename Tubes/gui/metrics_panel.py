@@ -0,0 +1,51 @@
+# gui/metrics_panel.py
+#
+# Panel kecil yang menampilkan controllers.metrics.report() secara live.
+# Hanya dibuka kalau TUBES_METRICS aktif.
+
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QMessageBox
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFont
+
+from controllers import metrics
+
+REFRESH_MS = 1000
+
+
+class MetricsPanel(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Metrics")
+        self.resize(820, 480)
+
+        v = QVBoxLayout(self)
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setFont(QFont("Courier New", 9))
+        v.addWidget(self.text)
+
+        h = QHBoxLayout()
+        btn_reset = QPushButton("Reset")
+        btn_reset.clicked.connect(self._reset)
+        btn_dump = QPushButton("Simpan ke file")
+        btn_dump.clicked.connect(self._dump)
+        h.addStretch()
+        h.addWidget(btn_reset)
+        h.addWidget(btn_dump)
+        v.addLayout(h)
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(REFRESH_MS)
+        self.refresh()
+
+    def refresh(self):
+        self.text.setPlainText(metrics.report())
+
+    def _reset(self):
+        metrics.reset()
+        self.refresh()
+
+    def _dump(self):
+        path = metrics.dump()
+        QMessageBox.information(self, "Metrics", f"Metrics disimpan ke {path}")
@@ -3,10 +3,11 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QLabel,
     QFrame, QScrollArea, QGridLayout
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QCursor
 
-from controllers.shared import shared_song_controller
+from controllers.shared import get_song_controller
+from controllers.metrics import timed
 from structures.double_linked_list import DoubleLinkedList
 from structures.song import Song
 
@@ -23,9 +24,13 @@ class PlaylistWindow(QWidget):
         super().__init__(parent)
 
         self.active_playlist = dll_playlist
-        self.controller = shared_song_controller
+        self.controller = get_song_controller()
         self.on_playlist_updated = on_playlist_updated
 
+        # node playlist -> widget baris, supaya tambah/hapus cukup ubah satu baris
+        self._rows = {}
+        self._renumber_from = None
+
         # Window settings
         self.setWindowTitle("Playlist Manager")
         self.setGeometry(220, 120, 1000, 700)
@@ -114,6 +119,7 @@ class PlaylistWindow(QWidget):
         songs = self.controller.search(keyword) if keyword else self.controller.get_all_songs()
         self._load_search_results(songs)
 
+    @timed()
     def _load_search_results(self, songs):
         # Clear previous grid
         for i in reversed(range(self.search_results_grid.count())):
@@ -170,6 +176,7 @@ class PlaylistWindow(QWidget):
     # ==============================================================
     # PLAYLIST CONTENT LOGIC
     # ==============================================================
+    @timed()
     def _load_playlist_content(self, dll: DoubleLinkedList):
         # clear
         for i in reversed(range(self.playlist_vbox.count())):
@@ -177,12 +184,12 @@ class PlaylistWindow(QWidget):
             if w:
                 w.deleteLater()
 
+        self._rows = {}
         node = dll.head
         index = 1
 
         while node:
-            song = node.data
-            item = self._playlist_item(index, song)
+            item = self._playlist_item(index, node)
             self.playlist_vbox.addWidget(item)
 
             index += 1
@@ -190,7 +197,29 @@ class PlaylistWindow(QWidget):
 
         self.playlist_vbox.addStretch()
 
-    def _playlist_item(self, index, song: Song):
+    def _schedule_renumber(self, start):
+        # nomor urut diperbarui belakangan, sekali untuk beberapa perubahan
+        if self._renumber_from is None:
+            QTimer.singleShot(0, self._renumber)
+            self._renumber_from = start
+        else:
+            self._renumber_from = min(self._renumber_from, start)
+
+    @timed()
+    def _renumber(self):
+        start, self._renumber_from = self._renumber_from, None
+        if start is None:
+            return
+        # item terakhir di layout adalah stretch
+        for pos in range(start, self.playlist_vbox.count() - 1):
+            w = self.playlist_vbox.itemAt(pos).widget()
+            if w is not None and hasattr(w, "lbl_no"):
+                text = f"{pos + 1}."
+                if w.lbl_no.text() != text:
+                    w.lbl_no.setText(text)
+
+    def _playlist_item(self, index, node):
+        song = node.data
         frame = QFrame()
         frame.setStyleSheet("""
             QFrame { background:#2b2b2b; border-radius:6px; }
@@ -202,15 +231,16 @@ class PlaylistWindow(QWidget):
         lbl_no = QLabel(f"{index}.")
         lbl_no.setFixedWidth(30)
         h.addWidget(lbl_no)
+        frame.lbl_no = lbl_no
 
         info = QLabel(f"<b>{song.judul}</b> - {song.artis}")
         h.addWidget(info)
         h.addStretch()
 
         # PLAY BUTTON
-        btn_play = QPushButton("▶️")`
+        btn_play = QPushButton("▶️")
         btn_play.setFixedWidth(40)
-        btn_play.setStyleSheet("background:#1db954; bo`rder-radius:5px;")
+        btn_play.setStyleSheet("background:#1db954; border-radius:5px;")
         btn_play.clicked.connect(lambda _, s=song: self._play_and_close(s))
         h.addWidget(btn_play)
 
@@ -218,23 +248,33 @@ class PlaylistWindow(QWidget):
         btn_remove = QPushButton("🗑")
         btn_remove.setFixedWidth(35)
         btn_remove.setStyleSheet("background:#444; border-radius:5px;")
-        btn_remove.clicked.connect(lambda _, s=song: self._remove_song(s))
+        btn_remove.clicked.connect(lambda _, n=node: self._remove_song(n))
         h.addWidget(btn_remove)
 
+        self._rows[node] = frame
         return frame
 
     # ==============================================================
     # BUTTON ACTIONS
     # ==============================================================
     def _add_song_to_playlist(self, song: Song):
-        self.active_playlist.add_last(song)
-        self._load_playlist_content(self.active_playlist)
+        node = self.active_playlist.add_last(song)
+        item = self._playlist_item(self.active_playlist.size, node)
+        # sisipkan sebelum stretch di akhir layout
+        self.playlist_vbox.insertWidget(self.playlist_vbox.count() - 1, item)
         self.on_playlist_updated()
         print(f"[Playlist] Added: {song.judul}")
 
-    def _remove_song(self, song: Song):
-        self.active_playlist.remove_by_data(song)
-        self._load_playlist_content(self.active_playlist)
+    def _remove_song(self, node):
+        song = node.data
+        if not self.active_playlist.remove_node(node):
+            return
+        frame = self._rows.pop(node, None)
+        if frame is not None:
+            pos = self.playlist_vbox.indexOf(frame)
+            self.playlist_vbox.removeWidget(frame)
+            frame.deleteLater()
+            self._schedule_renumber(pos)
         self.on_playlist_updated()
         print(f"[Playlist] Removed: {song.judul}")
 
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
+from controllers.metrics import timed
 from structures.queue import Queue
 from structures.song import Song
 
@@ -51,6 +52,7 @@ class QueueWindow(QWidget):
     # -------------------------
     # Buat ulang daftar lagu
     # -------------------------
+    @timed()
     def refresh_queue_ui(self):
         # hapus semua widget dulu
         while self.song_list_layout.count():
@@ -58,16 +60,18 @@ class QueueWindow(QWidget):
             if item.widget():
                 item.widget().deleteLater()
 
-        songs = self.queue_data.to_list()  # Queue -> list
-        for index, song in enumerate(songs):
+        for index, node in enumerate(self.queue_data.nodes()):
             is_now_playing = (index == 0)
-            card = self.create_song_card(song, is_now_playing)
+            card = self.create_song_card(node, is_now_playing)
             self.song_list_layout.addWidget(card)
 
     # -------------------------
     # Buat card lagu
     # -------------------------
-    def create_song_card(self, song: Song, is_now_playing=False):
+    def create_song_card(self, node, is_now_playing=False):
+        # node = handle antrian; tombol bekerja pada entri ini, bukan
+        # kemunculan pertama lagu yang sama
+        song: Song = node.data
         frame = QWidget()
         frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         frame.setFixedHeight(80)
@@ -99,14 +103,14 @@ class QueueWindow(QWidget):
             # Hapus
             btn_delete = QPushButton("🗑️")
             btn_delete.setFixedSize(35, 35)
-            btn_delete.clicked.connect(lambda _, s=song: self.remove_song(s))
+            btn_delete.clicked.connect(lambda _, n=node: self.remove_song(n))
             layout.addWidget(btn_delete)
 
             # Putar selanjutnya
             btn_next = QPushButton("⏭️")
             btn_next.setFixedSize(35, 35)
             btn_next.setStyleSheet("color: #1ED760;")
-            btn_next.clicked.connect(lambda _, s=song: self.move_song_next(s))
+            btn_next.clicked.connect(lambda _, n=node: self.move_song_next(n))
             layout.addWidget(btn_next)
 
         return frame
@@ -114,43 +118,21 @@ class QueueWindow(QWidget):
     # -------------------------
     # Hapus lagu dari queue
     # -------------------------
-    def remove_song(self, song: Song):
-        temp = []
-        removed = False
-        while not self.queue_data.is_empty():
-            s = self.queue_data.dequeue()
-            if s == song and not removed:
-                removed = True
-                continue
-            temp.append(s)
-        for s in temp:
-            self.queue_data.enqueue(s)
+    def remove_song(self, node):
+        self.queue_data.remove(node)
         self.refresh_queue_ui()
 
     # -------------------------
     # Pindahkan lagu ke posisi Putar Selanjutnya
     # -------------------------
-    def move_song_next(self, song: Song):
-        temp = []
-        moved = False
-        # simpan lagu pertama (sedang diputar)
-        first_song = self.queue_data.dequeue() if not self.queue_data.is_empty() else None
-
-        while not self.queue_data.is_empty():
-            s = self.queue_data.dequeue()
-            if s == song and not moved:
-                temp.insert(0, s)  # taruh setelah lagu pertama
-                moved = True
-            else:
-                temp.append(s)
-
-        if first_song:
-            self.queue_data.enqueue(first_song)
-        for s in temp:
-            self.queue_data.enqueue(s)
+    def move_song_next(self, node):
+        # lagu pertama (sedang diputar) tetap di depan
+        first = self.queue_data.head
+        if first is not None and first is not node:
+            self.queue_data.move_after(node, first)
 
         self.refresh_queue_ui()
 
         # Opsional: langsung putar lagu selanjutnya
         if self.play_callback:
-            self.play_callback(song)
\ No newline at end of file
+            self.play_callback(node.data)
\ No newline at end of file
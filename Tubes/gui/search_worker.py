@@ -0,0 +1,149 @@
+# gui/search_worker.py
+#
+# Menjalankan pencarian dan autocomplete di QThreadPool supaya thread UI
+# tetap bebas melukis selama query men-scan katalog besar (atau menunggu
+# write lock controller yang sedang dipegang import).
+#
+# Setiap submit()/complete() mendapat nomor generasi dan CancelToken baru;
+# token permintaan sebelumnya langsung dibatalkan, dan hasil dari generasi
+# lama diabaikan walau sempat selesai. Hasil dikirim lewat signal, jadi
+# slot penerima selalu jalan di thread UI.
+
+import time
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from controllers import metrics
+from controllers.cancel import CancelToken, SearchCancelled
+
+# cukup 2 thread: query lama segera berhenti begitu dibatalkan
+MAX_SEARCH_THREADS = 2
+
+
+class _SearchSignals(QObject):
+    # (generasi, hasil atau None kalau dibatalkan/gagal, pesan error)
+    finished = pyqtSignal(int, object, str)
+
+
+class _Task(QRunnable):
+    """Dasar SearchTask/CompletionTask: jalankan work() lalu kirim hasilnya."""
+
+    def __init__(self, generation, keyword, session, cancel):
+        super().__init__()
+        self.setAutoDelete(False)     # umur objek diatur SearchRunner
+        self.generation = generation
+        self.keyword = keyword
+        self.session = session
+        self.cancel = cancel
+        self.signals = _SearchSignals()
+
+    def work(self):
+        raise NotImplementedError
+
+    def run(self):
+        result, error = None, ""
+        start = time.perf_counter()
+        try:
+            result = self.work()
+            self.cancel.check()
+        except SearchCancelled:
+            result = None
+        except Exception as e:
+            result, error = None, str(e)
+        if metrics.ENABLED:
+            # waktu kerja di worker (bukan hanya waktu submit di thread UI)
+            metrics.record(f"{type(self).__name__}.run", time.perf_counter() - start,
+                           len(result) if result is not None else None)
+        self.signals.finished.emit(self.generation, result, error)
+
+
+class SearchTask(_Task):
+    def work(self):
+        songs = self.session.query(self.keyword, cancel=self.cancel)
+        if not songs and self.keyword:
+            # pencarian persis kosong (mis. typo): pakai pencarian fuzzy
+            songs = self.session.controller.fuzzy_search(self.keyword, cancel=self.cancel)
+        return songs
+
+
+class CompletionTask(_Task):
+    def work(self):
+        self.cancel.check()
+        return self.session.controller.autocomplete(self.keyword)
+
+
+class SearchRunner(QObject):
+    """
+    Antrian pencarian untuk satu kotak search. resultsReady hanya
+    dipancarkan untuk query TERBARU, completionsReady untuk autocomplete
+    terbaru; failed untuk error di worker.
+    """
+
+    resultsReady = pyqtSignal(object)       # list[Song]
+    completionsReady = pyqtSignal(object)   # list[str]
+    failed = pyqtSignal(str)
+
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(MAX_SEARCH_THREADS)
+        self._generation = 0
+        self._cancel = None
+        self._completion_generation = 0
+        self._completion_cancel = None
+        self._tasks = {}      # (jenis, generasi) -> task yang masih jalan
+
+    def _start(self, kind, task, slot):
+        task.signals.finished.connect(slot)
+        self._tasks[(kind, task.generation)] = task
+        self._pool.start(task)
+
+    def submit(self, keyword):
+        self.cancel()
+        self._generation += 1
+        self._cancel = CancelToken()
+        task = SearchTask(self._generation, keyword, self.session, self._cancel)
+        self._start("search", task, self._on_finished)
+        return self._generation
+
+    def complete(self, prefix):
+        """Minta saran autocomplete untuk prefix (hasil lewat completionsReady)."""
+        if self._completion_cancel is not None:
+            self._completion_cancel.cancel()
+        self._completion_generation += 1
+        self._completion_cancel = CancelToken()
+        task = CompletionTask(self._completion_generation, prefix, self.session, self._completion_cancel)
+        self._start("complete", task, self._on_completed)
+        return self._completion_generation
+
+    def cancel(self):
+        """Batalkan query yang sedang jalan (mis. begitu ada ketikan baru)."""
+        # hasil yang sempat terkirim sebelum dibatalkan ikut jadi basi
+        self._generation += 1
+        if self._cancel is not None:
+            self._cancel.cancel()
+            self._cancel = None
+
+    def shutdown(self, timeout_ms=1000):
+        self.cancel()
+        if self._completion_cancel is not None:
+            self._completion_cancel.cancel()
+            self._completion_cancel = None
+        self._pool.clear()
+        self._pool.waitForDone(timeout_ms)
+
+    def _on_finished(self, generation, songs, error):
+        self._tasks.pop(("search", generation), None)
+        if generation != self._generation:
+            return    # hasil query lama: abaikan
+        if error:
+            self.failed.emit(error)
+        elif songs is not None:
+            self.resultsReady.emit(songs)
+
+    def _on_completed(self, generation, words, error):
+        self._tasks.pop(("complete", generation), None)
+        if generation != self._completion_generation or error or words is None:
+            return    # saran basi atau gagal: dropdown lama dibiarkan
+        self.completionsReady.emit(words)
@@ -0,0 +1,190 @@
+# gui/song_grid.py
+#
+# Grid kartu lagu versi model/view: QListView (IconMode) + model + delegate.
+# Kartu dilukis oleh delegate, jadi hanya baris yang terlihat yang diproses;
+# tidak ada QFrame/QLabel/QPushButton per lagu seperti grid lama.
+
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QEvent, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter
+
+from controllers.metrics import timed
+from gui.catalog_model import CatalogRowsMixin
+
+SongRole = Qt.ItemDataRole.UserRole + 1
+
+CARD_W, CARD_H = 260, 220
+CARD_SPACING = 24
+CARD_MARGIN = 12
+
+
+def _song_data(song, role):
+    if song is None:
+        return None
+    if role == SongRole:
+        return song
+    if role == Qt.ItemDataRole.DisplayRole:
+        return song.judul
+    if role == Qt.ItemDataRole.ToolTipRole:
+        return str(song)
+    return None
+
+
+class SongListModel(QAbstractListModel):
+    """Model list lagu (hasil search / playlist) untuk SongGridView."""
+
+    def __init__(self, songs=(), parent=None):
+        super().__init__(parent)
+        self._songs = list(songs)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._songs)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        return _song_data(self._songs[index.row()], role)
+
+    def set_songs(self, songs):
+        self.beginResetModel()
+        self._songs = songs if isinstance(songs, list) else list(songs)
+        self.endResetModel()
+
+    def song_at(self, row):
+        return self._songs[row] if 0 <= row < len(self._songs) else None
+
+
+class CatalogListModel(CatalogRowsMixin, QAbstractListModel):
+    """
+    Seluruh katalog untuk SongGridView tanpa menyalinnya: baris dimuat
+    bertahap saat grid di-scroll (lihat gui/catalog_model.py).
+    """
+
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self._attach_catalog(controller)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        return _song_data(self.song_at(index.row()), role)
+
+
+class SongCardDelegate(QStyledItemDelegate):
+    """
+    Melukis satu kartu lagu dan menangani klik tombol Play / Antrian / Favorit
+    dengan hit-test area tombol (tidak ada widget tombol sungguhan).
+    """
+
+    playRequested = pyqtSignal(object)
+    queueRequested = pyqtSignal(object)
+    favoriteRequested = pyqtSignal(object)
+
+    def __init__(self, is_favorite=None, parent=None):
+        super().__init__(parent)
+        self.is_favorite = is_favorite or (lambda song: False)
+        self._title_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._small_font = QFont("Arial", 9)
+
+    # ---------- geometri ----------
+    @staticmethod
+    def _card_rect(option_rect):
+        return QRect(option_rect.x() + CARD_SPACING // 2, option_rect.y() + CARD_SPACING // 2,
+                     CARD_W, CARD_H)
+
+    @staticmethod
+    def _button_rects(card):
+        m = CARD_MARGIN
+        y = card.bottom() - m - 32
+        fav = QRect(card.right() - m - 40, y, 40, 32)
+        queue = QRect(fav.left() - 6 - 120, y, 120, 32)
+        play = QRect(card.left() + m, y, queue.left() - 6 - card.left() - m, 32)
+        return {"play": play, "queue": queue, "fav": fav}
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_W + CARD_SPACING, CARD_H + CARD_SPACING)
+
+    # ---------- paint ----------
+    @timed()
+    def paint(self, painter, option, index):
+        song = index.data(SongRole)
+        if song is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        card = self._card_rect(option.rect)
+        hover = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.setBrush(QColor("#1f1f1f" if hover else "#161616"))
+        painter.drawRoundedRect(card, 12, 12)
+
+        m = CARD_MARGIN
+        img = QRect(card.left() + m, card.top() + m, CARD_W - 2 * m, 100)
+        painter.setBrush(QColor("#2b2b2b"))
+        painter.drawRoundedRect(img, 8, 8)
+        painter.setPen(QColor("#e9e9e9"))
+        painter.drawText(img, Qt.AlignmentFlag.AlignCenter, "💿  [ALBUM]")
+
+        text_w = CARD_W - 2 * m
+        painter.setFont(self._title_font)
+        painter.setPen(QColor("#ffffff"))
+        title = painter.fontMetrics().elidedText(song.judul, Qt.TextElideMode.ElideRight, text_w)
+        painter.drawText(QRect(card.left() + m, img.bottom() + 14, text_w, 20),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+
+        painter.setFont(self._small_font)
+        painter.setPen(QColor("#bdbdbd"))
+        artist = painter.fontMetrics().elidedText(song.artis, Qt.TextElideMode.ElideRight, text_w)
+        painter.drawText(QRect(card.left() + m, img.bottom() + 36, text_w, 16),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, artist)
+
+        buttons = self._button_rects(card)
+        labels = {
+            "play": "▶️ Play",
+            "queue": "➕ Tambah ke Antrian",
+            "fav": "♥" if self.is_favorite(song) else "♡",
+        }
+        for name, rect in buttons.items():
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#1db954" if name == "play" else "#2e2e2e"))
+            painter.drawRoundedRect(rect, 8 if name == "play" else 12, 8 if name == "play" else 12)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, labels[name])
+
+        painter.restore()
+
+    # ---------- klik ----------
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            song = index.data(SongRole)
+            pos = event.position().toPoint()
+            for name, rect in self._button_rects(self._card_rect(option.rect)).items():
+                if rect.contains(pos):
+                    signal = {
+                        "play": self.playRequested,
+                        "queue": self.queueRequested,
+                        "fav": self.favoriteRequested,
+                    }[name]
+                    signal.emit(song)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+
+class SongGridView(QListView):
+    """QListView mode ikon dengan ukuran item seragam (layout & scroll murah)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(256)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setMouseTracking(True)
+        self.setStyleSheet("border: none;")
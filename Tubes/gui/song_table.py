@@ -0,0 +1,38 @@
+# gui/song_table.py
+#
+# Model tabel katalog untuk AdminWindow. Model mendengarkan notifikasi
+# baris dari SongController (insert/update/remove) sehingga satu edit
+# hanya menyentuh satu baris, bukan membangun ulang seluruh tabel.
+# Baris dimuat bertahap saat tabel di-scroll (lihat gui/catalog_model.py),
+# jadi membuka tabel tidak menyalin seluruh katalog.
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from gui.catalog_model import CatalogRowsMixin
+
+COLUMNS = [("judul", "Judul"), ("artis", "Artis"), ("genre", "Genre"), ("vibes", "Vibes")]
+
+
+class SongTableModel(CatalogRowsMixin, QAbstractTableModel):
+    LAST_COLUMN = len(COLUMNS) - 1
+
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self._attach_catalog(controller)
+
+    # ---------- Qt model API ----------
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        song = self.song_at(index.row())
+        return getattr(song, COLUMNS[index.column()][0]) if song is not None else None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section][1]
+        return str(section + 1)
@@ -3,16 +3,21 @@ import sys
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QLabel,
-    QFrame, QScrollArea, QGridLayout, QApplication, QSizePolicy, QMessageBox,
-    QListWidget, QListWidgetItem, QAbstractItemView
+    QFrame, QApplication, QMessageBox, QStackedWidget,
+    QListWidget, QListWidgetItem, QAbstractItemView, QCompleter
 )
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QStringListModel, QTimer
 from PyQt6.QtGui import QFont
 
-from controllers.shared import shared_song_controller
+from controllers import metrics
+from controllers.metrics import timed
+from controllers.search_session import SearchSession
+from controllers.shared import get_song_controller
+from gui.search_worker import SearchRunner
+from gui.song_grid import CatalogListModel, SongListModel, SongCardDelegate, SongGridView
 from structures.double_linked_list import DoubleLinkedList
-from structures.stack import Stack
+from structures.stack import HistoryStack
 from structures.queue import Queue
 from structures.song import Song
 
@@ -35,6 +40,9 @@ DARK_STYLE = """
     QLabel#title {
         color: #ffffff;
     }
+    QLabel#searchHint {
+        color: #9a9a9a;
+    }
     QPushButton.play {
         background-color: #1db954;
         color: white;
@@ -57,6 +65,12 @@ DARK_STYLE = """
     }
 """
 
+# jumlah maksimum entri riwayat putar yang disimpan
+HISTORY_CAPACITY = 200
+
+# jeda (ms) setelah ketikan terakhir sebelum pencarian dijalankan
+SEARCH_DEBOUNCE_MS = 150
+
 # --------------------------
 # UserWindow
 # --------------------------
@@ -67,19 +81,20 @@ class UserWindow(QWidget):
         self.setGeometry(120, 60, 1200, 780)
         self.setStyleSheet(DARK_STYLE)
 
-        self.controller = shared_song_controller
-        self.playlist = DoubleLinkedList()
+        self.controller = get_song_controller()
+        self.search_session = SearchSession(self.controller)
+        # pencarian jalan di thread pool; hasil query terbaru balik lewat signal
+        self.search_runner = SearchRunner(self.search_session, self)
+        self.search_runner.resultsReady.connect(self._on_search_results)
+        self.search_runner.failed.connect(self._on_search_failed)
+        self.search_runner.completionsReady.connect(self._on_completions)
+        self._playlist = None      # dibangun saat pertama dipakai (lihat property playlist)
         self.queue = Queue()       # antrian
-        self.history = Stack()
+        self.history = HistoryStack(HISTORY_CAPACITY, collapse_repeats=True)
 
-        self.favorites = set()
+        self.favorites = set()     # set of Song (hash berdasarkan Song.id)
         self.is_playing = False
 
-        all_songs = self.controller.get_all_songs()
-        for s in all_songs:
-            self.playlist.add_last(s)
-        self.playlist.current = None
-
         root = QHBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(0)
@@ -92,7 +107,7 @@ class UserWindow(QWidget):
         content_vbox.setContentsMargins(18, 18, 18, 8)
         content_vbox.setSpacing(12)
 
-        self.content = self._content_dashboard(all_songs)
+        self.content = self._content_dashboard()
         content_vbox.addWidget(self.content, 1)
 
         self.player_bar = self._player_bar()
@@ -100,6 +115,17 @@ class UserWindow(QWidget):
 
         root.addWidget(content_container, 1)
 
+    @property
+    def playlist(self):
+        # salinan katalog ke linked list baru dibuat saat pemutaran/playlist
+        # pertama kali dipakai, bukan saat jendela dibuka
+        if self._playlist is None:
+            self._playlist = DoubleLinkedList()
+            for s in self.controller.get_all_songs():
+                self._playlist.add_last(s)
+            self._playlist.current = None
+        return self._playlist
+
     # --------------------------
     # Sidebar
     # --------------------------
@@ -126,6 +152,8 @@ class UserWindow(QWidget):
             ("❤️ Favorites", self._open_favorites_window),
             ("⏳ History", self._open_history_window),
         ]
+        if metrics.ENABLED:
+            items.append(("📊 Metrics", self._open_metrics_panel))
         for txt, func in items:
             btn = QPushButton(txt)
             btn.setStyleSheet("text-align:left; font-size:14px; color:#bdbdbd; padding:6px; background:none; border:none;")
@@ -138,7 +166,8 @@ class UserWindow(QWidget):
     # --------------------------
     # Content dashboard
     # --------------------------
-    def _content_dashboard(self, initial_songs):
+    @timed()
+    def _content_dashboard(self):
         content = QFrame()
         v = QVBoxLayout(content)
         v.setContentsMargins(8, 8, 8, 8)
@@ -150,6 +179,19 @@ class UserWindow(QWidget):
         self.search_input.setMinimumHeight(36)
         self.search_input.textChanged.connect(self._on_search_text)
 
+        # ketikan beruntun digabung: pencarian baru jalan setelah user berhenti mengetik
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._do_search)
+
+        # dropdown autocomplete judul/artis (diisi dari trie controller)
+        self._completer_model = QStringListModel(self)
+        completer = QCompleter(self._completer_model, self)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.search_input.setCompleter(completer)
+
         btn_search = QPushButton("Search")
         btn_search.setFixedWidth(100)
         btn_search.setProperty("class", "play")
@@ -159,6 +201,12 @@ class UserWindow(QWidget):
         search_layout.addWidget(btn_search)
         v.addLayout(search_layout)
 
+        # keterangan kalau hasil kosong tapi pencarian mirip belum mencakup seluruh katalog
+        self.lbl_search_hint = QLabel()
+        self.lbl_search_hint.setObjectName("searchHint")
+        self.lbl_search_hint.hide()
+        v.addWidget(self.lbl_search_hint)
+
         title_layout = QHBoxLayout()
         title_lbl = QLabel("🎧 Playlist")
         title_lbl.setFont(QFont("Arial", 20, QFont.Weight.Bold))
@@ -175,22 +223,37 @@ class UserWindow(QWidget):
         self.btn_repeat.setProperty("class", "icon")
         self.btn_repeat.clicked.connect(self._cycle_repeat)
 
+        self.btn_follow = QPushButton("Next: Semua")
+        self.btn_follow.setFixedWidth(120)
+        self.btn_follow.setProperty("class", "icon")
+        self.btn_follow.clicked.connect(self._cycle_follow)
+
         title_layout.addWidget(self.btn_shuffle)
         title_layout.addWidget(self.btn_repeat)
+        title_layout.addWidget(self.btn_follow)
         v.addLayout(title_layout)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("border: none;")
-        scroll_content = QFrame()
-        self.grid = QGridLayout(scroll_content)
-        self.grid.setContentsMargins(8, 8, 8, 8)
-        self.grid.setHorizontalSpacing(24)
-        self.grid.setVerticalSpacing(24)
-        scroll.setWidget(scroll_content)
-        v.addWidget(scroll, 1)
-
-        self._load_playlist_grid(initial_songs)
+        # halaman 0: grid kartu lagu (model/view), halaman 1: antrian
+        self.pages = QStackedWidget()
+
+        # katalog penuh dimuat bertahap dari controller; hasil search /
+        # playlist pakai model list biasa
+        self.catalog_model = CatalogListModel(self.controller, self)
+        self.song_model = SongListModel(parent=self)
+        self.card_delegate = SongCardDelegate(is_favorite=lambda s: s in self.favorites, parent=self)
+        self.card_delegate.playRequested.connect(self._play_song_from_card)
+        self.card_delegate.queueRequested.connect(self._add_to_queue)
+        self.card_delegate.favoriteRequested.connect(self._toggle_favorite)
+
+        self.song_view = SongGridView()
+        self.song_view.setItemDelegate(self.card_delegate)
+        self.pages.addWidget(self.song_view)
+
+        self.queue_list = self._queue_list_widget()
+        self.pages.addWidget(self.queue_list)
+        v.addWidget(self.pages, 1)
+
+        self._show_catalog()
         return content
 
     # --------------------------
@@ -236,99 +299,60 @@ class UserWindow(QWidget):
     # --------------------------
     # Grid & Card
     # --------------------------
+    @timed()
     def _load_playlist_grid(self, songs):
-        for i in reversed(range(self.grid.count())):
-            widget = self.grid.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-        MAX_COLS = 4
-        col = 0
-        row = 0
-
-        for s in songs:
-            card = self._song_card(s)
-            self.grid.addWidget(card, row, col)
-            col += 1
-            if col >= MAX_COLS:
-                col = 0
-                row += 1
-
-    def _song_card(self, song: Song):
-        frame = QFrame()
-        frame.setFixedSize(260, 220)
-        frame.setStyleSheet("""
-            QFrame {
-                background-color: #161616;
-                border-radius: 12px;
-            }
-            QFrame:hover {
-                background-color: #1f1f1f;
-            }
-        """)
+        # cukup ganti isi model; view hanya melukis kartu yang terlihat
+        self.lbl_search_hint.hide()
+        self.song_model.set_songs(songs)
+        self._set_grid_model(self.song_model)
 
-        v = QVBoxLayout(frame)
-        v.setContentsMargins(12, 12, 12, 12)
-        v.setSpacing(8)
-
-        img = QLabel("💿  [ALBUM]")
-        img.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        img.setFixedHeight(100)
-        img.setStyleSheet("background-color:#2b2b2b; border-radius:8px;")
-
-        title = QLabel(song.judul)
-        title.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        title.setStyleSheet("color: #ffffff;")
-
-        artist = QLabel(song.artis)
-        artist.setStyleSheet("color: #bdbdbd; font-size: 11px;")
-
-        btn_row = QHBoxLayout()
-        btn_play = QPushButton("▶️ Play")
-        btn_play.setProperty("class", "play")
-        btn_play.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        btn_play.clicked.connect(lambda _, s=song: self._play_song_from_card(s))
-
-        btn_q = QPushButton("➕ Tambah ke Antrian")
-        btn_q.setProperty("class", "icon")
-        btn_q.setFixedSize(120, 32)
-        btn_q.clicked.connect(lambda _, s=song: self._add_to_queue(s))
-
-        btn_fav = QPushButton("♡" if (song.judul, song.artis) not in self.favorites else "♥")
-        btn_fav.setProperty("class", "icon")
-        btn_fav.setFixedSize(40, 32)
-        btn_fav.clicked.connect(lambda _, b=btn_fav, s=song: self._toggle_favorite(b, s))
-
-        btn_row.addWidget(btn_play)
-        btn_row.addWidget(btn_q)
-        btn_row.addWidget(btn_fav)
-
-        v.addWidget(img)
-        v.addSpacing(6)
-        v.addWidget(title)
-        v.addWidget(artist)
-        v.addStretch()
-        v.addLayout(btn_row)
+    def _show_catalog(self):
+        self.lbl_search_hint.hide()
+        self._set_grid_model(self.catalog_model)
 
-        return frame
+    def _set_grid_model(self, model):
+        if self.song_view.model() is not model:
+            self.song_view.setModel(model)
+        self.pages.setCurrentWidget(self.song_view)
 
     # --------------------------
     # Search
     # --------------------------
     def _on_search_text(self, text):
-        songs = self.controller.get_all_songs() if text.strip() == "" else self.controller.search(text)
-        self._load_playlist_grid(songs)
+        self.search_runner.complete(text)  # saran autocomplete juga dari worker
+        self.search_runner.cancel()  # query lama sudah basi, hentikan sekarang
+        self._search_timer.start()   # restart debounce
 
     def _do_search(self):
-        key = self.search_input.text().strip()
-        songs = self.controller.search(key) if key else self.controller.get_all_songs()
+        self._search_timer.stop()
+        keyword = self.search_input.text().strip()
+        if not keyword:
+            # kotak kosong: kembali ke katalog lazy, tanpa query
+            self.search_runner.cancel()
+            self._show_catalog()
+            return
+        # fallback ke pencarian fuzzy (kalau hasil kosong) juga dilakukan di worker
+        self.search_runner.submit(keyword)
+
+    def _on_completions(self, words):
+        self._completer_model.setStringList(words)
+
+    def _on_search_results(self, songs):
         self._load_playlist_grid(songs)
+        # pencarian mirip (typo) hanya mencakup lagu yang sudah dimuat dari store
+        if not songs and not self.controller.is_fully_loaded():
+            self.lbl_search_hint.setText(
+                "Tidak ada hasil. Pencarian mirip (typo) hanya mencakup lagu yang sudah dimuat.")
+            self.lbl_search_hint.show()
+
+    def _on_search_failed(self, message):
+        QMessageBox.warning(self, "Search", f"Pencarian gagal: {message}")
 
     # --------------------------
     # Sidebar actions
     # --------------------------
     def _action_home(self):
-        self._load_playlist_grid(self.controller.get_all_songs())
+        self._show_catalog()
 
     def _action_search(self):
         self.search_input.setFocus()
@@ -339,17 +363,11 @@ class UserWindow(QWidget):
     # --------------------------
     # Antrian
     # --------------------------
-    def _show_queue_content(self):
-        # Kosongkan grid
-        for i in reversed(range(self.grid.count())):
-            widget = self.grid.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
+    def _queue_list_widget(self):
         # QListWidget untuk antrian
-        self.queue_list = QListWidget()
-        self.queue_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
-        self.queue_list.setStyleSheet("""
+        queue_list = QListWidget()
+        queue_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        queue_list.setStyleSheet("""
             QListWidget {
                 background-color: #161616;
                 color: #e9e9e9;
@@ -363,28 +381,38 @@ class UserWindow(QWidget):
                 background-color: #1db954;
             }
         """)
+        # drag & drop: terapkan perpindahan langsung ke Queue (relink O(1))
+        queue_list.model().rowsMoved.connect(self._on_queue_rows_moved)
+        return queue_list
 
+    @timed()
+    def _show_queue_content(self):
         # Masukkan item antrian
-        temp = []
-        while not self.queue.is_empty():
-            s = self.queue.dequeue()
-            temp.append(s)
-            self.queue_list.addItem(f"{s.judul} - {s.artis}")
-        for s in temp:
-            self.queue.enqueue(s)
-
-        self.grid.addWidget(self.queue_list, 0, 0)
-
-    def _update_queue_order(self):
-        new_queue = Queue()
-        for i in range(self.queue_list.count()):
-            text = self.queue_list.item(i).text()
-            judul, artis = text.split(" - ")
-            for song in self.playlist.to_list():
-                if song.judul == judul and song.artis == artis:
-                    new_queue.enqueue(song)
-                    break
-        self.queue = new_queue
+        self.queue_list.clear()
+        for node in self.queue.nodes():
+            s = node.data
+            item = QListWidgetItem(f"{s.judul} - {s.artis}")
+            # simpan handle antrian: duplikat lagu tetap entri yang berbeda
+            item.setData(Qt.ItemDataRole.UserRole, node)
+            self.queue_list.addItem(item)
+
+        self.pages.setCurrentWidget(self.queue_list)
+
+    def _queue_node_at(self, row):
+        item = self.queue_list.item(row)
+        if item is None:
+            return None
+        return item.data(Qt.ItemDataRole.UserRole)
+
+    def _on_queue_rows_moved(self, parent, start, end, dest_parent, dest_row):
+        # posisi baru baris yang dipindah (dest_row memakai index sebelum pindah)
+        count = end - start + 1
+        new_start = dest_row if dest_row < start else dest_row - count
+        for row in range(new_start, new_start + count):
+            node = self._queue_node_at(row)
+            anchor = self._queue_node_at(row - 1) if row > 0 else None
+            if node is not None:
+                self.queue.move_after(node, anchor)
 
     def _add_to_queue(self, song):
         self.queue.enqueue(song)
@@ -394,33 +422,30 @@ class UserWindow(QWidget):
     # Riwayat / Favorit
     # --------------------------
     def _open_history_window(self):
-        items = []
-        temp = Stack()
-        while not self.history.is_empty():
-            s = self.history.pop()
-            items.append(f"{s.judul} - {s.artis}")
-            temp.push(s)
-        while not temp.is_empty():
-            self.history.push(temp.pop())
+        items = [f"{s.judul} - {s.artis}" for s in self.history]
         text = "\n".join(items) if items else "Belum ada riwayat"
         QMessageBox.information(self, "History", text)
 
-    def _toggle_favorite(self, btn, song):
-        key = (song.judul, song.artis)
-        if key in self.favorites:
-            self.favorites.remove(key)
-            btn.setText("♡")
+    def _open_metrics_panel(self):
+        from gui.metrics_panel import MetricsPanel
+        self._metrics_panel = MetricsPanel(self)
+        self._metrics_panel.show()
+
+    def _toggle_favorite(self, song):
+        if song in self.favorites:
+            self.favorites.remove(song)
+            self.song_view.viewport().update()
             QMessageBox.information(self, "Favorites", f"'{song.judul}' dihapus dari favorit.")
         else:
-            self.favorites.add(key)
-            btn.setText("♥")
+            self.favorites.add(song)
+            self.song_view.viewport().update()
             QMessageBox.information(self, "Favorites", f"'{song.judul}' ditambahkan ke favorit.")
 
     def _open_favorites_window(self):
         if not self.favorites:
             QMessageBox.information(self, "Favorites", "Belum ada favorit.")
             return
-        lines = [f"{t[0]} - {t[1]}" for t in self.favorites]
+        lines = [f"{s.judul} - {s.artis}" for s in self.favorites]
         QMessageBox.information(self, "Favorites", "\n".join(lines))
 
     # --------------------------
@@ -446,13 +471,7 @@ class UserWindow(QWidget):
         self.lbl_now.setText(f"Now Playing: {song.judul} - {song.artis}")
         self.is_playing = True
         self.btn_play.setText("⏸️")
-        node = self.playlist.head
-        found = None
-        while node:
-            if node.data == song:
-                found = node
-                break
-            node = node.next
+        found = self.playlist.find_node(song)
         if not found:
             self.playlist.add_last(song)
             found = self.playlist.tail
@@ -495,6 +514,11 @@ class UserWindow(QWidget):
             return
         QMessageBox.information(self, "Info", "Tidak ada lagu sebelumnya.")
 
+    def closeEvent(self, event):
+        self.search_runner.shutdown()
+        self.catalog_model.detach()
+        super().closeEvent(event)
+
     # --------------------------
     # Shuffle / Repeat
     # --------------------------
@@ -510,6 +534,14 @@ class UserWindow(QWidget):
         txt = "Off" if nxt == 0 else ("All" if nxt == 1 else "One")
         self.btn_repeat.setText(f"Repeat: {txt}")
 
+    def _cycle_follow(self):
+        # Semua -> vibe sama -> genre sama -> Semua
+        modes = [(None, "Semua"), ("vibes", "Vibe Sama"), ("genre", "Genre Sama")]
+        cur = [m for m, _ in modes].index(self.playlist.follow_mode)
+        mode, label = modes[(cur + 1) % len(modes)]
+        self.playlist.set_follow_mode(mode)
+        self.btn_follow.setText(f"Next: {label}")
+
 # --------------------------
 # Run app standalone
 # --------------------------
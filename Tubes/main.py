@@ -3,15 +3,16 @@
 import sys
 from PyQt6.QtWidgets import QApplication
 
+from controllers import metrics
 from gui.login_window import LoginWindow
-from controllers.shared import shared_song_controller
-
-# --- optional: inisialisasi data awal (jika belum ada) ---
-from structures.song import Song
 
 # --- start aplikasi ---
 if __name__ == "__main__":
+    # TUBES_METRICS=1 mencatat waktu method controller/struktur data (lihat controllers/metrics.py)
+    metrics.install()
     app = QApplication(sys.argv)
     login = LoginWindow()
     login.show()
+    # katalog baru dibangun saat jendela user/admin pertama dibuka
+    # (get_song_controller() di jendela itu), bukan di thread UI saat login
     sys.exit(app.exec())
\ No newline at end of file
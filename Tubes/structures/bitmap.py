@@ -0,0 +1,237 @@
+import sys
+from array import array
+from bisect import bisect_left
+
+
+class Bitmap:
+    """
+    Bitset id lagu yang dipecah per chunk (mirip roaring bitmap sederhana).
+
+    _chunks : nomor chunk (id >> CHUNK_BITS) -> container bit id di chunk
+              itu, yang bisa diubah di tempat:
+              - array('H') terurut berisi bit bawah id selama isinya paling
+                banyak SPARSE_MAX (chunk jarang, 2 byte per id);
+              - array('Q') berisi WORDS word 64-bit (bitset penuh) kalau
+                lebih padat.
+    _card   : jumlah id di tiap chunk padat, supaya len() tanpa popcount.
+
+    Chunk kosong dibuang, jadi id yang jarang atau berjauhan tidak memakan
+    memori untuk bit nol. add/discard hanya menyentuh satu word atau satu
+    posisi array, bukan membangun ulang seluruh chunk. AND / OR cukup
+    memproses chunk yang ada di kedua / salah satu sisi; chunk padat
+    diproses sekaligus sebagai satu operasi int.
+    """
+
+    CHUNK_BITS = 16
+    _MASK = (1 << CHUNK_BITS) - 1
+    WORDS = (1 << CHUNK_BITS) // 64
+    SPARSE_MAX = 4096   # di atas ini array('H') lebih boros dari bitset 8 KB
+
+    __slots__ = ("_chunks", "_card")
+
+    def __init__(self, ids=()):
+        self._chunks = {}
+        self._card = {}
+        for i in ids:
+            self.add(i)
+
+    # ============================
+    # CONTAINER
+    # ============================
+    @classmethod
+    def _densify(cls, lows):
+        words = array("Q", bytes(8 * cls.WORDS))
+        for low in lows:
+            words[low >> 6] |= 1 << (low & 63)
+        return words
+
+    @staticmethod
+    def _sparsify(words):
+        lows = array("H")
+        for w, word in enumerate(words):
+            while word:
+                low = word & -word
+                lows.append((w << 6) + low.bit_length() - 1)
+                word ^= low
+        return lows
+
+    @classmethod
+    def _to_int(cls, cont):
+        words = cont if cont.typecode == "Q" else cls._densify(cont)
+        if sys.byteorder == "big":
+            words = array("Q", words)
+            words.byteswap()
+        return int.from_bytes(words.tobytes(), "little")
+
+    @classmethod
+    def _from_int(cls, bits):
+        words = array("Q", bits.to_bytes(8 * cls.WORDS, "little"))
+        if sys.byteorder == "big":
+            words.byteswap()
+        return words
+
+    def _put(self, c, cont, card):
+        # simpan container hasil operasi; padat hanya kalau memang perlu
+        if not card:
+            return
+        if cont.typecode == "Q":
+            if card <= self.SPARSE_MAX:
+                cont = self._sparsify(cont)
+            else:
+                self._card[c] = card
+        self._chunks[c] = cont
+
+    # ============================
+    # UPDATE
+    # ============================
+    def add(self, i):
+        c = i >> self.CHUNK_BITS
+        low = i & self._MASK
+        cont = self._chunks.get(c)
+        if cont is None:
+            self._chunks[c] = array("H", (low,))
+        elif cont.typecode == "H":
+            if not cont or cont[-1] < low:
+                cont.append(low)
+            else:
+                pos = bisect_left(cont, low)
+                if cont[pos] == low:
+                    return
+                cont.insert(pos, low)
+            if len(cont) > self.SPARSE_MAX:
+                self._chunks[c] = self._densify(cont)
+                self._card[c] = len(cont)
+        else:
+            bit = 1 << (low & 63)
+            if not cont[low >> 6] & bit:
+                cont[low >> 6] |= bit
+                self._card[c] += 1
+
+    def add_many(self, ids):
+        # kelompokkan per chunk dulu, lalu tiap chunk digabung sekali
+        by_chunk = {}
+        for i in ids:
+            by_chunk.setdefault(i >> self.CHUNK_BITS, []).append(i & self._MASK)
+        for c, lows in by_chunk.items():
+            cont = self._chunks.get(c)
+            if cont is not None and cont.typecode == "Q":
+                card = self._card[c]
+                for low in lows:
+                    bit = 1 << (low & 63)
+                    if not cont[low >> 6] & bit:
+                        cont[low >> 6] |= bit
+                        card += 1
+                self._card[c] = card
+                continue
+            merged = sorted(set(lows).union(cont)) if cont is not None else sorted(set(lows))
+            if len(merged) > self.SPARSE_MAX:
+                self._chunks[c] = self._densify(merged)
+                self._card[c] = len(merged)
+            else:
+                self._chunks[c] = array("H", merged)
+
+    def discard(self, i):
+        c = i >> self.CHUNK_BITS
+        low = i & self._MASK
+        cont = self._chunks.get(c)
+        if cont is None:
+            return
+        if cont.typecode == "H":
+            pos = bisect_left(cont, low)
+            if pos == len(cont) or cont[pos] != low:
+                return
+            del cont[pos]
+            if not cont:
+                del self._chunks[c]
+            return
+
+        bit = 1 << (low & 63)
+        if not cont[low >> 6] & bit:
+            return
+        cont[low >> 6] ^= bit
+        self._card[c] -= 1
+        # balik ke array jarang dengan jeda, supaya tidak bolak-balik konversi
+        if self._card[c] <= self.SPARSE_MAX // 2:
+            del self._card[c]
+            self._chunks[c] = self._sparsify(cont)
+            if not self._chunks[c]:
+                del self._chunks[c]
+
+    # ============================
+    # QUERY
+    # ============================
+    def __contains__(self, i):
+        cont = self._chunks.get(i >> self.CHUNK_BITS)
+        if cont is None:
+            return False
+        low = i & self._MASK
+        if cont.typecode == "H":
+            pos = bisect_left(cont, low)
+            return pos < len(cont) and cont[pos] == low
+        return bool(cont[low >> 6] >> (low & 63) & 1)
+
+    def __len__(self):
+        return sum(self._card[c] if cont.typecode == "Q" else len(cont)
+                   for c, cont in self._chunks.items())
+
+    def __bool__(self):
+        return bool(self._chunks)
+
+    def __iter__(self):
+        # id urut naik
+        for c in sorted(self._chunks):
+            base = c << self.CHUNK_BITS
+            cont = self._chunks[c]
+            if cont.typecode == "H":
+                for low in cont:
+                    yield base + low
+                continue
+            for w, word in enumerate(cont):
+                while word:
+                    low = word & -word
+                    yield base + (w << 6) + low.bit_length() - 1
+                    word ^= low
+
+    def __and__(self, other):
+        out = Bitmap()
+        small, big = sorted((self._chunks, other._chunks), key=len)
+        for c, a in small.items():
+            b = big.get(c)
+            if b is None:
+                continue
+            if a.typecode == "H" and b.typecode == "H":
+                both = array("H", sorted(set(a).intersection(b)))
+                out._put(c, both, len(both))
+            elif a.typecode == "H" or b.typecode == "H":
+                lows, words = (a, b) if a.typecode == "H" else (b, a)
+                both = array("H", (x for x in lows if words[x >> 6] >> (x & 63) & 1))
+                out._put(c, both, len(both))
+            else:
+                bits = self._to_int(a) & self._to_int(b)
+                out._put(c, self._from_int(bits), bits.bit_count())
+        return out
+
+    def __or__(self, other):
+        out = self.copy()
+        for c, b in other._chunks.items():
+            a = out._chunks.get(c)
+            if a is None:
+                out._put(c, array(b.typecode, b), other._card.get(c, len(b)))
+            elif a.typecode == "H" and b.typecode == "H":
+                merged = sorted(set(a).union(b))
+                if len(merged) > self.SPARSE_MAX:
+                    out._chunks[c] = self._densify(merged)
+                    out._card[c] = len(merged)
+                else:
+                    out._chunks[c] = array("H", merged)
+            else:
+                bits = self._to_int(a) | self._to_int(b)
+                out._chunks[c] = self._from_int(bits)
+                out._card[c] = bits.bit_count()
+        return out
+
+    def copy(self):
+        out = Bitmap()
+        out._chunks = {c: array(cont.typecode, cont) for c, cont in self._chunks.items()}
+        out._card = dict(self._card)
+        return out
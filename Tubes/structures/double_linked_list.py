@@ -1,9 +1,37 @@
+import sys
+
+from structures.shuffle import ShuffleOrder
+
+
 class DoubleLinkedList:
+    # field lagu -> prefix atribut node untuk rantai sekunder (lagu sejenis)
+    GROUPS = {"vibes": "vibe", "genre": "genre"}
+    # jarak label urutan antar node; sisipan di tengah mengambil titik
+    # tengah, jadi baru perlu relabel setelah ~32 sisipan di celah yang sama
+    ORDER_GAP = 1 << 32
+
     class _Node:
+        # __slots__: satu node per lagu, jadi hemat memori di katalog besar
+        __slots__ = ("data", "next", "prev", "key", "title_key", "owner", "order",
+                     "vibe_key", "vibe_prev", "vibe_next", "genre_key", "genre_prev", "genre_next")
+
         def __init__(self, data):
             self.data = data
             self.next = None
             self.prev = None
+            # diisi oleh _register: key index hash, key judul, token pemilik
+            self.key = None
+            self.title_key = None
+            self.owner = None
+            # label urutan: a sebelum b di list <=> a.order < b.order
+            self.order = 0
+            # rantai lagu dengan vibe / genre yang sama (urut sesuai list)
+            self.vibe_key = None
+            self.vibe_prev = None
+            self.vibe_next = None
+            self.genre_key = None
+            self.genre_prev = None
+            self.genre_next = None
 
     def __init__(self):
         self.head = None
@@ -14,6 +42,263 @@ class DoubleLinkedList:
         # --- FIX: inisialisasi repeat & shuffle supaya tidak error ---
         self.repeat_mode = 0   # 0 = none, 1 = all, 2 = one
         self.shuffle = False
+        self._shuffle_order = None   # ShuffleOrder, dibuat saat shuffle aktif
+        self.follow_mode = None      # None, "vibes" atau "genre" (next/prev lagu sejenis)
+
+        # --- index hash: data -> node dan judul (lower) -> node ---
+        # dipakai jump_to_song, remove dan search_by_title supaya O(1).
+        # Isinya node langsung; baru jadi list [node, ...] kalau key dobel.
+        self._index = {}
+        self._title_index = {}
+        # --- rantai sekunder: field -> {nilai (lower) -> [node kepala, node ekor]} ---
+        self._groups = {field: {} for field in self.GROUPS}
+        # token pemilik node; diganti saat clear() supaya handle lama tidak valid
+        self._owner = object()
+
+    # ============================
+    # INDEX (HASH) NODE
+    # ============================
+    @staticmethod
+    def _key(data):
+        # data yang tidak bisa di-hash (mis. dict) diindeks pakai id objeknya
+        try:
+            hash(data)
+            return data
+        except TypeError:
+            return ("__id__", id(data))
+
+    @staticmethod
+    def _title_key(data):
+        judul = getattr(data, "judul", None)
+        return judul.lower() if isinstance(judul, str) else None
+
+    @staticmethod
+    def _group_key(data, field):
+        # nilai vibe/genre berulang di banyak lagu: intern supaya satu string dipakai bersama
+        value = getattr(data, field, None)
+        return sys.intern(value.lower()) if isinstance(value, str) else None
+
+    def _group_pred(self, node, field, key, ends):
+        """
+        Anggota rantai terakhir sebelum node (None kalau node jadi kepala).
+        Dicari dari empat arah bergantian: mundur dan maju di list dari node,
+        serta dari kepala dan ekor rantai memakai label urutan. Biayanya
+        sebanding jarak ke anggota terdekat, bukan panjang rantai.
+        """
+        prefix = self.GROUPS[field]
+        key_attr, prev_attr, next_attr = prefix + "_key", prefix + "_prev", prefix + "_next"
+        order = node.order
+        back, fwd = node.prev, node.next
+        first, last = ends
+        while True:
+            if back is not None:
+                if getattr(back, key_attr) == key:
+                    return back
+                back = back.prev
+            if fwd is not None:
+                if getattr(fwd, key_attr) == key:
+                    return getattr(fwd, prev_attr)
+                fwd = fwd.next
+            if first is not None:
+                if first.order > order:
+                    return getattr(first, prev_attr)
+                first = getattr(first, next_attr)
+            if last is not None:
+                if last.order < order:
+                    return last
+                last = getattr(last, prev_attr)
+
+    def _group_link(self, node, field, at_end=False):
+        """
+        Sambungkan node ke rantai field-nya. O(1) kalau node ada di ujung
+        list; sisipan di tengah mencari tetangganya lewat _group_pred.
+        """
+        prefix = self.GROUPS[field]
+        key = self._group_key(node.data, field)
+        setattr(node, prefix + "_key", key)
+        if key is None:
+            return
+        ends = self._groups[field].get(key)
+        if ends is None:
+            self._groups[field][key] = [node, node]
+            return
+
+        if at_end or node.next is None:
+            pred = ends[1]
+        elif node.prev is None:
+            pred = None
+        else:
+            pred = self._group_pred(node, field, key, ends)
+        succ = getattr(pred, prefix + "_next") if pred is not None else ends[0]
+        setattr(node, prefix + "_prev", pred)
+        setattr(node, prefix + "_next", succ)
+        if pred is not None:
+            setattr(pred, prefix + "_next", node)
+        else:
+            ends[0] = node
+        if succ is not None:
+            setattr(succ, prefix + "_prev", node)
+        else:
+            ends[1] = node
+
+    def _group_unlink(self, node, field):
+        prefix = self.GROUPS[field]
+        key = getattr(node, prefix + "_key")
+        if key is None:
+            return
+        # O(1): cukup lewat pointer rantai, ujung rantai diperbarui kalau perlu
+        ends = self._groups[field][key]
+        pred = getattr(node, prefix + "_prev")
+        succ = getattr(node, prefix + "_next")
+        if pred is not None:
+            setattr(pred, prefix + "_next", succ)
+        else:
+            ends[0] = succ
+        if succ is not None:
+            setattr(succ, prefix + "_prev", pred)
+        else:
+            ends[1] = pred
+        if pred is None and succ is None:
+            del self._groups[field][key]
+        setattr(node, prefix + "_key", None)
+        setattr(node, prefix + "_prev", None)
+        setattr(node, prefix + "_next", None)
+
+    def _assign_order(self, node, at_end=False):
+        prev = node.prev
+        nxt = None if at_end else node.next
+        if prev is None and nxt is None:
+            node.order = 0
+        elif nxt is None:
+            node.order = prev.order + self.ORDER_GAP
+        elif prev is None:
+            node.order = nxt.order - self.ORDER_GAP
+        elif nxt.order - prev.order > 1:
+            node.order = (prev.order + nxt.order) // 2
+        else:
+            # celah habis: beri label baru ke seluruh list (jarang terjadi)
+            label = 0
+            cur = self.head
+            while cur:
+                cur.order = label
+                label += self.ORDER_GAP
+                cur = cur.next
+
+    @staticmethod
+    def _order_key(node):
+        return node.order
+
+    def sort_nodes(self, nodes):
+        """
+        Urutkan list node (handle) sesuai posisinya di list, di tempat.
+        Pakai label urutan (O(1) per perbandingan), tanpa menyusuri list.
+        """
+        nodes.sort(key=self._order_key)
+        return nodes
+
+    @staticmethod
+    def _bucket(index, key):
+        # semua node untuk key (tuple/list, urut), tanpa membedakan bentuk isi index
+        entry = index.get(key)
+        if entry is None:
+            return ()
+        return entry if type(entry) is list else (entry,)
+
+    @staticmethod
+    def _put(index, key, node, front=False):
+        entry = index.get(key)
+        if entry is None:
+            index[key] = node
+        elif type(entry) is list:
+            if front:
+                entry.insert(0, node)
+            else:
+                entry.append(node)
+        else:
+            index[key] = [node, entry] if front else [entry, node]
+
+    def _register(self, node, front=False, at_end=False):
+        node.owner = self._owner
+        self._assign_order(node, at_end)
+        node.key = self._key(node.data)
+        node.title_key = self._title_key(node.data)
+
+        self._put(self._index, node.key, node, front)
+        if node.title_key is not None:
+            self._put(self._title_index, node.title_key, node, front)
+
+        for field in self.GROUPS:
+            self._group_link(node, field, at_end)
+
+        if self._shuffle_order is not None:
+            self._shuffle_order.add(node)
+
+    @staticmethod
+    def _drop(index, key, node):
+        entry = index.get(key)
+        if entry is node:
+            del index[key]
+            return
+        if type(entry) is not list:
+            return
+        if entry[0] is node:
+            entry.pop(0)
+        else:
+            for i, n in enumerate(entry):
+                if n is node:
+                    del entry[i]
+                    break
+        if len(entry) == 1:
+            index[key] = entry[0]
+
+    def _unregister(self, node):
+        node.owner = None
+        if self._shuffle_order is not None:
+            self._shuffle_order.discard(node)
+        self._drop(self._index, node.key, node)
+        if node.title_key is not None:
+            self._drop(self._title_index, node.title_key, node)
+        for field in self.GROUPS:
+            self._group_unlink(node, field)
+
+    def reindex(self, data):
+        """
+        Perbarui index judul dan rantai vibe/genre setelah field lagu
+        diubah langsung (mis. lewat SongController.update_song).
+        """
+        for node in self._bucket(self._index, self._key(data)):
+            if node.title_key is not None:
+                self._drop(self._title_index, node.title_key, node)
+            node.title_key = self._title_key(node.data)
+            if node.title_key is not None:
+                self._put(self._title_index, node.title_key, node)
+            for field in self.GROUPS:
+                if getattr(node, self.GROUPS[field] + "_key") != self._group_key(node.data, field):
+                    self._group_unlink(node, field)
+                    self._group_link(node, field)
+
+    def find_node(self, data):
+        """Node pertama yang menyimpan data (O(1)), atau None."""
+        entry = self._index.get(self._key(data))
+        return entry[0] if type(entry) is list else entry
+
+    def _unlink(self, node):
+        # update pointer current
+        if node is self.current:
+            self.current = node.next or node.prev
+
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+
+        node.next = node.prev = None
+        self._unregister(node)
+        self.size -= 1
 
     # ============================
     # INSERT
@@ -27,6 +312,8 @@ class DoubleLinkedList:
             new_node.prev = self.tail
             self.tail = new_node
         self.size += 1
+        self._register(new_node)
+        return new_node
 
     def add_first(self, data):
         new_node = self._Node(data)
@@ -37,6 +324,54 @@ class DoubleLinkedList:
             self.head.prev = new_node
             self.head = new_node
         self.size += 1
+        self._register(new_node, front=True)
+        return new_node
+
+    def extend(self, items):
+        """
+        Tambahkan banyak data di belakang sekaligus: rantai node dibangun
+        dulu lalu disambung ke tail dengan satu splice. Mengembalikan list
+        node baru (urut).
+        """
+        nodes = []
+        prev = None
+        for data in items:
+            node = self._Node(data)
+            if prev is not None:
+                prev.next = node
+                node.prev = prev
+            nodes.append(node)
+            prev = node
+        if not nodes:
+            return nodes
+
+        first = nodes[0]
+        if self.tail:
+            self.tail.next = first
+            first.prev = self.tail
+        else:
+            self.head = first
+        self.tail = prev
+        self.size += len(nodes)
+        for node in nodes:
+            self._register(node, at_end=True)
+        return nodes
+
+    def insert_at(self, index, data):
+        if index <= 0:
+            return self.add_first(data)
+        if index >= self.size:
+            return self.add_last(data)
+
+        after = self.get_node(index)
+        new_node = self._Node(data)
+        new_node.prev = after.prev
+        new_node.next = after
+        after.prev.next = new_node
+        after.prev = new_node
+        self.size += 1
+        self._register(new_node)
+        return new_node
 
     # ============================
     # GET NODE BY INDEX
@@ -54,46 +389,25 @@ class DoubleLinkedList:
     # DELETE BY VALUE
     # ============================
     def remove(self, data):
-
-        # FIX: jika list kosong
-        if self.size == 0:
-            return False
-
-        # FIX: jika hanya 1 node
-        if self.size == 1:
-            if self.head.data == data:
-                self.clear()
-                return True
+        node = self.find_node(data)
+        if node is None:
             return False
-        
-        current = self.head
-        while current:
-            if current.data == data:
-
-                # update pointer current
-                if current == self.current:
-                    self.current = current.next or current.prev
-
-                # update head
-                if current == self.head:
-                    self.head = current.next
-                    self.head.prev = None
-
-                # update tail
-                elif current == self.tail:
-                    self.tail = current.prev
-                    self.tail.next = None
+        self._unlink(node)
+        return True
 
-                # update link tengah
-                else:
-                    current.prev.next = current.next
-                    current.next.prev = current.prev
+    def remove_by_data(self, data):
+        return self.remove(data)
 
-                self.size -= 1
-                return True
+    def contains_node(self, node):
+        """True kalau node (handle) masih ada di list ini."""
+        return node is not None and node.owner is self._owner
 
-            current = current.next
-        return False
+    def remove_node(self, node):
+        """Hapus node tertentu (handle dari add_last/find_node) dalam O(1)."""
+        if not self.contains_node(node):
+            return False
+        self._unlink(node)
+        return True
 
     # ============================
     # DELETE BY INDEX
@@ -102,56 +416,25 @@ class DoubleLinkedList:
         if index < 0 or index >= self.size:
             return False
 
-        # FIX: jika hanya 1 node
-        if self.size == 1:
-            self.clear()
-            return True
-
-        # Hapus head
         if index == 0:
             to_delete = self.head
-
-            if to_delete == self.current:
-                self.current = to_delete.next
-
-            self.head = to_delete.next
-            self.head.prev = None
-            self.size -= 1
-            return True
-
-        # Hapus tail
-        if index == self.size - 1:
+        elif index == self.size - 1:
             to_delete = self.tail
+        else:
+            to_delete = self.get_node(index)
 
-            if to_delete == self.current:
-                self.current = to_delete.prev
-
-            self.tail = to_delete.prev
-            self.tail.next = None
-            self.size -= 1
-            return True
-
-        # Hapus di tengah
-        to_delete = self.get_node(index)
-
-        if to_delete == self.current:
-            self.current = to_delete.next or to_delete.prev
-
-        to_delete.prev.next = to_delete.next
-        to_delete.next.prev = to_delete.prev
-
-        self.size -= 1
+        self._unlink(to_delete)
         return True
 
     # ============================
     # SEARCH
     # ============================
     def search_by_title(self, title):
-        current = self.head
-        while current:
-            if hasattr(current.data, "judul") and current.data.judul.lower() == title.lower():
-                return current.data
-            current = current.next
+        key = title.lower()
+        for node in self._bucket(self._title_index, key):
+            # judul bisa sudah diubah tanpa reindex, jadi cek ulang
+            if node.data.judul.lower() == key:
+                return node.data
         return None
 
     # ============================
@@ -201,8 +484,78 @@ class DoubleLinkedList:
     def set_repeat_mode(self, mode):
         self.repeat_mode = mode
 
-    def enable_shuffle(self, status=True):
+    def enable_shuffle(self, status=True, seed=None):
+        """
+        Aktifkan/nonaktifkan shuffle. Saat aktif, urutan acak disimpan di
+        ShuffleOrder (seed opsional supaya urutannya bisa diulang).
+        """
         self.shuffle = status
+        if not status:
+            self._shuffle_order = None
+            return
+
+        nodes = []
+        cur = self.head
+        while cur:
+            nodes.append(cur)
+            cur = cur.next
+        self._shuffle_order = ShuffleOrder(nodes, seed=seed)
+        if self.current:
+            self._shuffle_order.seek(self.current)
+
+    def _shuffle_step(self, forward):
+        order = self._shuffle_order
+        if order is None:
+            self.enable_shuffle(True)
+            order = self._shuffle_order
+        # current bisa dipindah lewat jump_to/jump_to_song
+        if order.current() is not self.current:
+            order.seek(self.current)
+
+        node = order.next() if forward else order.prev()
+        if node is None:
+            return None
+        self.current = node
+        return node.data
+
+    def set_follow_mode(self, field):
+        """
+        None = next/prev biasa; "vibes" / "genre" = next/prev melompat ke
+        lagu dengan vibe / genre yang sama dengan lagu sekarang.
+        """
+        if field is not None and field not in self.GROUPS:
+            raise ValueError(f"follow mode harus None atau salah satu dari {tuple(self.GROUPS)}")
+        self.follow_mode = field
+
+    def group_first(self, field, value):
+        ends = self._groups[field].get(value.lower()) if isinstance(value, str) else None
+        return ends[0] if ends else None
+
+    def iter_group(self, field, value):
+        """Data semua lagu dengan field == value (tanpa beda huruf), urut list."""
+        prefix_next = self.GROUPS[field] + "_next"
+        node = self.group_first(field, value)
+        while node:
+            yield node.data
+            node = getattr(node, prefix_next)
+
+    def group_values(self, field):
+        """Nilai field (lower-case) yang punya rantai, mis. semua vibe."""
+        return list(self._groups[field])
+
+    def _follow_step(self, forward):
+        # O(1): ikuti pointer rantai vibe/genre dari node sekarang
+        field = self.follow_mode
+        prefix = self.GROUPS[field]
+        node = getattr(self.current, prefix + ("_next" if forward else "_prev"))
+        if node is None and self.repeat_mode == 1:
+            ends = self._groups[field].get(getattr(self.current, prefix + "_key"))
+            if ends:
+                node = ends[0] if forward else ends[1]
+        if node is None:
+            return None
+        self.current = node
+        return node.data
 
     def get_current(self):
         return self.current.data if self.current else None
@@ -212,14 +565,22 @@ class DoubleLinkedList:
         self.tail = None
         self.current = None
         self.size = 0
-
-    def to_list(self):
-        lst = []
+        self._index = {}
+        self._title_index = {}
+        self._groups = {field: {} for field in self.GROUPS}
+        self._owner = object()
+        if self._shuffle_order is not None:
+            self._shuffle_order = ShuffleOrder()
+
+    def __iter__(self):
+        # generator: jalan dari head tanpa membuat list baru
         cur = self.head
         while cur:
-            lst.append(cur.data)
+            yield cur.data
             cur = cur.next
-        return lst
+
+    def to_list(self):
+        return list(self)
 
     def jump_to(self, index):
         node = self.get_node(index)
@@ -229,13 +590,11 @@ class DoubleLinkedList:
         return None
 
     def jump_to_song(self, song):
-        cur = self.head
-        while cur:
-            if cur.data == song:
-                self.current = cur
-                return cur.data
-            cur = cur.next
-        return None
+        node = self.find_node(song)
+        if node is None:
+            return None
+        self.current = node
+        return node.data
 
     # =====================================================
     # NEXT / PREV SMART MODE (FIXED)
@@ -248,14 +607,13 @@ class DoubleLinkedList:
         if self.repeat_mode == 2:
             return self.current.data
 
+        # ikuti vibe/genre yang sama
+        if self.follow_mode:
+            return self._follow_step(forward=True)
+
         # shuffle mode
         if self.shuffle:
-            import random
-            lst = self.to_list()
-            if not lst:
-                return None
-            chosen = random.choice(lst)
-            return self.jump_to_song(chosen)
+            return self._shuffle_step(forward=True)
 
         # normal next
         if self.current.next:
@@ -276,14 +634,13 @@ class DoubleLinkedList:
         if self.repeat_mode == 2:
             return self.current.data
 
-        # shuffle mode (backward random)
+        # ikuti vibe/genre yang sama
+        if self.follow_mode:
+            return self._follow_step(forward=False)
+
+        # shuffle mode (mundur ke lagu acak sebelumnya)
         if self.shuffle:
-            import random
-            lst = self.to_list()
-            if not lst:
-                return None
-            chosen = random.choice(lst)
-            return self.jump_to_song(chosen)
+            return self._shuffle_step(forward=False)
 
         # normal prev
         if self.current.prev:
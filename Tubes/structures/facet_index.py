@@ -0,0 +1,103 @@
+from structures.bitmap import Bitmap
+
+
+class FacetIndex:
+    """
+    Index facet: untuk tiap field (genre, vibes, artis) dan tiap nilainya
+    (lower-case) satu Bitmap id lagu. query() menggabungkan nilai dalam
+    satu field dengan OR dan antar field dengan AND, mis.
+    genre="pop", vibes=["sad", "chill"]  ->  pop AND (sad OR chill).
+
+    Seperti InvertedIndex, remove() harus dipanggil sebelum field lagu diubah.
+    """
+
+    FIELDS = ("genre", "vibes", "artis")
+
+    def __init__(self):
+        self._maps = {field: {} for field in self.FIELDS}
+
+    @staticmethod
+    def _value_key(value):
+        return value.strip().lower() if isinstance(value, str) else None
+
+    # ============================
+    # UPDATE
+    # ============================
+    def add(self, song):
+        for field in self.FIELDS:
+            key = self._value_key(getattr(song, field, None))
+            if key is None:
+                continue
+            bm = self._maps[field].get(key)
+            if bm is None:
+                bm = self._maps[field][key] = Bitmap()
+            bm.add(song.id)
+
+    def add_many(self, songs):
+        """Seperti add() untuk banyak lagu; id dikelompokkan per nilai lalu masuk bitmap sekaligus."""
+        songs = list(songs)
+        for field in self.FIELDS:
+            groups = {}
+            for song in songs:
+                key = self._value_key(getattr(song, field, None))
+                if key is not None:
+                    groups.setdefault(key, []).append(song.id)
+            for key, ids in groups.items():
+                self.add_group(field, key, ids)
+
+    def add_group(self, field, value, ids):
+        """Tambahkan banyak id yang nilai field-nya sama (value tanpa beda huruf)."""
+        key = self._value_key(value)
+        if key is None:
+            return
+        bm = self._maps[field].get(key)
+        if bm is None:
+            bm = self._maps[field][key] = Bitmap()
+        bm.add_many(ids)
+
+    def remove(self, song):
+        for field in self.FIELDS:
+            key = self._value_key(getattr(song, field, None))
+            bm = self._maps[field].get(key)
+            if bm is None:
+                continue
+            bm.discard(song.id)
+            if not bm:
+                del self._maps[field][key]
+
+    def clear(self):
+        for values in self._maps.values():
+            values.clear()
+
+    # ============================
+    # QUERY
+    # ============================
+    def values(self, field):
+        """Nilai (lower-case) yang ada untuk field, beserta jumlah lagunya."""
+        if field not in self._maps:
+            raise ValueError(f"field facet tidak dikenal: {field}")
+        return {key: len(bm) for key, bm in self._maps[field].items()}
+
+    def query(self, **criteria):
+        """
+        Bitmap id lagu yang cocok. Nilai kriteria boleh string atau list
+        string; kriteria None diabaikan. Tanpa kriteria sama sekali -> None
+        (artinya "tidak difilter").
+        """
+        result = None
+        for field, wanted in criteria.items():
+            if wanted is None:
+                continue
+            if field not in self._maps:
+                raise ValueError(f"field facet tidak dikenal: {field}")
+            if isinstance(wanted, str):
+                wanted = [wanted]
+            union = Bitmap()
+            for value in wanted:
+                bm = self._maps[field].get(self._value_key(value))
+                if bm is not None:
+                    union = union | bm
+            result = union if result is None else result & union
+            if not result:
+                return result
+        return result
@@ -0,0 +1,203 @@
+import re
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def bounded_levenshtein(a, b, max_dist):
+    """
+    Edit distance a vs b, atau None kalau lebih dari max_dist.
+    Berhenti lebih awal begitu seluruh baris DP sudah melewati batas.
+    """
+    if abs(len(a) - len(b)) > max_dist:
+        return None
+    if len(a) < len(b):
+        a, b = b, a
+
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        best = i
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if cur[j] < best:
+                best = cur[j]
+        if best > max_dist:
+            return None
+        prev = cur
+    return prev[-1] if prev[-1] <= max_dist else None
+
+
+class FuzzyIndex:
+    """
+    Index trigram atas kata-kata judul dan artis untuk pencarian yang
+    toleran typo, mis. "bilie eilish" -> "Billie Eilish".
+
+    - _terms    : kata (lower-case) -> set id lagu
+    - _trigrams : trigram -> {panjang kata -> set kata}
+
+    Tiap kata query dicocokkan sendiri: hanya kata yang panjangnya dalam
+    jarak edit dan berbagi cukup trigram yang dihitung edit distance-nya
+    (dibatasi). Lagu harus cocok dengan semua kata query; skornya jumlah
+    jarak tiap kata. Seperti InvertedIndex, remove() harus dipanggil
+    sebelum field lagu diubah.
+    """
+
+    N = 3
+    MIN_TOKEN = 3          # kata lebih pendek dari ini tidak diindeks sendiri
+    MAX_CANDIDATES = 200   # term yang dihitung edit distance-nya per query
+
+    def __init__(self):
+        self._terms = {}
+        self._trigrams = {}
+
+    # ============================
+    # KEY
+    # ============================
+    @classmethod
+    def _grams(cls, term):
+        padded = "  " + term + " "
+        return {padded[i:i + cls.N] for i in range(len(padded) - cls.N + 1)}
+
+    @classmethod
+    def _words(cls, text):
+        return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) >= cls.MIN_TOKEN]
+
+    @classmethod
+    def _song_terms(cls, song):
+        terms = set()
+        for value in (song.judul, song.artis):
+            if isinstance(value, str):
+                terms.update(cls._words(value))
+        return terms
+
+    def _index_term(self, term):
+        n = len(term)
+        for g in self._grams(term):
+            self._trigrams.setdefault(g, {}).setdefault(n, set()).add(term)
+
+    # ============================
+    # UPDATE
+    # ============================
+    def add(self, song):
+        for term in self._song_terms(song):
+            ids = self._terms.get(term)
+            if ids is None:
+                ids = self._terms[term] = set()
+                self._index_term(term)
+            ids.add(song.id)
+
+    def add_many(self, songs):
+        """Seperti add() untuk banyak lagu; trigram term baru diindeks sekali per batch."""
+        new_terms = []
+        for song in songs:
+            for term in self._song_terms(song):
+                ids = self._terms.get(term)
+                if ids is None:
+                    ids = self._terms[term] = set()
+                    new_terms.append(term)
+                ids.add(song.id)
+        for term in new_terms:
+            self._index_term(term)
+
+    def remove(self, song):
+        for term in self._song_terms(song):
+            ids = self._terms.get(term)
+            if ids is None:
+                continue
+            ids.discard(song.id)
+            if ids:
+                continue
+            del self._terms[term]
+            n = len(term)
+            for g in self._grams(term):
+                by_len = self._trigrams.get(g)
+                terms = by_len.get(n) if by_len is not None else None
+                if terms is None:
+                    continue
+                terms.discard(term)
+                if not terms:
+                    del by_len[n]
+                    if not by_len:
+                        del self._trigrams[g]
+
+    def clear(self):
+        self._terms.clear()
+        self._trigrams.clear()
+
+    # ============================
+    # QUERY
+    # ============================
+    def _candidates(self, word, max_distance, cancel):
+        # kata index yang panjangnya dalam jarak edit dan berbagi cukup trigram
+        lo, hi = len(word) - max_distance, len(word) + max_distance
+        postings = []
+        for g in self._grams(word):
+            by_len = self._trigrams.get(g)
+            sets = [by_len[n] for n in range(lo, hi + 1) if n in by_len] if by_len else []
+            postings.append((sum(map(len, sets)), sets))
+        # trigram paling jarang dulu
+        postings.sort(key=lambda p: p[0])
+
+        # q-gram lemma: satu edit merusak paling banyak N trigram
+        need = max(1, len(postings) - self.N * max_distance)
+        shared = {}
+        for i, (size, sets) in enumerate(postings):
+            if cancel is not None:
+                cancel.check()
+            left = len(postings) - i
+            if left >= need:
+                for terms in sets:
+                    for term in terms:
+                        shared[term] = shared.get(term, 0) + 1
+                continue
+            # kata baru tidak mungkin lagi mencapai need: buang kandidat yang
+            # sudah tertinggal, sisanya dicek dari sisi yang lebih kecil
+            shared = {t: c for t, c in shared.items() if c + left >= need}
+            if size < len(shared):
+                for terms in sets:
+                    for term in terms:
+                        if term in shared:
+                            shared[term] += 1
+            else:
+                for term in shared:
+                    if any(term in terms for terms in sets):
+                        shared[term] += 1
+        ranked = sorted((t for t, c in shared.items() if c >= need), key=shared.get, reverse=True)
+        return ranked[:self.MAX_CANDIDATES]
+
+    def search(self, query, max_distance=None, limit=20, cancel=None):
+        """
+        List (distance, song_id) terurut dari yang paling mirip, paling
+        banyak `limit` lagu; distance = jumlah jarak tiap kata query.
+        max_distance berlaku per kata (default sesuai panjang kata).
+        cancel (opsional) = objek dengan check() yang raise kalau pencarian
+        dibatalkan (CancelToken); dicek per trigram dan per kandidat.
+        """
+        words = self._words(query)
+        if not words:
+            return []
+
+        total = None
+        for word in dict.fromkeys(words):
+            limit_dist = max_distance if max_distance is not None else min(3, max(1, len(word) // 4))
+            best = {}
+            for term in self._candidates(word, limit_dist, cancel):
+                if cancel is not None:
+                    cancel.check()
+                dist = bounded_levenshtein(word, term, limit_dist)
+                if dist is None:
+                    continue
+                for song_id in self._terms[term]:
+                    if dist < best.get(song_id, limit_dist + 1):
+                        best[song_id] = dist
+            # lagu harus cocok dengan semua kata query
+            if total is None:
+                total = best
+            else:
+                total = {s: d + best[s] for s, d in total.items() if s in best}
+            if not total:
+                return []
+
+        ranked = sorted((d, song_id) for song_id, d in total.items())
+        return ranked[:limit]
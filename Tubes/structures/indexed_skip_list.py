@@ -0,0 +1,257 @@
+import random
+
+from structures.double_linked_list import DoubleLinkedList
+
+
+class IndexedSkipList(DoubleLinkedList):
+    """
+    Alternatif backing untuk daftar lagu: indexable skip list.
+
+    API publik sama dengan DoubleLinkedList (head, tail, current,
+    node.next / node.prev, repeat, shuffle, ...), jadi SongController dan
+    GUI bisa memakainya tanpa perubahan. Bedanya, get_node, insert_at dan
+    delete_at berjalan O(log n) (expected), bukan O(n).
+
+    Level 0 adalah double linked list biasa. Setiap level di atasnya
+    menyimpan pointer maju/mundur plus "lebar" pointer (berapa node yang
+    dilompati) sehingga posisi ke-i bisa dicari dari atas ke bawah.
+    """
+
+    MAX_LEVEL = 32
+    P = 0.25
+
+    class _Node:
+        __slots__ = ("data", "fwd", "bwd", "width", "key", "title_key", "owner", "order",
+                     "vibe_key", "vibe_prev", "vibe_next", "genre_key", "genre_prev", "genre_next")
+
+        def __init__(self, data, level=1):
+            self.data = data
+            self.fwd = [None] * level     # pointer maju per level
+            self.bwd = [None] * level     # pointer mundur per level (None = header)
+            self.width = [1] * level      # jarak ke fwd[level]
+            self.key = None
+            self.title_key = None
+            self.owner = None
+            self.order = 0
+            self.vibe_key = self.vibe_prev = self.vibe_next = None
+            self.genre_key = self.genre_prev = self.genre_next = None
+
+        @property
+        def next(self):
+            return self.fwd[0]
+
+        @property
+        def prev(self):
+            return self.bwd[0]
+
+    def __init__(self, seed=None):
+        super().__init__()
+        self._rng = random.Random(seed)
+        self._header = self._Node(None, self.MAX_LEVEL)
+        self._level = 1
+
+    # ============================
+    # HELPER SKIP LIST
+    # ============================
+    def _random_level(self):
+        level = 1
+        while level < self.MAX_LEVEL and self._rng.random() < self.P:
+            level += 1
+        return level
+
+    def _predecessors(self, index):
+        """
+        Untuk tiap level: node terakhir yang posisinya < index
+        (header dianggap posisi -1) beserta posisinya.
+        """
+        update = [self._header] * self._level
+        pos = [-1] * self._level
+        node = self._header
+        p = -1
+        for lvl in range(self._level - 1, -1, -1):
+            while node.fwd[lvl] is not None and p + node.width[lvl] < index:
+                p += node.width[lvl]
+                node = node.fwd[lvl]
+            update[lvl] = node
+            pos[lvl] = p
+        return update, pos
+
+    def _rank(self, node):
+        # jalan mundur lewat level tertinggi tiap node sampai ketemu header
+        r = 0
+        x = node
+        while True:
+            top = len(x.fwd) - 1
+            p = x.bwd[top]
+            if p is None:
+                return r + self._header.width[top] - 1
+            r += p.width[top]
+            x = p
+
+    # ============================
+    # GET NODE BY INDEX
+    # ============================
+    def get_node(self, index):
+        if index < 0 or index >= self.size:
+            return None
+
+        node = self._header
+        p = -1
+        for lvl in range(self._level - 1, -1, -1):
+            while node.fwd[lvl] is not None and p + node.width[lvl] <= index:
+                p += node.width[lvl]
+                node = node.fwd[lvl]
+            if p == index:
+                return node
+        return node
+
+    def index_of(self, data):
+        """Posisi (0-based) data di list, atau -1. O(log n)."""
+        node = self.find_node(data)
+        return self._rank(node) if node is not None else -1
+
+    # ============================
+    # INSERT
+    # ============================
+    def insert_at(self, index, data, front=False):
+        index = max(0, min(index, self.size))
+        header = self._header
+
+        level = self._random_level()
+        if level > self._level:
+            for lvl in range(self._level, level):
+                header.fwd[lvl] = None
+                header.width[lvl] = self.size + 1
+            self._level = level
+
+        update, pos = self._predecessors(index)
+        new_node = self._Node(data, level)
+
+        for lvl in range(level):
+            pred = update[lvl]
+            nxt = pred.fwd[lvl]
+            new_node.fwd[lvl] = nxt
+            new_node.bwd[lvl] = None if pred is header else pred
+            if nxt is not None:
+                nxt.bwd[lvl] = new_node
+            pred.fwd[lvl] = new_node
+
+            # pred -> new_node -> nxt (nxt bergeser satu posisi)
+            steps = index - pos[lvl]
+            new_node.width[lvl] = pred.width[lvl] - steps + 1
+            pred.width[lvl] = steps
+
+        # level yang tidak disentuh node baru hanya bertambah lebarnya
+        for lvl in range(level, self._level):
+            update[lvl].width[lvl] += 1
+
+        self.head = header.fwd[0]
+        if new_node.fwd[0] is None:
+            self.tail = new_node
+        self.size += 1
+        self._register(new_node, front=front)
+        return new_node
+
+    def add_last(self, data):
+        return self.insert_at(self.size, data)
+
+    def add_first(self, data):
+        return self.insert_at(0, data, front=True)
+
+    def extend(self, items):
+        """
+        Tambahkan banyak data di belakang sekaligus. Node terakhir tiap level
+        diingat selama batch, jadi tiap node cukup disambung O(level) tanpa
+        mencari predecessor dari header; lebar pointer ujung diisi sekali di
+        akhir.
+        """
+        header = self._header
+        update, pos = self._predecessors(self.size)
+        update += [header] * (self.MAX_LEVEL - self._level)
+        pos += [-1] * (self.MAX_LEVEL - self._level)
+
+        nodes = []
+        index = self.size
+        for data in items:
+            level = self._random_level()
+            if level > self._level:
+                for lvl in range(self._level, level):
+                    header.fwd[lvl] = None
+                self._level = level
+            node = self._Node(data, level)
+            for lvl in range(level):
+                pred = update[lvl]
+                pred.fwd[lvl] = node
+                pred.width[lvl] = index - pos[lvl]
+                node.bwd[lvl] = None if pred is header else pred
+                update[lvl] = node
+                pos[lvl] = index
+            nodes.append(node)
+            index += 1
+        if not nodes:
+            return nodes
+
+        # pointer terakhir tiap level menunjuk ke "setelah ujung" (posisi size)
+        for lvl in range(self._level):
+            update[lvl].width[lvl] = index - pos[lvl]
+
+        self.head = header.fwd[0]
+        self.tail = nodes[-1]
+        self.size = index
+        for node in nodes:
+            self._register(node, at_end=True)
+        return nodes
+
+    # ============================
+    # DELETE
+    # ============================
+    def _delete(self, index):
+        header = self._header
+        update, _ = self._predecessors(index)
+        node = update[0].fwd[0]
+
+        # update pointer current
+        if node is self.current:
+            self.current = node.next or node.prev
+
+        for lvl in range(self._level):
+            pred = update[lvl]
+            if pred.fwd[lvl] is node:
+                nxt = node.fwd[lvl]
+                pred.fwd[lvl] = nxt
+                pred.width[lvl] += node.width[lvl] - 1
+                if nxt is not None:
+                    nxt.bwd[lvl] = node.bwd[lvl]
+            else:
+                pred.width[lvl] -= 1
+
+        while self._level > 1 and header.fwd[self._level - 1] is None:
+            self._level -= 1
+
+        if node is self.tail:
+            self.tail = node.bwd[0]
+        self.head = header.fwd[0]
+
+        level = len(node.fwd)
+        node.fwd = [None] * level
+        node.bwd = [None] * level
+        self._unregister(node)
+        self.size -= 1
+        return node
+
+    def _unlink(self, node):
+        self._delete(self._rank(node))
+
+    def delete_at(self, index):
+        if index < 0 or index >= self.size:
+            return False
+        self._delete(index)
+        return True
+
+    # ============================
+    # UTILS
+    # ============================
+    def clear(self):
+        super().clear()
+        self._header = self._Node(None, self.MAX_LEVEL)
+        self._level = 1
@@ -0,0 +1,133 @@
+import re
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class InvertedIndex:
+    """
+    Inverted index untuk pencarian lagu (judul/artis/genre/vibes).
+
+    - _grams  : trigram (3 huruf, lower-case) -> set id lagu
+    - _tokens : kata utuh (lower-case)        -> set id lagu
+
+    Index hanya menyimpan id; kecocokan substring tetap dicek ulang oleh
+    pemanggil, karena trigram sebuah query bisa berasal dari posisi atau
+    field yang berbeda. Key dihitung dari isi field saat ini, jadi
+    remove() harus dipanggil SEBELUM field lagu diubah.
+    """
+
+    FIELDS = ("judul", "artis", "genre", "vibes")
+    N = 3
+
+    def __init__(self):
+        self._grams = {}
+        self._tokens = {}
+
+    # ============================
+    # KEY
+    # ============================
+    @classmethod
+    def _texts(cls, song):
+        for field in cls.FIELDS:
+            value = getattr(song, field, None)
+            if isinstance(value, str):
+                yield value.lower()
+
+    @classmethod
+    def _keys(cls, song):
+        grams = set()
+        tokens = set()
+        n = cls.N
+        for text in cls._texts(song):
+            for i in range(len(text) - n + 1):
+                grams.add(text[i:i + n])
+            tokens.update(_TOKEN_RE.findall(text))
+        return grams, tokens
+
+    # ============================
+    # UPDATE
+    # ============================
+    def add(self, song):
+        grams, tokens = self._keys(song)
+        for g in grams:
+            self._grams.setdefault(g, set()).add(song.id)
+        for t in tokens:
+            self._tokens.setdefault(t, set()).add(song.id)
+
+    def add_many(self, songs):
+        """Seperti add() untuk banyak lagu; tiap key diperbarui sekali per batch."""
+        grams_acc = {}
+        tokens_acc = {}
+        for song in songs:
+            grams, tokens = self._keys(song)
+            for g in grams:
+                grams_acc.setdefault(g, []).append(song.id)
+            for t in tokens:
+                tokens_acc.setdefault(t, []).append(song.id)
+        for index, acc in ((self._grams, grams_acc), (self._tokens, tokens_acc)):
+            for k, ids in acc.items():
+                bucket = index.get(k)
+                if bucket is None:
+                    index[k] = set(ids)
+                else:
+                    bucket.update(ids)
+
+    def remove(self, song):
+        grams, tokens = self._keys(song)
+        for index, keys in ((self._grams, grams), (self._tokens, tokens)):
+            for k in keys:
+                ids = index.get(k)
+                if ids is None:
+                    continue
+                ids.discard(song.id)
+                if not ids:
+                    del index[k]
+
+    def clear(self):
+        self._grams.clear()
+        self._tokens.clear()
+
+    # ============================
+    # QUERY
+    # ============================
+    @staticmethod
+    def _intersect(sets):
+        if not sets:
+            return set()
+        sets = sorted(sets, key=len)
+        out = set(sets[0])
+        for other in sets[1:]:
+            out &= other
+            if not out:
+                break
+        return out
+
+    def substring_candidates(self, keyword):
+        """
+        Id lagu yang MUNGKIN mengandung keyword (sudah lower-case).
+        Mengembalikan None kalau keyword terlalu pendek untuk diindeks;
+        pemanggil harus scan biasa.
+        """
+        n = self.N
+        if len(keyword) < n:
+            return None
+        posting = []
+        for i in range(len(keyword) - n + 1):
+            ids = self._grams.get(keyword[i:i + n])
+            if not ids:
+                return set()
+            posting.append(ids)
+        return self._intersect(posting)
+
+    def token_matches(self, query):
+        """Id lagu yang memuat SEMUA kata di query sebagai kata utuh."""
+        tokens = _TOKEN_RE.findall(query.lower())
+        if not tokens:
+            return set()
+        posting = []
+        for t in set(tokens):
+            ids = self._tokens.get(t)
+            if not ids:
+                return set()
+            posting.append(ids)
+        return self._intersect(posting)
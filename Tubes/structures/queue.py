@@ -1,35 +1,163 @@
+from collections import deque
+
+from structures.node import Node
+
+
 class Queue:
+    """
+    Antrian lagu (FIFO) berbasis linked list Node + peta item -> node.
+
+    enqueue, dequeue, remove(item), move_to_front dan move_after semuanya
+    O(1), dan iterasi tidak mengubah isi antrian, jadi GUI tidak perlu
+    dequeue lalu enqueue ulang hanya untuk menampilkan atau mengedit.
+
+    enqueue mengembalikan node-nya sebagai handle. remove, move_after dan
+    move_to_front menerima item atau handle; dengan handle, entri yang
+    dituju tepat entri itu walaupun item yang sama ada beberapa kali.
+    """
+
     def __init__(self):
-        self.items = []
+        self.head = None
+        self.tail = None
+        self._size = 0
+        # item -> deque node (item yang sama boleh masuk lebih dari sekali)
+        self._handles = {}
+
+    # ===== helper link =====
+    def _link_after(self, node, anchor):
+        # anchor None = taruh di depan
+        if anchor is None:
+            node.prev = None
+            node.next = self.head
+            if self.head:
+                self.head.prev = node
+            self.head = node
+        else:
+            node.prev = anchor
+            node.next = anchor.next
+            if anchor.next:
+                anchor.next.prev = node
+            anchor.next = node
+        if node.next is None:
+            self.tail = node
+
+    def _unlink(self, node):
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.next = node.prev = None
+
+    def _drop_handle(self, node):
+        handles = self._handles[node.data]
+        if handles[0] is node:
+            handles.popleft()
+        else:
+            handles.remove(node)
+        if not handles:
+            del self._handles[node.data]
+        node.owner = None
+
+    def _resolve(self, target):
+        # handle (Node milik antrian ini) atau item -> node pertamanya
+        if isinstance(target, Node):
+            return target if getattr(target, "owner", None) is self else None
+        handles = self._handles.get(target)
+        return handles[0] if handles else None
 
+    # ===== operasi utama =====
     def enqueue(self, data):
-        self.items.append(data)
+        node = Node(data)
+        node.owner = self
+        self._link_after(node, self.tail)
+        self._handles.setdefault(data, deque()).append(node)
+        self._size += 1
+        return node
 
     def dequeue(self):
         if self.is_empty():
             return None
-        return self.items.pop(0)  # FIFO
+        node = self.head
+        self._unlink(node)
+        self._drop_handle(node)
+        self._size -= 1
+        return node.data  # FIFO
 
     def peek(self):
         if self.is_empty():
             return None
-        return self.items[0]
+        return self.head.data
 
     def is_empty(self):
-        return len(self.items) == 0
+        return self._size == 0
 
     def size(self):
-        return len(self.items)
+        return self._size
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        node = self.head
+        while node:
+            yield node.data
+            node = node.next
+
+    def nodes(self):
+        # iterasi handle dari depan; node.data = item
+        node = self.head
+        while node:
+            yield node
+            node = node.next
+
+    def __contains__(self, item):
+        return item in self._handles
 
     def to_list(self):
-        return list(self.items)
+        return list(self)
+
+    @property
+    def items(self):
+        # kompatibilitas dengan versi lama yang menyimpan list biasa
+        return self.to_list()
 
     def __str__(self):
-        return str(self.items)
-    
+        return str(self.to_list())
+
     # ===== Tambahkan method remove =====
     def remove(self, item):
-        try:
-            self.items.remove(item)
-        except ValueError:
-            pass
\ No newline at end of file
+        node = self._resolve(item)
+        if node is None:
+            return False
+        self._unlink(node)
+        self._drop_handle(node)
+        self._size -= 1
+        return True
+
+    # ===== atur ulang urutan =====
+    def move_after(self, item, anchor_item=None):
+        """
+        Pindahkan item tepat setelah anchor_item (None = ke paling depan).
+        Keduanya boleh item atau handle dari enqueue. Hanya relink
+        pointer, O(1).
+        """
+        node = self._resolve(item)
+        if node is None:
+            return False
+
+        anchor = None
+        if anchor_item is not None:
+            anchor = self._resolve(anchor_item)
+            if anchor is None or anchor is node:
+                return False
+
+        self._unlink(node)
+        self._link_after(node, anchor)
+        return True
+
+    def move_to_front(self, item):
+        return self.move_after(item, None)
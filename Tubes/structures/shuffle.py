@@ -0,0 +1,122 @@
+import random
+
+
+class ShuffleOrder:
+    """
+    Urutan shuffle untuk DoubleLinkedList, berupa permutasi Fisher–Yates
+    yang diperpanjang secara lazy atas handle node.
+
+    pool[:played]  = lagu yang sudah keluar di siklus ini, sesuai urutan putar
+    pool[played:]  = lagu yang belum diputar (diacak saat diambil)
+    pool[cursor]   = lagu yang sedang diputar
+
+    next/prev O(1), setiap lagu diputar tepat sekali per siklus, dan
+    add/discard O(1) sehingga urutan tetap valid saat lagu ditambah atau
+    dihapus selama shuffle aktif. Node yang dihapus dari bagian "sudah
+    diputar" ditandai None dan baru dibuang saat siklus baru dimulai.
+    """
+
+    def __init__(self, nodes=(), seed=None):
+        self._rng = random.Random(seed)
+        self._pool = list(nodes)
+        self._pos = {node: i for i, node in enumerate(self._pool)}
+        self._played = 0
+        self._cursor = -1
+        self._holes = 0
+        self._last = None
+
+    def __len__(self):
+        return len(self._pool) - self._holes
+
+    def current(self):
+        if 0 <= self._cursor < self._played:
+            return self._pool[self._cursor]
+        return None
+
+    # ============================
+    # UPDATE ISI
+    # ============================
+    def add(self, node):
+        if node in self._pos:
+            return
+        self._pos[node] = len(self._pool)
+        self._pool.append(node)
+
+    def discard(self, node):
+        i = self._pos.pop(node, None)
+        if i is None:
+            return
+        if i < self._played:
+            # sudah diputar: jangan geser riwayat, cukup beri tanda
+            self._pool[i] = None
+            self._holes += 1
+            return
+
+        last = self._pool.pop()
+        if last is not node:
+            self._pool[i] = last
+            self._pos[last] = i
+
+    def _swap(self, i, j):
+        pool = self._pool
+        pool[i], pool[j] = pool[j], pool[i]
+        if pool[i] is not None:
+            self._pos[pool[i]] = i
+        if pool[j] is not None:
+            self._pos[pool[j]] = j
+
+    # ============================
+    # NAVIGASI
+    # ============================
+    def _new_cycle(self):
+        self._last = self.current()
+        if self._holes:
+            self._pool = [n for n in self._pool if n is not None]
+            self._pos = {node: i for i, node in enumerate(self._pool)}
+            self._holes = 0
+        self._played = 0
+        self._cursor = -1
+
+    def _draw(self):
+        if self._played == len(self._pool):
+            self._new_cycle()
+        if not self._pool:
+            return None
+
+        j = self._rng.randrange(self._played, len(self._pool))
+        # hindari lagu yang sama langsung terulang di awal siklus baru
+        if self._played == 0 and self._pool[j] is self._last and len(self._pool) > 1:
+            j = (j + 1) % len(self._pool)
+        self._swap(self._played, j)
+        self._played += 1
+        self._cursor = self._played - 1
+        return self._pool[self._cursor]
+
+    def next(self):
+        i = self._cursor + 1
+        while i < self._played:
+            if self._pool[i] is not None:
+                self._cursor = i
+                return self._pool[i]
+            i += 1
+        return self._draw()
+
+    def prev(self):
+        i = self._cursor - 1
+        while i >= 0:
+            if self._pool[i] is not None:
+                self._cursor = i
+                return self._pool[i]
+            i -= 1
+        return None
+
+    def seek(self, node):
+        """Jadikan node sebagai lagu sekarang (mis. user klik lagu tertentu)."""
+        i = self._pos.get(node)
+        if i is None:
+            return
+        if i >= self._played:
+            self._swap(self._played, i)
+            self._played += 1
+            i = self._played - 1
+        self._cursor = i
@@ -1,20 +1,68 @@
 # structures/song.py
 
+import sys
+
+
+def _intern(value):
+    # genre/vibes/artis banyak yang sama, jadi cukup disimpan sekali
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Song:
-    def __init__(self, judul, artis, genre, vibes):
+    """
+    Data satu lagu.
+
+    - __slots__ supaya ringan untuk katalog besar.
+    - id: integer tetap yang diberikan SongController (None sebelum lagu
+      masuk katalog); __eq__/__hash__ memakai id ini.
+    - artis, genre dan vibes di-intern.
+
+    Catatan: lagu tanpa id di-hash berdasarkan objeknya, jadi masukkan lagu
+    ke controller dulu sebelum dipakai sebagai key set/dict.
+    """
+
+    __slots__ = ("_id", "judul", "artis", "genre", "vibes", "__weakref__")
+
+    def __init__(self, judul, artis, genre, vibes, song_id=None):
+        self._id = song_id
+        self.set_fields(judul, artis, genre, vibes)
+
+    @property
+    def id(self):
+        return self._id
+
+    def assign_id(self, song_id):
+        """Dipanggil SongController. ID tidak bisa diganti setelah diisi."""
+        if self._id is not None and self._id != song_id:
+            raise ValueError(f"Song sudah punya id {self._id}")
+        self._id = song_id
+
+    def set_fields(self, judul, artis, genre, vibes):
         self.judul = judul
-        self.artis = artis
-        self.genre = genre
-        self.vibes = vibes
+        self.artis = _intern(artis)
+        self.genre = _intern(genre)
+        self.vibes = _intern(vibes)
 
     def to_dict(self):
         return {
+            "id": self._id,
             "judul": self.judul,
             "artis": self.artis,
             "genre": self.genre,
             "vibes": self.vibes
         }
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Song):
+            return NotImplemented
+        return self._id is not None and self._id == other._id
+
+    def __hash__(self):
+        if self._id is None:
+            return object.__hash__(self)
+        return hash(self._id)
+
     def __str__(self):
-        # jangan pakai self.id karena tidak disimpan di objek ini
-        return f"{self.judul} - {self.artis} ({self.genre}, {self.vibes})"
\ No newline at end of file
+        return f"{self.judul} - {self.artis} ({self.genre}, {self.vibes})"
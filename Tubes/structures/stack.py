@@ -23,4 +23,64 @@ class Stack:
         if self.is_empty():
             return []
         # stack ditampilkan dari atas ke bawah (reverse)
-        return self.items[::-1]
\ No newline at end of file
+        return self.items[::-1]
+
+class HistoryStack:
+    """
+    Stack riwayat putar dengan kapasitas tetap (ring buffer).
+
+    push/pop O(1); kalau penuh, entri paling lama ditimpa sehingga memori
+    tetap datar selama sesi panjang. Iterasi (dari yang terbaru) langsung
+    membaca buffer tanpa menyalin. Dengan collapse_repeats=True, lagu yang
+    sama diputar berturut-turut (mis. repeat one) hanya dicatat sekali.
+    """
+
+    def __init__(self, capacity=200, collapse_repeats=False):
+        if capacity < 1:
+            raise ValueError("capacity harus >= 1")
+        self.capacity = capacity
+        self.collapse_repeats = collapse_repeats
+        self._buf = [None] * capacity
+        self._top = 0      # slot yang akan diisi push berikutnya
+        self._count = 0
+
+    def push(self, item):
+        if self.collapse_repeats and self._count and self.peek() == item:
+            return
+        self._buf[self._top] = item
+        self._top = (self._top + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def pop(self):
+        if self.is_empty():
+            return None
+        self._top = (self._top - 1) % self.capacity
+        item = self._buf[self._top]
+        self._buf[self._top] = None
+        self._count -= 1
+        return item
+
+    def peek(self):
+        if self.is_empty():
+            return None
+        return self._buf[(self._top - 1) % self.capacity]
+
+    def is_empty(self):
+        return self._count == 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        # dari atas (terbaru) ke bawah, tanpa salinan
+        buf = self._buf
+        cap = self.capacity
+        i = self._top
+        for _ in range(self._count):
+            i = (i - 1) % cap
+            yield buf[i]
+
+    # === DISPAY ===
+    def display(self):
+        return list(self)
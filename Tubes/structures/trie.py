@@ -0,0 +1,133 @@
+class PrefixTrie:
+    """
+    Trie untuk autocomplete judul lagu / nama artis.
+
+    Setiap node menyimpan cache `top`: maksimal TOP_K term terbaik di
+    subtree-nya, diurutkan berdasarkan jumlah lagu (terbanyak dulu) lalu
+    alfabet. Karena itu complete(prefix, k) cukup berjalan sepanjang prefix
+    lalu mengambil k entri pertama: O(len(prefix) + k).
+
+    Term disimpan lower-case; teks tampilan memakai bentuk pertama yang
+    dimasukkan. Satu term bisa dimasukkan berkali-kali (mis. artis dengan
+    banyak lagu) dan baru hilang setelah di-remove sebanyak itu juga.
+    """
+
+    TOP_K = 10
+
+    class _Node:
+        __slots__ = ("children", "count", "top")
+
+        def __init__(self):
+            self.children = {}
+            self.count = 0      # > 0 berarti node ini akhir sebuah term
+            self.top = []       # list (-count, term) terurut
+
+    def __init__(self):
+        self._root = self._Node()
+        self._display = {}      # term lower-case -> teks tampilan
+
+    def __len__(self):
+        return len(self._display)
+
+    # ============================
+    # HELPER
+    # ============================
+    def _path(self, key, create=False):
+        node = self._root
+        path = [node]
+        for ch in key:
+            nxt = node.children.get(ch)
+            if nxt is None:
+                if not create:
+                    return None
+                nxt = node.children[ch] = self._Node()
+            node = nxt
+            path.append(node)
+        return path
+
+    def _recompute(self, node, key):
+        entries = [(-node.count, key)] if node.count else []
+        for child in node.children.values():
+            entries.extend(child.top)
+        entries.sort()
+        node.top = entries[:self.TOP_K]
+
+    # ============================
+    # UPDATE
+    # ============================
+    def insert(self, term):
+        if not term or not term.strip():
+            return
+        key = term.strip().lower()
+        path = self._path(key, create=True)
+        terminal = path[-1]
+        old = (-terminal.count, key)
+        terminal.count += 1
+        new = (-terminal.count, key)
+        self._display.setdefault(key, term.strip())
+
+        # skor naik, jadi cukup ganti/sisipkan entri ini di sepanjang path
+        for node in path:
+            top = node.top
+            if old in top:
+                top.remove(old)
+            top.append(new)
+            top.sort()
+            del top[self.TOP_K:]
+
+    def insert_many(self, terms):
+        """
+        Seperti insert() untuk banyak term. Jumlah dihitung dulu, lalu cache
+        `top` setiap node yang tersentuh dihitung ulang sekali saja
+        (dari node terdalam ke root).
+        """
+        touched = {}
+        for term in terms:
+            if not term or not term.strip():
+                continue
+            key = term.strip().lower()
+            path = self._path(key, create=True)
+            path[-1].count += 1
+            self._display.setdefault(key, term.strip())
+            for depth in range(len(key), -1, -1):
+                prefix = key[:depth]
+                if prefix in touched:
+                    break
+                touched[prefix] = path[depth]
+        for prefix in sorted(touched, key=len, reverse=True):
+            self._recompute(touched[prefix], prefix)
+
+    def remove(self, term):
+        if not term or not term.strip():
+            return False
+        key = term.strip().lower()
+        path = self._path(key)
+        if path is None or path[-1].count == 0:
+            return False
+
+        path[-1].count -= 1
+        if path[-1].count == 0:
+            del self._display[key]
+
+        # skor turun: hitung ulang cache dari bawah, buang node kosong
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            if depth > 0 and node.count == 0 and not node.children:
+                del path[depth - 1].children[key[depth - 1]]
+                continue
+            self._recompute(node, key[:depth])
+        return True
+
+    def clear(self):
+        self._root = self._Node()
+        self._display = {}
+
+    # ============================
+    # QUERY
+    # ============================
+    def complete(self, prefix, k=TOP_K):
+        key = prefix.strip().lower()
+        path = self._path(key)
+        if path is None:
+            return []
+        return [self._display[term] for _, term in path[-1].top[:k]]
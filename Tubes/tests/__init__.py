@@ -0,0 +1,5 @@
+# tests/
+#
+# Test perilaku struktur data dan controller. Jalankan dari folder Tubes:
+#   python -m pytest -q
+# (atau python -m unittest discover -s tests -t .)
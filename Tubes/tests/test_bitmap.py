@@ -0,0 +1,90 @@
+import random
+import unittest
+
+from structures.bitmap import Bitmap
+from structures.facet_index import FacetIndex
+from structures.song import Song
+
+
+class BitmapTest(unittest.TestCase):
+    def test_matches_python_set(self):
+        rng = random.Random(11)
+        for density in (0.001, 0.1, 0.9):
+            span = 3 * (1 << Bitmap.CHUNK_BITS)
+            a, b = Bitmap(), Bitmap()
+            sa, sb = set(), set()
+            for _ in range(int(span * density)):
+                x, y = rng.randrange(span), rng.randrange(span)
+                a.add(x)
+                sa.add(x)
+                b.add(y)
+                sb.add(y)
+            for _ in range(int(span * density / 2)):
+                x = rng.randrange(span)
+                a.discard(x)
+                sa.discard(x)
+            self.assertEqual(list(a), sorted(sa))
+            self.assertEqual(len(a), len(sa))
+            self.assertEqual(list(a & b), sorted(sa & sb))
+            self.assertEqual(list(a | b), sorted(sa | sb))
+            self.assertEqual(len(a | b), len(sa | sb))
+            for x in range(0, span, 101):
+                self.assertEqual(x in a, x in sa)
+
+    def test_sparse_dense_conversion(self):
+        bm = Bitmap(range(Bitmap.SPARSE_MAX + 10))
+        self.assertEqual(len(bm), Bitmap.SPARSE_MAX + 10)
+        for i in range(Bitmap.SPARSE_MAX + 10):
+            bm.discard(i)
+        self.assertFalse(bm)
+        self.assertEqual(len(bm), 0)
+        self.assertEqual(list(bm), [])
+
+    def test_add_many(self):
+        ids = list(range(0, 200_000, 7)) + [5, 5, 70_000]
+        bm = Bitmap([3])
+        bm.add_many(ids)
+        self.assertEqual(list(bm), sorted(set(ids) | {3}))
+
+    def test_copy_is_independent(self):
+        bm = Bitmap([1, 2, 3])
+        other = bm.copy()
+        other.add(4)
+        other.discard(1)
+        self.assertEqual(list(bm), [1, 2, 3])
+        self.assertEqual(list(other), [2, 3, 4])
+
+    def test_discard_missing_is_noop(self):
+        bm = Bitmap([10])
+        bm.discard(11)
+        bm.discard(1 << 20)
+        self.assertEqual(list(bm), [10])
+
+
+class FacetIndexTest(unittest.TestCase):
+    def setUp(self):
+        rows = [("a", "Tulus", "Pop", "Sad"), ("b", "Tulus", "Pop", "Happy"),
+                ("c", "Hindia", "Indie", "Sad"), ("d", "Hindia", "Pop", "Chill")]
+        self.songs = [Song(*row, song_id=i) for i, row in enumerate(rows, 1)]
+        self.index = FacetIndex()
+        self.index.add_many(self.songs)
+
+    def test_or_within_and_across_fields(self):
+        self.assertEqual(list(self.index.query(genre="pop", vibes=["sad", "chill"])), [1, 4])
+        self.assertEqual(list(self.index.query(artis="HINDIA")), [3, 4])
+        self.assertEqual(list(self.index.query(genre="jazz")), [])
+        self.assertIsNone(self.index.query())
+
+    def test_values_and_remove(self):
+        self.assertEqual(self.index.values("genre"), {"pop": 3, "indie": 1})
+        self.index.remove(self.songs[2])
+        self.assertEqual(self.index.values("genre"), {"pop": 3})
+        self.assertEqual(list(self.index.query(vibes="sad")), [1])
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            self.index.query(tahun="2020")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from controllers.lagu_controller import SongController
+from controllers.storage import SQLiteSongStore
+from structures.song import Song
+
+
+def _songs(n):
+    return [Song(f"Lagu {i}", "Tulus", "Pop", "Sad") for i in range(n)]
+
+
+class ListenerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        shutil.rmtree(self.tmp)
+
+    def _controllers(self):
+        yield SongController(_songs(5))
+        store = SQLiteSongStore(os.path.join(self.tmp, "k.db"))
+        self.stores.append(store)
+        yield SongController(_songs(5), store=store, page_size=2)
+
+    def _record(self, c):
+        events = []
+        c.add_listener(lambda event, index, song: events.append(
+            (event, index, song if isinstance(song, list) else song.judul)))
+        return events
+
+    def test_row_events(self):
+        for c in self._controllers():
+            events = self._record(c)
+            c.add_song(Song("Baru", "Tulus", "Pop", "Sad"))
+            c.update_song(3, "Diubah", "Tulus", "Pop", "Happy")
+            c.delete_song(1)
+            self.assertFalse(c.delete_song(99))
+            self.assertEqual(events, [("insert", 5, "Baru"), ("update", 3, "Diubah"),
+                                      ("remove", 1, "Lagu 1")])
+            self.assertEqual([s.judul for s in c.get_all_songs()],
+                             ["Lagu 0", "Lagu 2", "Diubah", "Lagu 4", "Baru"])
+
+    def test_version_and_remove_listener(self):
+        c = SongController(_songs(2))
+        events = []
+        callback = lambda *args: events.append(args)
+        c.add_listener(callback)
+        c.add_listener(callback)                               # tidak terdaftar dua kali
+        version = c.version
+        c.add_song(Song("Baru", "Tulus", "Pop", "Sad"))
+        self.assertGreater(c.version, version)
+        c.remove_listener(callback)
+        c.delete_song(0)
+        self.assertEqual(len(events), 1)
+
+
+class DispatchAfterUnlockTest(unittest.TestCase):
+    def _reader_can_run(self, c):
+        # count() butuh read lock: kalau write lock masih dipegang, thread ini tertahan
+        done = threading.Event()
+        t = threading.Thread(target=lambda: (c.count(), done.set()))
+        t.start()
+        t.join(2)
+        return done.is_set()
+
+    def test_listener_runs_without_write_lock(self):
+        c = SongController(_songs(3))
+        seen = []
+        c.add_listener(lambda event, index, song: seen.append(self._reader_can_run(c)))
+        c.add_song(Song("Baru", "Tulus", "Pop", "Sad"))
+        c.delete_song(0)
+        self.assertEqual(seen, [True, True])
+
+    def test_batch_events_wait_for_block_end(self):
+        c = SongController(_songs(3))
+        events = []
+        c.add_listener(lambda event, index, song: events.append((event, index)))
+        with c.batch():
+            c.add_song(Song("A", "Tulus", "Pop", "Sad"))
+            c.update_song(0, "B", "Tulus", "Pop", "Sad")
+            self.assertEqual(events, [])
+        self.assertEqual(events, [("insert", 3), ("update", 0)])
+
+    def test_listener_may_modify_catalog(self):
+        c = SongController(_songs(1))
+        events = []
+
+        def listener(event, index, song):
+            events.append((event, song.judul))
+            if song.judul == "Asli":
+                c.add_song(Song("Balasan", "Tulus", "Pop", "Sad"))
+
+        c.add_listener(listener)
+        c.add_song(Song("Asli", "Tulus", "Pop", "Sad"))
+        self.assertEqual(events, [("insert", "Asli"), ("insert", "Balasan")])
+        self.assertEqual(c.count(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
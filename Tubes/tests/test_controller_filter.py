@@ -0,0 +1,87 @@
+import os
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+
+from controllers.lagu_controller import SongController
+from controllers.storage import MmapCatalogStore, SQLiteSongStore, write_binary_catalog
+from structures.song import Song
+from tests.test_storage import _catalog
+
+N = 600
+
+
+class FilterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.rows = list(_catalog(N))
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        shutil.rmtree(self.tmp)
+
+    def _controllers(self):
+        # memori penuh, SQLite dan katalog .bin yang belum dimuat: hasil harus sama
+        yield SongController([Song(r["judul"], r["artis"], r["genre"], r["vibes"]) for r in self.rows])
+        sqlite = SQLiteSongStore(os.path.join(self.tmp, "k.db"))
+        with sqlite.batch():
+            for r in self.rows:
+                sqlite.insert(Song(r["judul"], r["artis"], r["genre"], r["vibes"]))
+        self.stores.append(sqlite)
+        yield SongController(store=sqlite, page_size=50)
+        path = os.path.join(self.tmp, "k.bin")
+        write_binary_catalog(path, self.rows)
+        mmap = MmapCatalogStore(path)
+        self.stores.append(mmap)
+        yield SongController(store=mmap, page_size=50)
+
+    def _expected(self, **criteria):
+        return [i + 1 for i, r in enumerate(self.rows)
+                if all(r[f].lower() in [v.lower() for v in ([w] if isinstance(w, str) else w)]
+                       for f, w in criteria.items() if w is not None)]
+
+    def test_filter_matches_scan(self):
+        cases = [
+            {"genre": "pop"},
+            {"genre": "POP", "vibes": "sad"},
+            {"vibes": ["Sad", "dark"]},
+            {"artis": "tulus", "vibes": "happy"},
+            {"genre": "jazz"},
+            {"genre": []},
+        ]
+        for c in self._controllers():
+            for criteria in cases:
+                self.assertEqual([s.id for s in c.filter(**criteria)],
+                                 self._expected(**criteria), criteria)
+            self.assertEqual(len(c.filter()), N)
+            if c.store is not None:
+                self.assertFalse(c.is_fully_loaded())
+
+    def test_facets_and_groups(self):
+        for c in self._controllers():
+            self.assertEqual(c.facet_values("genre"),
+                             dict(Counter(r["genre"].lower() for r in self.rows)))
+            self.assertEqual(sorted(c.vibes()), ["dark", "happy", "romantic", "sad"])
+            self.assertEqual(sorted(c.genres()), ["indie", "pop", "rock"])
+            self.assertEqual([s.id for s in c.songs_by_vibe("SAD")], self._expected(vibes="sad"))
+            self.assertEqual([s.id for s in c.songs_by_genre("rock")], self._expected(genre="rock"))
+            with self.assertRaises(ValueError):
+                c.facet_values("judul")
+            if c.store is not None:
+                self.assertFalse(c.is_fully_loaded())
+
+    def test_filter_sees_edits(self):
+        for c in self._controllers():
+            c.add_song(Song("Baru", "Tulus", "Jazz", "Sad"))
+            self.assertTrue(c.delete_song(0))             # id 1, Happy
+            self.assertEqual([s.judul for s in c.filter(genre="jazz")], ["Baru"])
+            self.assertEqual(c.facet_values("genre")["jazz"], 1)
+            self.assertEqual(c.facet_values("vibes")["happy"], N // 6 - 1)
+            self.assertNotIn(1, [s.id for s in c.filter(artis="tulus")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from controllers.lagu_controller import SongController
+from controllers.storage import SQLiteSongStore
+
+
+class ImportTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        shutil.rmtree(self.tmp)
+
+    def _controllers(self):
+        # tanpa store dan dengan SQLite sementara: perilakunya harus sama
+        yield SongController()
+        store = SQLiteSongStore(os.path.join(self.tmp, f"k{len(self.stores)}.db"))
+        self.stores.append(store)
+        yield SongController(store=store)
+
+    def test_add_many_batches_and_events(self):
+        for c in self._controllers():
+            events, progress = [], []
+            c.add_listener(lambda e, i, s: events.append((e, i, len(s) if e == "insert_range" else 1)))
+            items = [{"judul": f"Lagu {i}", "artis": "A", "genre": "Pop", "vibes": "Sad"} for i in range(25)]
+            n = c.add_many(items, batch_size=10, progress=lambda done, rate: progress.append(done))
+            self.assertEqual(n, 25)
+            self.assertEqual(c.count(), 25)
+            self.assertEqual(events, [("insert_range", 0, 10), ("insert_range", 10, 10), ("insert_range", 20, 5)])
+            self.assertEqual(progress, [10, 20, 25])
+            self.assertEqual([s.judul for s in c.get_all_songs()], [f"Lagu {i}" for i in range(25)])
+            self.assertEqual(len({s.id for s in c.get_all_songs()}), 25)
+
+    def test_invalid_rows_are_reported(self):
+        for c in self._controllers():
+            c.add_many([{"judul": "Ada", "artis": "A", "id": 3}])
+            skipped = []
+            items = [
+                {"judul": "Baru", "artis": "A"},
+                {"judul": "Bentrok", "artis": "A", "id": 3},
+                {"judul": "", "artis": "A"},
+                {"judul": "Sembilan", "artis": "A", "id": 9},
+                {"judul": "Dobel", "artis": "A", "id": 9},
+                {"judul": "Salah", "artis": "A", "id": "x"},
+                "bukan dict",
+            ]
+            n = c.add_many(items, batch_size=4, on_skip=lambda no, item, why: skipped.append(no))
+            self.assertEqual(n, 2)
+            self.assertEqual(skipped, [2, 3, 5, 6, 7])
+            self.assertEqual([s.judul for s in c.get_all_songs()], ["Ada", "Baru", "Sembilan"])
+            self.assertIsNotNone(c.get_song_by_id(9))
+
+    def test_invalid_row_without_on_skip_raises(self):
+        for c in self._controllers():
+            c.add_many([{"judul": "Ada", "artis": "A", "id": 3}])
+            with self.assertRaisesRegex(ValueError, "data ke-2"):
+                c.add_many([{"judul": "Baru", "artis": "A"}, {"judul": "Bentrok", "artis": "A", "id": 3}])
+            # batch yang bentrok tidak masuk sama sekali
+            self.assertEqual(c.count(), 1)
+
+    def test_import_stream_csv_and_jsonl(self):
+        csv_path = os.path.join(self.tmp, "lagu.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            f.write("judul,artis,genre,vibes\nMonokrom,Tulus,Pop,Happy\nSempurna,Andra,Rock,Romantic\n")
+        jsonl_path = os.path.join(self.tmp, "lagu.jsonl")
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"judul": "Lovely", "artis": "Billie", "genre": "Indie", "vibes": "Sad"}) + "\n\n")
+        for c in self._controllers():
+            self.assertEqual(c.import_stream(csv_path), 2)
+            self.assertEqual(c.import_stream(jsonl_path), 1)
+            self.assertEqual([s.judul for s in c.get_all_songs()], ["Monokrom", "Sempurna", "Lovely"])
+        with self.assertRaises(ValueError):
+            SongController().import_stream(os.path.join(self.tmp, "lagu.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
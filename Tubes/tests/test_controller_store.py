@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from controllers.lagu_controller import SongController
+from controllers.storage import SQLiteSongStore
+from structures.song import Song
+
+N = 95
+
+
+def _songs():
+    vibes = ("Sad", "Happy", "Dark")
+    return [Song(f"Lagu {i}", f"Artis {i % 7}", "Pop", vibes[i % 3]) for i in range(N)]
+
+
+class SQLiteControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLiteSongStore(":memory:")
+        SongController(_songs(), store=self.store)            # isi store yang masih kosong
+        self.c = SongController(store=self.store, page_size=10)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_opens_without_loading(self):
+        c = self.c
+        self.assertEqual(c.count(), N)
+        self.assertEqual(c.songs.size, 0)
+        self.assertFalse(c.is_fully_loaded())
+
+    def test_get_song_at_loads_pages_on_demand(self):
+        c = self.c
+        self.assertEqual(c.get_song_at(25).judul, "Lagu 25")
+        self.assertEqual(c.songs.size, 30)
+        self.assertIsNone(c.get_song_at(N))
+        self.assertTrue(c.is_fully_loaded())
+        self.assertIsNone(c.get_song_at(N))
+
+    def test_load_more_and_load_all(self):
+        c = self.c
+        self.assertTrue(c.load_more())
+        self.assertEqual(c.songs.size, 10)
+        c.load_all()
+        self.assertTrue(c.is_fully_loaded())
+        self.assertFalse(c.load_more())
+        self.assertEqual([s.id for s in c.get_all_songs()], list(range(1, N + 1)))
+
+    def test_iter_songs_reads_rest_from_store(self):
+        c = self.c
+        c.get_song_at(12)
+        self.assertEqual([s.judul for s in c.iter_songs()], [f"Lagu {i}" for i in range(N)])
+        self.assertEqual(c.songs.size, 20)
+        # Song yang sama dipakai ulang begitu halamannya dimuat
+        song = c.get_all_songs()[50]
+        self.assertIs(c.get_song_at(50), song)
+
+    def test_search_runs_in_store(self):
+        c = self.c
+        self.assertEqual([s.judul for s in c.search("lagu 9")], ["Lagu 9"] + [f"Lagu {i}" for i in range(90, N)])
+        self.assertEqual(len(c.search("ARTIS 3")), len([i for i in range(N) if i % 7 == 3]))
+        self.assertEqual(c.get_song_by_id(80).judul, "Lagu 79")
+        self.assertEqual(c.songs.size, 0)
+
+    def test_edits_reach_store(self):
+        c = self.c
+        c.update_song(40, "Diubah", "Tulus", "Pop", "Sad")
+        c.delete_song(0)
+        c.add_song(Song("Baru", "Tulus", "Pop", "Sad"))
+        self.assertEqual(self.store.get(41)[1], "Diubah")
+        self.assertIsNone(self.store.get(1))
+        self.assertEqual(self.store.count(), N)
+        self.assertEqual(c.count(), N)
+        self.assertEqual([s.judul for s in c.search("tulus")], ["Diubah", "Baru"])
+
+
+class SQLitePersistenceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "katalog.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_reopen_keeps_catalog(self):
+        store = SQLiteSongStore(self.path)
+        c = SongController(_songs(), store=store, page_size=10)
+        c.delete_song(3)
+        c.add_song(Song("Baru", "Tulus", "Pop", "Sad"))
+        expected = [(s.id, s.judul) for s in c.get_all_songs()]
+        store.close()
+
+        store = SQLiteSongStore(self.path)
+        try:
+            # initial_data diabaikan karena store sudah berisi
+            c = SongController(_songs(), store=store, page_size=10)
+            self.assertEqual([(s.id, s.judul) for s in c.iter_songs()], expected)
+            self.assertEqual(c.add_song(Song("Lagi", "Tulus", "Pop", "Sad")).id, N + 2)
+        finally:
+            store.close()
+
+    def test_batch_rolls_back_store(self):
+        store = SQLiteSongStore(self.path)
+        try:
+            SongController(_songs(), store=store)
+            with self.assertRaises(RuntimeError):
+                with store.batch():
+                    store.insert(Song("Hilang", "Tulus", "Pop", "Sad"))
+                    raise RuntimeError
+            self.assertEqual(store.count(), N)
+            self.assertEqual(store.search("hilang"), [])
+        finally:
+            store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
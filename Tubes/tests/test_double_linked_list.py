@@ -0,0 +1,115 @@
+import random
+import unittest
+
+from structures.double_linked_list import DoubleLinkedList
+from structures.indexed_skip_list import IndexedSkipList
+from structures.song import Song
+
+
+class HandleIndexTest(unittest.TestCase):
+    def test_find_and_remove_with_duplicates(self):
+        lst = DoubleLinkedList()
+        a1 = lst.add_last("a")
+        lst.add_last("b")
+        a0 = lst.add_first("a")
+        self.assertIs(lst.find_node("a"), a0)
+        self.assertTrue(lst.remove("a"))
+        self.assertIs(lst.find_node("a"), a1)
+        self.assertTrue(lst.remove_node(a1))
+        self.assertIsNone(lst.find_node("a"))
+        self.assertFalse(lst.remove("a"))
+        self.assertEqual(list(lst), ["b"])
+
+    def test_stale_handle_rejected(self):
+        lst = DoubleLinkedList()
+        node = lst.add_last("a")
+        self.assertTrue(lst.remove_node(node))
+        self.assertFalse(lst.remove_node(node))
+        node = lst.add_last("b")
+        lst.clear()
+        self.assertFalse(lst.contains_node(node))
+
+    def test_title_index_follows_reindex(self):
+        lst = DoubleLinkedList()
+        song = Song("Monokrom", "Tulus", "Pop", "Happy")
+        lst.add_last(song)
+        lst.add_last(Song("monokrom", "Lain", "Pop", "Sad"))
+        self.assertIs(lst.search_by_title("MONOKROM"), song)
+        song.set_fields("Gajah", song.artis, song.genre, song.vibes)
+        lst.reindex(song)
+        self.assertIs(lst.search_by_title("gajah"), song)
+        self.assertEqual(lst.search_by_title("monokrom").artis, "Lain")
+
+    def test_nodes_have_no_dict(self):
+        for cls in (DoubleLinkedList, IndexedSkipList):
+            node = cls().add_last("a")
+            self.assertFalse(hasattr(node, "__dict__"), cls.__name__)
+
+
+class GroupChainTest(unittest.TestCase):
+    def test_chains_follow_list_order(self):
+        rng = random.Random(5)
+        for cls in (DoubleLinkedList, IndexedSkipList):
+            lst = cls()
+            ref = []
+            for i in range(600):
+                song = Song(f"t{i}", "a", rng.choice(["Pop", "Rock"]), rng.choice(["Sad", "Happy", "Chill"]))
+                op = rng.random()
+                if op < 0.4 or not ref:
+                    pos = rng.randint(0, len(ref))
+                    lst.insert_at(pos, song)
+                    ref.insert(pos, song)
+                elif op < 0.6:
+                    lst.extend([song])
+                    ref.append(song)
+                elif op < 0.8:
+                    other = rng.choice(ref)
+                    other.set_fields(other.judul, other.artis, rng.choice(["Pop", "Rock"]), other.vibes)
+                    lst.reindex(other)
+                else:
+                    pos = rng.randrange(len(ref))
+                    lst.delete_at(pos)
+                    ref.pop(pos)
+            for field in ("vibes", "genre"):
+                for value in {getattr(s, field) for s in ref}:
+                    expected = [s for s in ref if getattr(s, field) == value]
+                    self.assertEqual(list(lst.iter_group(field, value)), expected)
+                    # pointer mundur dan ekor rantai juga harus ikut benar
+                    prefix = lst.GROUPS[field]
+                    node = lst._groups[field][value.lower()][1]
+                    backward = []
+                    while node:
+                        backward.append(node.data)
+                        node = getattr(node, prefix + "_prev")
+                    self.assertEqual(backward, expected[::-1])
+
+    def test_remove_keeps_chain_ends(self):
+        lst = DoubleLinkedList()
+        songs = [Song(f"t{i}", "x", "Pop", "Sad") for i in range(4)]
+        nodes = lst.extend(songs)
+        lst.remove_node(nodes[0])
+        lst.remove_node(nodes[3])
+        self.assertIs(lst.group_first("vibes", "sad"), nodes[1])
+        self.assertEqual(lst._groups["vibes"]["sad"], [nodes[1], nodes[2]])
+        lst.remove_node(nodes[1])
+        lst.remove_node(nodes[2])
+        self.assertEqual(lst.group_values("vibes"), [])
+        self.assertIsNone(lst.group_first("vibes", "sad"))
+
+    def test_follow_mode_walks_group(self):
+        lst = DoubleLinkedList()
+        songs = [Song("a", "x", "Pop", "Sad"), Song("b", "x", "Rock", "Happy"),
+                 Song("c", "x", "Pop", "Sad"), Song("d", "x", "Pop", "Happy")]
+        lst.extend(songs)
+        lst.set_follow_mode("vibes")
+        lst.current = lst.head
+        self.assertIs(lst.next_song_smart(), songs[2])
+        self.assertIsNone(lst.next_song_smart())
+        lst.set_repeat_mode(1)
+        self.assertIs(lst.next_song_smart(), songs[0])
+        with self.assertRaises(ValueError):
+            lst.set_follow_mode("artis")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from controllers.exporter import FIELDS, export_catalog, export_playlist, export_queue
+from controllers.lagu_controller import SongController
+from controllers.storage import SQLiteSongStore
+from structures.double_linked_list import DoubleLinkedList
+from structures.queue import Queue
+from structures.song import Song
+
+
+def _songs(n):
+    return [Song(f"Lagu, \"{i}\"", "Tulus", "Pop", "Sad") for i in range(n)]
+
+
+class ExportTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _path(self, name):
+        return os.path.join(self.tmp, name)
+
+    def test_catalog_round_trip(self):
+        store = SQLiteSongStore(":memory:")
+        try:
+            c = SongController(_songs(23), store=store, page_size=5)
+            c.delete_song(2)
+            expected = [(s.id, s.judul) for s in c.get_all_songs()]
+            c = SongController(store=store, page_size=5)        # belum ada yang dimuat
+            for name in ("katalog.csv", "katalog.jsonl"):
+                self.assertEqual(export_catalog(c, self._path(name), chunk_size=4), 22)
+                self.assertEqual(c.songs.size, 0)
+                back = SongController()
+                self.assertEqual(back.import_stream(self._path(name)), 22)
+                self.assertEqual([(s.id, s.judul) for s in back.get_all_songs()], expected, name)
+        finally:
+            store.close()
+
+    def test_csv_layout(self):
+        c = SongController(_songs(2))
+        export_catalog(c, self._path("k.csv"))
+        with open(self._path("k.csv"), newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], list(FIELDS))
+        self.assertEqual(rows[1], ["1", "Lagu, \"0\"", "Tulus", "Pop", "Sad"])
+
+    def test_playlist_and_queue(self):
+        songs = _songs(5)
+        playlist = DoubleLinkedList()
+        for s in reversed(songs):
+            playlist.add_last(s)
+        queue = Queue()
+        for s in songs:
+            queue.enqueue(s)
+        queue.move_to_front(songs[3])
+
+        self.assertEqual(export_playlist(playlist, self._path("p.jsonl")), 5)
+        with open(self._path("p.jsonl"), encoding="utf-8") as f:
+            self.assertEqual([json.loads(line)["judul"] for line in f], [s.judul for s in reversed(songs)])
+
+        self.assertEqual(export_queue(queue, self._path("q.jsonl"), chunk_size=2), 5)
+        with open(self._path("q.jsonl"), encoding="utf-8") as f:
+            self.assertEqual([json.loads(line)["judul"] for line in f],
+                             [songs[i].judul for i in (3, 0, 1, 2, 4)])
+        self.assertEqual(len(queue), 5)                          # antrian tidak berubah
+
+    def test_unknown_format(self):
+        c = SongController(_songs(1))
+        with self.assertRaises(ValueError):
+            export_catalog(c, self._path("k.txt"))
+        with self.assertRaises(ValueError):
+            export_catalog(c, self._path("k.csv"), format="xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from structures.fuzzy_index import FuzzyIndex, bounded_levenshtein
+from structures.song import Song
+
+
+def _songs():
+    data = [
+        ("Hati-Hati di Jalan", "Tulus", "Pop", "Sad"),
+        ("Monokrom", "Tulus", "Pop", "Happy"),
+        ("Bad Guy", "Billie Eilish", "Pop", "Dark"),
+        ("Lovely", "Billie Eilish", "Indie", "Sad"),
+        ("Sempurna", "Andra and The Backbone", "Rock", "Romantic"),
+    ]
+    return [Song(*row, song_id=i) for i, row in enumerate(data, 1)]
+
+
+class FuzzyIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = FuzzyIndex()
+        self.index.add_many(_songs())
+
+    def test_bounded_levenshtein(self):
+        self.assertEqual(bounded_levenshtein("kitten", "sitting", 3), 3)
+        self.assertIsNone(bounded_levenshtein("kitten", "sitting", 2))
+        self.assertEqual(bounded_levenshtein("abc", "abc", 0), 0)
+
+    def test_typo_finds_song(self):
+        ranked = self.index.search("bilie eilish")
+        self.assertEqual({song_id for _, song_id in ranked}, {3, 4})
+        self.assertEqual(self.index.search("monokrom")[0], (0, 2))
+        self.assertEqual(self.index.search("qqqqqq"), [])
+
+    def test_remove(self):
+        songs = _songs()
+        self.index.remove(songs[1])
+        self.assertEqual(self.index.search("monokrom"), [])
+
+    def test_cancel_is_checked(self):
+        class Cancelled(Exception):
+            pass
+
+        class Token:
+            def check(self):
+                raise Cancelled
+
+        with self.assertRaises(Cancelled):
+            self.index.search("bilie", cancel=Token())
+
+
+if __name__ == "__main__":
+    unittest.main()
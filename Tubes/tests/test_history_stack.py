@@ -0,0 +1,44 @@
+import unittest
+
+from structures.stack import HistoryStack
+
+
+class HistoryStackTest(unittest.TestCase):
+    def test_lifo(self):
+        h = HistoryStack(5)
+        for x in range(3):
+            h.push(x)
+        self.assertEqual(h.peek(), 2)
+        self.assertEqual([h.pop() for _ in range(3)], [2, 1, 0])
+        self.assertIsNone(h.pop())
+        self.assertIsNone(h.peek())
+
+    def test_capacity_drops_oldest(self):
+        h = HistoryStack(3)
+        for x in range(10):
+            h.push(x)
+        self.assertEqual(len(h), 3)
+        self.assertEqual(list(h), [9, 8, 7])
+        self.assertEqual(h.display(), [9, 8, 7])
+
+    def test_pop_then_push_after_wrap(self):
+        h = HistoryStack(3)
+        for x in range(5):
+            h.push(x)
+        self.assertEqual(h.pop(), 4)
+        h.push("n")
+        self.assertEqual(list(h), ["n", 3, 2])
+
+    def test_collapse_repeats(self):
+        h = HistoryStack(10, collapse_repeats=True)
+        for x in ["a", "a", "b", "b", "a"]:
+            h.push(x)
+        self.assertEqual(list(h), ["a", "b", "a"])
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            HistoryStack(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from structures.double_linked_list import DoubleLinkedList
+from structures.indexed_skip_list import IndexedSkipList
+
+
+def _nodes(lst):
+    node = lst.head
+    while node:
+        yield node
+        node = node.next
+
+
+class IndexedSkipListTest(unittest.TestCase):
+    def test_random_ops_match_python_list(self):
+        rng = random.Random(7)
+        lst = IndexedSkipList(seed=1)
+        ref = []
+        for i in range(2000):
+            op = rng.random()
+            if op < 0.45 or not ref:
+                pos = rng.randint(0, len(ref))
+                lst.insert_at(pos, i)
+                ref.insert(pos, i)
+            elif op < 0.6:
+                lst.extend([i, i + 10_000])
+                ref.extend([i, i + 10_000])
+            else:
+                pos = rng.randrange(len(ref))
+                self.assertTrue(lst.delete_at(pos))
+                ref.pop(pos)
+        self.assertEqual(lst.size, len(ref))
+        self.assertEqual(list(lst), ref)
+        for pos in range(0, len(ref), 37):
+            self.assertEqual(lst.get_node(pos).data, ref[pos])
+        self.assertEqual([n.data for n in reversed(list(_nodes(lst)))],
+                         ref[::-1])
+
+    def test_index_of_and_rank(self):
+        lst = IndexedSkipList(seed=3)
+        lst.extend(range(500))
+        lst.insert_at(0, "first")
+        lst.delete_at(250)
+        ref = list(lst)
+        for pos in (0, 1, 249, 250, len(ref) - 1):
+            self.assertEqual(lst.index_of(ref[pos]), pos)
+            self.assertEqual(lst._rank(lst.get_node(pos)), pos)
+        self.assertEqual(lst.index_of("tidak ada"), -1)
+
+    def test_out_of_range(self):
+        lst = IndexedSkipList()
+        self.assertIsNone(lst.get_node(0))
+        self.assertFalse(lst.delete_at(0))
+        lst.add_last("a")
+        self.assertIsNone(lst.get_node(1))
+        self.assertIsNone(lst.get_node(-1))
+
+    def test_head_tail_after_edits(self):
+        lst = IndexedSkipList()
+        lst.add_last("b")
+        lst.add_first("a")
+        lst.add_last("c")
+        self.assertEqual((lst.head.data, lst.tail.data), ("a", "c"))
+        lst.delete_at(2)
+        self.assertEqual(lst.tail.data, "b")
+        lst.delete_at(0)
+        self.assertEqual((lst.head.data, lst.tail.data), ("b", "b"))
+
+    def test_order_labels_follow_position(self):
+        for cls in (DoubleLinkedList, IndexedSkipList):
+            lst = cls()
+            lst.extend(range(10))
+            # sisipan berulang di celah yang sama memaksa relabel
+            for i in range(100):
+                lst.insert_at(1, f"x{i}")
+            nodes = list(_nodes(lst))
+            keys = [n.order for n in nodes]
+            self.assertEqual(keys, sorted(keys), cls.__name__)
+            self.assertEqual(len(set(keys)), len(keys))
+            self.assertEqual(lst.sort_nodes(nodes[::-1]), nodes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from structures.inverted_index import InvertedIndex
+from structures.song import Song
+
+
+def _songs():
+    data = [
+        ("Hati-Hati di Jalan", "Tulus", "Pop", "Sad"),
+        ("Monokrom", "Tulus", "Pop", "Happy"),
+        ("Bad Guy", "Billie Eilish", "Pop", "Dark"),
+        ("Lovely", "Billie Eilish", "Indie", "Sad"),
+        ("Sempurna", "Andra and The Backbone", "Rock", "Romantic"),
+    ]
+    return [Song(*row, song_id=i) for i, row in enumerate(data, 1)]
+
+
+class InvertedIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.songs = _songs()
+        self.index = InvertedIndex()
+        self.index.add_many(self.songs)
+
+    def test_substring_candidates_cover_matches(self):
+        for kw in ("tulus", "lie", "hati", "romantic", "ban"):
+            expected = {s.id for s in self.songs
+                        if any(kw in getattr(s, f).lower() for f in InvertedIndex.FIELDS)}
+            self.assertLessEqual(expected, self.index.substring_candidates(kw), kw)
+        self.assertEqual(self.index.substring_candidates("zzz"), set())
+        self.assertIsNone(self.index.substring_candidates("ab"))
+
+    def test_token_matches_whole_words(self):
+        self.assertEqual(self.index.token_matches("billie sad"), {4})
+        self.assertEqual(self.index.token_matches("Tulus"), {1, 2})
+        self.assertEqual(self.index.token_matches("tul"), set())
+
+    def test_add_many_equals_add(self):
+        one = InvertedIndex()
+        for s in self.songs:
+            one.add(s)
+        self.assertEqual(one._grams, self.index._grams)
+        self.assertEqual(one._tokens, self.index._tokens)
+
+    def test_remove(self):
+        self.index.remove(self.songs[0])
+        self.assertEqual(self.index.token_matches("tulus"), {2})
+        self.assertNotIn(1, self.index.substring_candidates("hati"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from structures.queue import Queue
+
+
+class QueueTest(unittest.TestCase):
+    def test_fifo(self):
+        q = Queue()
+        for x in "abc":
+            q.enqueue(x)
+        self.assertEqual(len(q), 3)
+        self.assertEqual(q.peek(), "a")
+        self.assertEqual([q.dequeue() for _ in range(3)], ["a", "b", "c"])
+        self.assertIsNone(q.dequeue())
+        self.assertTrue(q.is_empty())
+
+    def test_iteration_does_not_consume(self):
+        q = Queue()
+        for x in "abc":
+            q.enqueue(x)
+        self.assertEqual(list(q), ["a", "b", "c"])
+        self.assertEqual(q.to_list(), ["a", "b", "c"])
+        self.assertEqual(q.size(), 3)
+
+    def test_remove_by_item_takes_first_copy(self):
+        q = Queue()
+        for x in "abab":
+            q.enqueue(x)
+        self.assertTrue(q.remove("a"))
+        self.assertEqual(list(q), ["b", "a", "b"])
+        self.assertIn("a", q)
+        self.assertTrue(q.remove("a"))
+        self.assertNotIn("a", q)
+        self.assertFalse(q.remove("a"))
+
+    def test_handles_target_exact_entry(self):
+        q = Queue()
+        first = q.enqueue("x")
+        q.enqueue("y")
+        second = q.enqueue("x")
+        self.assertTrue(q.move_after(second, None))
+        self.assertEqual(list(q), ["x", "x", "y"])
+        self.assertTrue(q.remove(first))
+        self.assertEqual(list(q), ["x", "y"])
+        self.assertIs(q.head, second)
+        # handle yang sudah keluar tidak berlaku lagi
+        self.assertFalse(q.remove(first))
+        self.assertEqual(q.dequeue(), "x")
+        self.assertFalse(q.move_after(second, None))
+
+    def test_move_after_and_front(self):
+        q = Queue()
+        handles = [q.enqueue(x) for x in "abcd"]
+        self.assertTrue(q.move_after("d", "a"))
+        self.assertEqual(list(q), ["a", "d", "b", "c"])
+        self.assertTrue(q.move_to_front(handles[2]))
+        self.assertEqual(list(q), ["c", "a", "d", "b"])
+        self.assertEqual(q.tail.data, "b")
+        self.assertFalse(q.move_after("a", "a"))
+        self.assertFalse(q.move_after("zz", "a"))
+
+    def test_foreign_handle_rejected(self):
+        a, b = Queue(), Queue()
+        node = a.enqueue("x")
+        b.enqueue("x")
+        self.assertFalse(b.remove(node))
+        self.assertEqual(len(b), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
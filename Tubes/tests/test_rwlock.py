@@ -0,0 +1,90 @@
+import threading
+import time
+import unittest
+
+from controllers.rwlock import RWLock
+
+
+class RWLockTest(unittest.TestCase):
+    def test_readers_share(self):
+        lock = RWLock()
+        inside = threading.Barrier(3, timeout=2)
+
+        def reader():
+            with lock.read():
+                inside.wait()     # hanya lolos kalau ketiganya di dalam bersamaan
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(2)
+        self.assertFalse(inside.broken)
+
+    def test_writer_excludes_readers(self):
+        lock = RWLock()
+        events = []
+        with lock.write():
+            t = threading.Thread(target=lambda: (lock.acquire_read(), events.append("read"), lock.release_read()))
+            t.start()
+            time.sleep(0.05)
+            self.assertEqual(events, [])
+            events.append("write done")
+        t.join(2)
+        self.assertEqual(events, ["write done", "read"])
+
+    def test_reentrant(self):
+        lock = RWLock()
+        with lock.write():
+            with lock.write():
+                self.assertTrue(lock.holds_write())
+            with lock.read():
+                pass
+            self.assertTrue(lock.holds_write())
+        self.assertFalse(lock.holds_write())
+        with lock.read():
+            with lock.read():
+                pass
+
+    def test_upgrade_rejected(self):
+        lock = RWLock()
+        with lock.read():
+            with self.assertRaises(RuntimeError):
+                lock.acquire_write()
+
+    def test_waiting_writer_blocks_new_readers(self):
+        lock = RWLock()
+        order = []
+        lock.acquire_read()
+
+        def writer():
+            with lock.write():
+                order.append("writer")
+
+        def reader():
+            with lock.read():
+                order.append("reader")
+
+        w = threading.Thread(target=writer)
+        w.start()
+        while not lock._writers_waiting:
+            time.sleep(0.001)
+        r = threading.Thread(target=reader)
+        r.start()
+        time.sleep(0.05)
+        self.assertEqual(order, [])
+        lock.release_read()
+        w.join(2)
+        r.join(2)
+        self.assertEqual(order, ["writer", "reader"])
+
+    def test_release_without_acquire(self):
+        lock = RWLock()
+        with self.assertRaises(RuntimeError):
+            lock.release_read()
+        with self.assertRaises(RuntimeError):
+            lock.release_write()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from controllers.cancel import CancelToken, SearchCancelled
+from controllers.lagu_controller import SongController
+from controllers.search_session import SearchSession
+from structures.song import Song
+
+
+class SearchSessionTest(unittest.TestCase):
+    def setUp(self):
+        self.c = SongController([
+            Song("Hati-Hati di Jalan", "Tulus", "Pop", "Sad"),
+            Song("Monokrom", "Tulus", "Pop", "Happy"),
+            Song("Bad Guy", "Billie Eilish", "Pop", "Dark"),
+            Song("Lovely", "Billie Eilish", "Indie", "Sad"),
+        ])
+        self.full_searches = []
+        search = self.c.search
+
+        def counting_search(keyword, cancel=None):
+            self.full_searches.append(keyword)
+            return search(keyword, cancel=cancel)
+
+        self.c.search = counting_search
+        self.session = SearchSession(self.c)
+
+    def _judul(self, songs):
+        return [s.judul for s in songs]
+
+    def test_refinement_filters_previous_results(self):
+        self.assertEqual(self._judul(self.session.query("tu")), ["Hati-Hati di Jalan", "Monokrom"])
+        self.assertEqual(self._judul(self.session.query("TULUS hap")), [])
+        self.assertEqual(self._judul(self.session.query("tulus")), ["Hati-Hati di Jalan", "Monokrom"])
+        self.assertEqual(self._judul(self.session.query("tulus ")), ["Hati-Hati di Jalan", "Monokrom"])
+        self.assertEqual(self._judul(self.session.query("tuluss")), [])
+        # hanya "tulus" (melebar dari "tulus hap") yang butuh search penuh lagi
+        self.assertEqual(self.full_searches, ["tu", "tulus"])
+
+    def test_catalog_change_forces_full_search(self):
+        self.session.query("bil")
+        self.c.add_song(Song("Billie Jean", "Michael Jackson", "Pop", "Happy"))
+        self.assertEqual(self._judul(self.session.query("bill")), ["Bad Guy", "Lovely", "Billie Jean"])
+        self.assertEqual(self.full_searches, ["bil", "bill"])
+
+    def test_empty_query_returns_catalog_and_resets(self):
+        self.session.query("tulus")
+        self.assertEqual(len(self.session.query("  ")), 4)
+        self.session.query("tulus x")
+        self.assertEqual(self.full_searches, ["tulus", "tulus x"])
+
+    def test_cancelled_query_is_not_cached(self):
+        self.session.query("l")
+        token = CancelToken()
+        token.cancel()
+        with self.assertRaises(SearchCancelled):
+            self.session.query("lo", cancel=token)
+        self.assertEqual(self._judul(self.session.query("lov")), ["Lovely"])
+        self.assertEqual(self.full_searches, ["l"])
+
+
+if __name__ == "__main__":
+    unittest.main()
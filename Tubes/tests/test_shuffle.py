@@ -0,0 +1,61 @@
+import unittest
+
+from structures.double_linked_list import DoubleLinkedList
+from structures.shuffle import ShuffleOrder
+
+
+class ShuffleOrderTest(unittest.TestCase):
+    def test_each_cycle_plays_everything_once(self):
+        items = list(range(25))
+        order = ShuffleOrder(items, seed=4)
+        for _ in range(3):
+            cycle = [order.next() for _ in items]
+            self.assertEqual(sorted(cycle), items)
+
+    def test_no_immediate_repeat_across_cycles(self):
+        order = ShuffleOrder(range(5), seed=1)
+        last = None
+        for _ in range(50):
+            cur = order.next()
+            self.assertNotEqual(cur, last)
+            last = cur
+
+    def test_prev_walks_back_through_history(self):
+        order = ShuffleOrder(range(10), seed=2)
+        played = [order.next() for _ in range(4)]
+        self.assertEqual(order.prev(), played[2])
+        self.assertEqual(order.prev(), played[1])
+        self.assertEqual(order.next(), played[2])
+        self.assertEqual(order.next(), played[3])
+
+    def test_add_and_discard_during_cycle(self):
+        order = ShuffleOrder(range(6), seed=3)
+        first = [order.next() for _ in range(3)]
+        order.discard(first[1])          # sudah diputar
+        unplayed = next(i for i in range(6) if i not in first)
+        order.discard(unplayed)          # belum diputar
+        order.add(100)
+        rest = [order.next() for _ in range(len(order) - 2)]
+        self.assertEqual(sorted(first[::2] + rest), sorted(set(range(6)) - {first[1], unplayed} | {100}))
+        self.assertEqual(len(order), 5)
+
+    def test_seek_sets_current(self):
+        order = ShuffleOrder(range(8), seed=5)
+        order.seek(6)
+        self.assertEqual(order.current(), 6)
+        seen = {6} | {order.next() for _ in range(7)}
+        self.assertEqual(seen, set(range(8)))
+
+    def test_linked_list_shuffle_covers_playlist(self):
+        lst = DoubleLinkedList()
+        lst.extend(range(12))
+        lst.current = lst.head
+        lst.enable_shuffle(True, seed=9)
+        seen = {lst.get_current()}
+        for _ in range(11):
+            seen.add(lst.next_song_smart())
+        self.assertEqual(seen, set(range(12)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from controllers.lagu_controller import SongController
+from controllers.storage import MmapCatalogStore, OverlayStore, SongStore, write_binary_catalog
+from structures.song import Song
+
+ROWS = [
+    {"judul": "Monokrom", "artis": "Tulus", "genre": "Pop", "vibes": "Happy"},
+    {"judul": "Hati-Hati di Jalan", "artis": "Tulus", "genre": "Pop", "vibes": "Sad"},
+    {"judul": "Lovely", "artis": "Billie Eilish", "genre": "Indie", "vibes": "Sad"},
+    {"judul": "Bad Guy", "artis": "Billie Eilish", "genre": "Pop", "vibes": "Dark"},
+    {"judul": "Sempurna", "artis": "Andra", "genre": "Rock", "vibes": "Romantic"},
+    {"judul": "Tulang Rusuk", "artis": "Andra", "genre": "Rock", "vibes": "Sad"},
+]
+
+
+def _catalog(n):
+    for i in range(n):
+        row = dict(ROWS[i % len(ROWS)])
+        row["judul"] = f"{row['judul']} {i}"
+        yield row
+
+
+class MmapCatalogStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "katalog.bin")
+        self.rows = list(_catalog(300))
+        write_binary_catalog(self.path, self.rows)
+        self.store = MmapCatalogStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmp)
+
+    def test_rows_and_paging(self):
+        self.assertEqual(self.store.count(), 300)
+        self.assertEqual(self.store.get(1), (1, "Monokrom 0", "Tulus", "Pop", "Happy"))
+        self.assertIsNone(self.store.get(301))
+        page = self.store.fetch_page(10, 5)
+        self.assertEqual([r[0] for r in page], [11, 12, 13, 14, 15])
+        self.assertEqual(len(list(self.store.iter_rows(chunk=7))), 300)
+        self.assertEqual(self.store.max_id(), 300)
+
+    def test_search_matches_scan(self):
+        for kw in ("tulus", "LOVE", "ra", "d", "hati-hati", "29", "tidak ada"):
+            expected = [i + 1 for i, r in enumerate(self.rows)
+                        if any(kw.lower() in r[f].lower() for f in ("judul", "artis", "genre", "vibes"))]
+            self.assertEqual([r[0] for r in self.store.search(kw)], expected, kw)
+
+    def test_complete(self):
+        self.assertEqual(self.store.complete("tu", 2), [("Tulus", 100), ("Tulang Rusuk 101", 1)])
+        self.assertEqual(self.store.complete("BILLIE", 5), [("Billie Eilish", 100)])
+        self.assertEqual(self.store.complete("zzz", 5), [])
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.store.insert(Song("a", "b", "c", "d"))
+
+    def test_bad_magic(self):
+        bad = os.path.join(self.tmp, "bukan.bin")
+        with open(bad, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            MmapCatalogStore(bad)
+
+    def test_store_is_abstract(self):
+        with self.assertRaises(TypeError):
+            SongStore()
+
+
+class OverlayStoreTest(MmapCatalogStoreTest):
+    def setUp(self):
+        super().setUp()
+        self.overlay = OverlayStore(self.store)
+
+    def test_overlay_merges_edits(self):
+        ov = self.overlay
+        ov.update(Song("Monokrom Baru", "Tulus", "Pop", "Happy", song_id=1))
+        ov.delete(2)
+        new_id = ov.insert(Song("Gajah", "Tulus", "Pop", "Happy"))
+        self.assertEqual(new_id, 301)
+        self.assertEqual(ov.count(), 300)
+        self.assertEqual(ov.get(1)[1], "Monokrom Baru")
+        self.assertIsNone(ov.get(2))
+        ids = [r[0] for r in ov.iter_rows(chunk=50)]
+        self.assertEqual(ids, [1] + list(range(3, 302)))
+        self.assertEqual([r[0] for r in ov.search("gajah")], [301])
+        self.assertEqual([r[0] for r in ov.search("monokrom baru")], [1])
+        self.assertNotIn(2, [r[0] for r in ov.search("hati")])
+        # bawah tidak berubah
+        self.assertEqual(self.store.get(1)[1], "Monokrom 0")
+
+    def test_overlay_ids(self):
+        ov = self.overlay
+        with self.assertRaises(ValueError):
+            ov.insert(Song("x", "y", "z", "w", song_id=5))
+        ov.delete(5)
+        self.assertEqual(ov.insert(Song("x", "y", "z", "w", song_id=5)), 5)
+        self.assertEqual(ov.get(5)[1], "x")
+        ov.insert(Song("tengah", "y", "z", "w", song_id=1000))
+        ov.delete(1000)
+        self.assertIsNone(ov.get(1000))
+        self.assertEqual(ov.count(), 300)
+
+    def test_overlay_complete_counts(self):
+        ov = self.overlay
+        ov.delete(1)                                           # satu lagu Tulus hilang
+        ov.insert(Song("Tumbuh", "Tulus", "Pop", "Happy"))
+        ov.insert(Song("Tumbuh", "Lain", "Pop", "Happy"))
+        self.assertEqual(ov.complete("tu", 2), [("Tulus", 100), ("Tumbuh", 2)])
+
+
+class MmapControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        path = os.path.join(self.tmp, "katalog.bin")
+        write_binary_catalog(path, _catalog(3000))
+        self.c = SongController(store=MmapCatalogStore(path), page_size=100)
+
+    def tearDown(self):
+        self.c.store.close()
+        shutil.rmtree(self.tmp)
+
+    def test_edits_do_not_load_catalog(self):
+        c = self.c
+        first = c.get_song_at(0)
+        self.assertTrue(c.update_song(0, "Judul Baru", first.artis, first.genre, first.vibes))
+        self.assertTrue(c.delete_song(1))
+        c.add_song(Song("Lagu Tambahan", "Tulus", "Pop", "Sad"))
+        self.assertLessEqual(c.songs.size, 200)
+        self.assertFalse(c.is_fully_loaded())
+        self.assertEqual(c.count(), 3000)
+        self.assertEqual([s.judul for s in c.search("judul baru")], ["Judul Baru"])
+        self.assertEqual([s.id for s in c.search("tambahan")], [3001])
+        self.assertNotIn(2, [s.id for s in c.search("hati-hati")])
+        self.assertEqual(c.autocomplete("lagu t"), ["Lagu Tambahan"])
+        songs = c.get_all_songs()
+        self.assertEqual(len(songs), 3000)
+        self.assertEqual((songs[0].judul, songs[-1].judul), ("Judul Baru", "Lagu Tambahan"))
+        c.load_all()
+        self.assertEqual([s.id for s in c.get_all_songs()], [s.id for s in songs])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from structures.song import Song
+from structures.trie import PrefixTrie
+
+
+def _songs():
+    data = [
+        ("Hati-Hati di Jalan", "Tulus", "Pop", "Sad"),
+        ("Monokrom", "Tulus", "Pop", "Happy"),
+        ("Bad Guy", "Billie Eilish", "Pop", "Dark"),
+        ("Lovely", "Billie Eilish", "Indie", "Sad"),
+        ("Sempurna", "Andra and The Backbone", "Rock", "Romantic"),
+    ]
+    return [Song(*row, song_id=i) for i, row in enumerate(data, 1)]
+
+
+class PrefixTrieTest(unittest.TestCase):
+    def test_complete_ranks_by_count_then_alpha(self):
+        trie = PrefixTrie()
+        for term in ["Tulus", "Tulus", "Tulang Rusuk", "Taylor Swift", "tulus"]:
+            trie.insert(term)
+        self.assertEqual(trie.complete("tu"), ["Tulus", "Tulang Rusuk"])
+        self.assertEqual(trie.complete("T", k=1), ["Tulus"])
+        self.assertEqual(trie.complete("x"), [])
+        self.assertEqual(len(trie), 3)
+
+    def test_remove_counts_down(self):
+        trie = PrefixTrie()
+        trie.insert("Tulus")
+        trie.insert("Tulus")
+        self.assertTrue(trie.remove("tulus"))
+        self.assertEqual(trie.complete("tul"), ["Tulus"])
+        self.assertTrue(trie.remove("Tulus"))
+        self.assertEqual(trie.complete("tul"), [])
+        self.assertFalse(trie.remove("Tulus"))
+
+    def test_insert_many_equals_insert(self):
+        terms = [s.judul for s in _songs()] + [s.artis for s in _songs()]
+        a, b = PrefixTrie(), PrefixTrie()
+        for t in terms:
+            a.insert(t)
+        b.insert_many(terms)
+        for prefix in ("", "b", "t", "mo", "s", "hati"):
+            self.assertEqual(a.complete(prefix), b.complete(prefix), prefix)
+
+
+if __name__ == "__main__":
+    unittest.main()